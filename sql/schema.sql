@@ -16,6 +16,21 @@ CREATE INDEX idx_outbox_due
   ON outbox_event (next_run_at ASC)
   WHERE status IN ('pending','retry');
 
+-- POWIADOMIENIE WORKERÓW O NOWYCH ZDARZENIACH (LISTEN outbox_new_event)
+-- Jedno NOTIFY na instrukcję; PostgreSQL dostarcza je dopiero po COMMIT producenta
+CREATE OR REPLACE FUNCTION notify_outbox_new_event()
+RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('outbox_new_event', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_outbox_event_notify
+  AFTER INSERT ON outbox_event
+  FOR EACH STATEMENT
+  EXECUTE FUNCTION notify_outbox_new_event();
+
 -- TABELA ARCHIWALNA
 CREATE TABLE outbox_event_archive (
     id              BIGINT PRIMARY KEY,
@@ -2,11 +2,15 @@
 """Command-line interface for outbox worker."""
 
 import argparse
+import functools
 import sys
-from typing import Callable, Optional
+import threading
+import time
+from typing import Callable, Optional, Tuple
 
 from loguru import logger
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
 from dispatchbox.config import (
     DEFAULT_BATCH_SIZE,
@@ -22,7 +26,36 @@ from dispatchbox.supervisor import start_processes
 
 
 def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
+    """
+    Parse command-line arguments.
+
+    The result is cached per sys.argv, so repeated calls return the same
+    Namespace without building and running the parser again.
+    """
+    return _parse_argv(tuple(sys.argv[1:]))
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_argv(argv: Tuple[str, ...]) -> argparse.Namespace:
+    """
+    Parse the given arguments with the module-level parser.
+
+    Args:
+        argv: Command-line arguments without the program name
+
+    Returns:
+        Parsed arguments
+    """
+    return _PARSER.parse_args(list(argv))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        Parser with every supported option registered
+    """
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
         description="Outbox worker (multi-process, SKIP LOCKED). "
         "Fetches pending/retry events from Postgres and processes them in parallel threads."
@@ -49,7 +82,12 @@ def parse_args() -> argparse.Namespace:
         "--poll-interval",
         type=float,
         default=DEFAULT_POLL_INTERVAL,
-        help=f"Seconds to sleep when no work (default: {DEFAULT_POLL_INTERVAL})",
+        help=f"Max seconds to wait for new events when idle (default: {DEFAULT_POLL_INTERVAL})",
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="Pin each worker process to its own CPU (Linux only)",
     )
     parser.add_argument(
         "--log-level",
@@ -78,16 +116,16 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable HTTP server for health checks and metrics",
     )
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import; parse_args() and help() share it
+_PARSER: argparse.ArgumentParser = _build_parser()
 
 
 def help() -> None:
     """Display help message for the user."""
-    parser: argparse.ArgumentParser = argparse.ArgumentParser(
-        description="Outbox worker (multi-process, SKIP LOCKED). "
-        "Fetches pending/retry events from Postgres and processes them in parallel threads."
-    )
-    parser.print_help()
+    _PARSER.print_help()
 
 
 def setup_logging(log_level: str) -> None:
@@ -114,31 +152,76 @@ def setup_logging(log_level: str) -> None:
     logger.configure(extra={"worker": "main"})
 
 
-def create_db_check_function(dsn: str) -> Callable[[], bool]:
+def create_db_check_function(dsn: str, cache_ttl: float = 0.5) -> Callable[[], bool]:
     """
     Create database check function for HTTP server.
 
+    The check borrows a connection from a small pool that is created on first
+    use and kept warm, so a readiness probe costs one SELECT 1 instead of a
+    full connection handshake. A connection that fails the check is discarded
+    and replaced on the next probe.
+
+    A result is reused for cache_ttl seconds, so frequent probes from several
+    sources do not each reach the database.
+
     Args:
         dsn: PostgreSQL connection string
+        cache_ttl: Seconds to reuse the last result (0 disables caching)
 
     Returns:
         Function that checks database connectivity
     """
-
-    def check_db() -> bool:
+    pool: Optional[ThreadedConnectionPool] = None
+    pool_lock = threading.Lock()
+    checked_at: float = float("-inf")
+    last_result: bool = False
+
+    def get_pool() -> ThreadedConnectionPool:
+        nonlocal pool
+        with pool_lock:
+            if pool is None:
+                pool = ThreadedConnectionPool(
+                    1,
+                    2,
+                    dsn,
+                    connect_timeout=2,
+                    options="-c statement_timeout=2000",
+                )
+            return pool
+
+    def probe_db() -> bool:
         try:
-            repo = OutboxRepository(dsn, connect_timeout=2, query_timeout=2)
-            is_connected = repo.is_connected()
-            repo.close()
-            return is_connected
+            db_pool = get_pool()
+            conn = db_pool.getconn()
         # Catching psycopg2.Error covers all database-related errors:
         # - OperationalError: connection failures, timeouts
-        # - InterfaceError: connection already closed, invalid state
+        # - PoolError: no connection available
         # - Other psycopg2 errors: all database operation failures
         # Returns False for any database error, maintaining consistent security posture
         except (psycopg2.Error, ValueError):
             return False
 
+        broken = False
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(OutboxRepository.CHECK_CONNECTION_SQL)
+            return True
+        except psycopg2.Error:
+            broken = True
+            return False
+        finally:
+            db_pool.putconn(conn, close=broken)
+
+    def check_db() -> bool:
+        nonlocal checked_at, last_result
+        now = time.monotonic()
+        if now - checked_at < cache_ttl:
+            return last_result
+        last_result = probe_db()
+        checked_at = now
+        return last_result
+
     return check_db
 
 
@@ -146,20 +229,31 @@ def create_repository_factory(dsn: str) -> Callable[[], OutboxRepository]:
     """
     Create repository factory function for DLQ endpoints.
 
+    The repository (and its connection) is created on first use and shared by
+    later requests, so DLQ requests do not pay for a new connection each time.
+    The HTTP server handles one request at a time. A failed query (e.g. the
+    query timeout) rolls the transaction back before the error is raised, and
+    a lost connection is re-established on the next query.
+
     Args:
         dsn: PostgreSQL connection string
 
     Returns:
-        Factory function that returns a new repository instance
+        Factory function that returns the shared repository instance
     """
+    repository: Optional[OutboxRepository] = None
 
     def get_repository() -> OutboxRepository:
-        """Factory function that returns a new repository instance for each request."""
-        return OutboxRepository(
-            dsn,
-            connect_timeout=2,
-            query_timeout=5,
-        )
+        """Factory function that returns the shared repository, connecting on first use."""
+        nonlocal repository
+        if repository is None:
+            # Only cache a successful connection; a failed one is retried by the next request
+            repository = OutboxRepository(
+                dsn,
+                connect_timeout=2,
+                query_timeout=5,
+            )
+        return repository
 
     return get_repository
 
@@ -217,6 +311,7 @@ def main() -> None:
             args.processes,
             args.batch_size,
             args.poll_interval,
+            pin_cpus=args.pin_cpus,
         )
     finally:
         if http_server:
@@ -7,6 +7,7 @@ DEFAULT_POLL_INTERVAL: float = 1.0
 DEFAULT_MAX_PARALLEL: int = 10
 DEFAULT_RETRY_BACKOFF_SECONDS: int = 30
 DEFAULT_MAX_ATTEMPTS: int = 5
+DEFAULT_CLAIM_TIMEOUT_SECONDS: int = 300
 DEFAULT_NUM_PROCESSES: int = 1
 DEFAULT_LOG_LEVEL: str = "INFO"
 DEFAULT_HTTP_HOST: str = "0.0.0.0"
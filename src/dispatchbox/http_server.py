@@ -4,12 +4,30 @@
 import json
 import threading
 from typing import Any, Callable, List, Optional
+from wsgiref.simple_server import WSGIServer
 
-from bottle import Bottle, HTTPError, request, response, run
+from bottle import Bottle, HTTPError, WSGIRefServer, request, response, run
 from loguru import logger
 import psycopg2
 
 
+class _StoppableWSGIServer(WSGIServer):
+    """wsgiref server whose serve_forever() notices shutdown() within POLL_INTERVAL seconds."""
+
+    # socketserver's default of 0.5 s would make every stop() wait up to half a second
+    POLL_INTERVAL = 0.05
+
+    # Set when serving starts; HttpServer.start() supplies it through a per-call subclass
+    ready_event: Optional[threading.Event] = None
+
+    def serve_forever(self, poll_interval: float = POLL_INTERVAL) -> None:
+        # Bottle calls this right after binding, listening and recording the adapter's srv,
+        # so bound_port is already valid when the event fires
+        if self.ready_event is not None:
+            self.ready_event.set()
+        super().serve_forever(poll_interval)
+
+
 class HttpServer:
     """HTTP server for health checks, metrics, and API endpoints."""
 
@@ -40,6 +58,7 @@ class HttpServer:
         self._setup_routes()
         self._setup_error_handlers()
         self._server_thread: Optional[threading.Thread] = None
+        self._server_adapter: Optional[WSGIRefServer] = None
         self._shutdown_event = threading.Event()
 
     def _setup_routes(self) -> None:
@@ -143,23 +162,31 @@ class HttpServer:
             response.status = 500
             return f"# Error generating metrics: {e}\n"
 
-    def start(self, daemon: bool = True) -> None:
+    def start(self, daemon: bool = True, ready_event: Optional[threading.Event] = None) -> None:
         """
         Start HTTP server in background thread.
 
         Args:
             daemon: If True, thread will be daemon (dies with main thread)
+            ready_event: Optional event set once the server socket is listening
+                (never set if binding fails)
         """
         if self._server_thread and self._server_thread.is_alive():
             logger.warning("HTTP server already running")
             return
 
+        # Keep the adapter so bound_port can report the port it actually bound
+        server_class = _StoppableWSGIServer
+        if ready_event is not None:
+            server_class = type("_ReadyWSGIServer", (_StoppableWSGIServer,), {"ready_event": ready_event})
+        self._server_adapter = WSGIRefServer(host=self.host, port=self.port, server_class=server_class)
+        server_adapter = self._server_adapter
+
         def _run_server() -> None:
             try:
                 run(
                     self.app,
-                    host=self.host,
-                    port=self.port,
+                    server=server_adapter,
                     quiet=True,  # Disable Bottle's default logging
                 )
             # Catching specific exceptions for server stability:
@@ -173,12 +200,39 @@ class HttpServer:
         self._server_thread.start()
         logger.info("HTTP server started on {}:{} (endpoints: /health, /ready, /metrics)", self.host, self.port)
 
-    def stop(self) -> None:
-        """Stop HTTP server."""
-        # Bottle doesn't have a clean shutdown, so we just mark it
-        # The thread will die when main process exits (if daemon=True)
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop HTTP server and wait for its thread to exit.
+
+        Bottle has no shutdown hook, so this stops the underlying wsgiref
+        server directly: serve_forever() returns, the listening socket is
+        closed and the server thread is joined. Callers need no extra sleep.
+
+        Args:
+            timeout: Maximum seconds to wait for the server thread
+        """
         self._shutdown_event.set()
-        logger.info("HTTP server shutdown requested")
+        wsgi_server = getattr(self._server_adapter, "srv", None)
+        if wsgi_server is not None and self.is_running():
+            wsgi_server.shutdown()
+            wsgi_server.server_close()
+        if self._server_thread is not None:
+            self._server_thread.join(timeout)
+        logger.info("HTTP server stopped")
+
+    @property
+    def bound_port(self) -> Optional[int]:
+        """
+        Port the server is listening on.
+
+        With port=0 this is the port the OS assigned, so callers need not
+        pick a free port up front.
+
+        Returns:
+            Listening port, or None until the server socket is bound
+        """
+        wsgi_server = getattr(self._server_adapter, "srv", None)
+        return wsgi_server.server_port if wsgi_server is not None else None
 
     def is_running(self) -> bool:
         """
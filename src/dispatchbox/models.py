@@ -3,10 +3,15 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional
+import sys
+from typing import Any, Dict, Literal, Optional, Sequence
 
+# One event is created per fetched row; __slots__ drops the per-instance
+# __dict__. dataclass(slots=True) needs Python 3.10+.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class OutboxEvent:
     """Data class representing an outbox event from the database."""
 
@@ -47,6 +52,23 @@ class OutboxEvent:
             created_at=data.get("created_at"),
         )
 
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "OutboxEvent":
+        """
+        Create OutboxEvent from a plain (tuple) database row.
+
+        The row must list the columns in field order (id, aggregate_type,
+        aggregate_id, event_type, payload, status, attempts, next_run_at,
+        created_at), as the repository's SELECT statements do.
+
+        Args:
+            row: Sequence of column values
+
+        Returns:
+            OutboxEvent instance
+        """
+        return cls(*row)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert OutboxEvent to dictionary with JSON-serializable values.
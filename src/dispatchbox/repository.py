@@ -1,30 +1,100 @@
 #!/usr/bin/env python3
 """Repository for outbox events database operations."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Any, List, Optional
+import io
+import itertools
+import json
+import select
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 from loguru import logger
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import ISOLATION_LEVEL_READ_COMMITTED, make_dsn, parse_dsn
 
-from dispatchbox.config import DEFAULT_MAX_ATTEMPTS
+from dispatchbox.config import DEFAULT_CLAIM_TIMEOUT_SECONDS, DEFAULT_MAX_ATTEMPTS
 from dispatchbox.models import OutboxEvent
 
+T = TypeVar("T")
+
+
+def _dead_filter_variants(base_sql: str, suffix: str = "") -> Dict[Tuple[bool, bool], str]:
+    """
+    Build the dead-event query for each combination of optional filters.
+
+    Args:
+        base_sql: Query selecting dead events
+        suffix: SQL appended after the filters (e.g. ORDER BY / LIMIT)
+
+    Returns:
+        Mapping of (filter by aggregate_type, filter by event_type) to SQL
+    """
+    return {
+        (False, False): base_sql + suffix,
+        (True, False): base_sql + " AND aggregate_type = %s" + suffix,
+        (False, True): base_sql + " AND event_type = %s" + suffix,
+        (True, True): base_sql + " AND aggregate_type = %s AND event_type = %s" + suffix,
+    }
+
 
 class OutboxRepository:
     """Repository for managing outbox events in the database."""
 
     # SQL queries as class constants
+    # Event queries select the columns in OutboxEvent field order and use plain
+    # tuple cursors; rows are turned into events with OutboxEvent.from_row().
+    # Fetching claims the rows in the same statement: next_run_at is pushed
+    # out by the claim timeout, so once the fetch commits (and the row locks
+    # are released) other workers still skip them. RETURNING reports the
+    # original next_run_at; its rows come back in no defined order, so the
+    # claimed rows are sorted by (next_run_at, id) in the outer SELECT.
     FETCH_PENDING_SQL = """
+        WITH due AS (
+            SELECT id, next_run_at
+            FROM outbox_event
+            WHERE status IN ('pending','retry')
+              AND next_run_at <= now()
+            ORDER BY next_run_at ASC
+            FOR UPDATE SKIP LOCKED
+            LIMIT %s
+        ),
+        claimed AS (
+            UPDATE outbox_event e
+            SET next_run_at = now() + make_interval(secs => %s)
+            FROM due
+            WHERE e.id = due.id
+            RETURNING e.id, e.aggregate_type, e.aggregate_id, e.event_type, e.payload,
+                      e.status, e.attempts, due.next_run_at, e.created_at
+        )
         SELECT id, aggregate_type, aggregate_id, event_type, payload,
                status, attempts, next_run_at, created_at
-        FROM outbox_event
-        WHERE status IN ('pending','retry')
-          AND next_run_at <= now()
-        ORDER BY next_run_at ASC
-        FOR UPDATE SKIP LOCKED
-        LIMIT %s;
+        FROM claimed
+        ORDER BY next_run_at, id;
+    """
+
+    FETCH_PENDING_EXCLUDING_SQL = """
+        WITH due AS (
+            SELECT id, next_run_at
+            FROM outbox_event
+            WHERE status IN ('pending','retry')
+              AND next_run_at <= now()
+              AND id <> ALL(%s)
+            ORDER BY next_run_at ASC
+            FOR UPDATE SKIP LOCKED
+            LIMIT %s
+        ),
+        claimed AS (
+            UPDATE outbox_event e
+            SET next_run_at = now() + make_interval(secs => %s)
+            FROM due
+            WHERE e.id = due.id
+            RETURNING e.id, e.aggregate_type, e.aggregate_id, e.event_type, e.payload,
+                      e.status, e.attempts, due.next_run_at, e.created_at
+        )
+        SELECT id, aggregate_type, aggregate_id, event_type, payload,
+               status, attempts, next_run_at, created_at
+        FROM claimed
+        ORDER BY next_run_at, id;
     """
 
     MARK_SUCCESS_SQL = """
@@ -43,16 +113,65 @@ class OutboxRepository:
         attempts = attempts + 1,
         next_run_at = CASE
             WHEN attempts + 1 >= %s THEN next_run_at
-            ELSE %s
+            ELSE now() + make_interval(secs => %s)
         END
         WHERE id = %s;
     """
 
+    MARK_SUCCESS_MANY_SQL = """
+        UPDATE outbox_event
+        SET status = 'done',
+            attempts = attempts + 1
+        WHERE id = ANY(%s);
+    """
+
+    MARK_RETRY_MANY_SQL = """
+        UPDATE outbox_event
+        SET status = CASE
+            WHEN attempts + 1 >= %s THEN 'dead'
+            ELSE 'retry'
+        END,
+        attempts = attempts + 1,
+        next_run_at = CASE
+            WHEN attempts + 1 >= %s THEN next_run_at
+            ELSE now() + make_interval(secs => %s)
+        END
+        WHERE id = ANY(%s)
+        RETURNING id, status;
+    """
+
+    # Both batched updates in one execute() for mark_many(); retry last so its
+    # RETURNING rows are the ones fetched
+    MARK_MANY_SQL = f"{MARK_SUCCESS_MANY_SQL.strip()}\n{MARK_RETRY_MANY_SQL.strip()}"
+
     CHECK_STATUS_SQL = "SELECT status FROM outbox_event WHERE id = %s;"
 
     CHECK_CONNECTION_SQL = "SELECT 1;"
 
-    SET_TIMEOUT_SQL = "SET statement_timeout = %s;"
+    # Channel notified by the outbox_event insert trigger (see sql/schema.sql)
+    NOTIFY_CHANNEL = "outbox_new_event"
+
+    LISTEN_SQL = f"LISTEN {NOTIFY_CHANNEL};"
+
+    # Hot-path statements that prepare_statements() turns into server-side prepared statements
+    PREPARED_STATEMENTS: Dict[str, str] = {
+        "fetch_pending": FETCH_PENDING_SQL,
+        "fetch_pending_excluding": FETCH_PENDING_EXCLUDING_SQL,
+        "mark_success_many": MARK_SUCCESS_MANY_SQL,
+        "mark_retry_many": MARK_RETRY_MANY_SQL,
+    }
+
+    PREPARED_NAME_PREFIX = "dispatchbox_"
+
+    # TCP keepalives let the kernel detect a dead server or network path, so a
+    # lost connection fails fast instead of hanging until statement_timeout.
+    # Values given in the DSN take precedence.
+    TCP_KEEPALIVES: Dict[str, int] = {
+        "keepalives": 1,
+        "keepalives_idle": 30,
+        "keepalives_interval": 10,
+        "keepalives_count": 3,
+    }
 
     FETCH_DEAD_EVENTS_BASE_SQL = """
         SELECT id, aggregate_type, aggregate_id, event_type, payload,
@@ -69,6 +188,10 @@ class OutboxRepository:
         WHERE status = 'dead'
     """
 
+    # All four filter combinations, built once so each call reuses the same statement text
+    FETCH_DEAD_EVENTS_SQL = _dead_filter_variants(FETCH_DEAD_EVENTS_BASE_SQL, FETCH_DEAD_EVENTS_ORDER_LIMIT_SQL)
+    COUNT_DEAD_EVENTS_SQL = _dead_filter_variants(COUNT_DEAD_EVENTS_BASE_SQL)
+
     FETCH_DEAD_EVENT_BY_ID_SQL = """
         SELECT id, aggregate_type, aggregate_id, event_type, payload,
                status, attempts, next_run_at, created_at
@@ -92,6 +215,19 @@ class OutboxRepository:
         WHERE id = ANY(%s) AND status = 'dead';
     """
 
+    COPY_EVENTS_SQL = """
+        COPY outbox_event (aggregate_type, aggregate_id, event_type, payload, status, attempts, next_run_at)
+        FROM STDIN
+    """
+
+    # How long count_dead_events() reuses a count; absorbs dashboard refreshes
+    DEAD_COUNT_CACHE_TTL = 1.0
+    # Filters come from API query strings, so bound the number of cached counts
+    DEAD_COUNT_CACHE_MAX_ENTRIES = 256
+
+    # Characters that COPY text format requires to be backslash-escaped
+    _COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
     def _validate_dsn(self, dsn: str) -> None:
         """
         Validate DSN is not empty.
@@ -111,6 +247,7 @@ class OutboxRepository:
         connect_timeout: int,
         query_timeout: int,
         max_attempts: int,
+        claim_timeout_seconds: int = DEFAULT_CLAIM_TIMEOUT_SECONDS,
     ) -> None:
         """
         Validate all initialization parameters.
@@ -120,6 +257,7 @@ class OutboxRepository:
             connect_timeout: Connection timeout in seconds
             query_timeout: Query timeout in seconds
             max_attempts: Maximum number of retry attempts
+            claim_timeout_seconds: Seconds a fetched event stays claimed
 
         Raises:
             ValueError: If any parameter is invalid
@@ -132,22 +270,26 @@ class OutboxRepository:
             raise ValueError("query_timeout must be non-negative")
         if max_attempts < 1:
             raise ValueError("max_attempts must be at least 1")
+        if claim_timeout_seconds < 1:
+            raise ValueError("claim_timeout_seconds must be at least 1")
 
     def _add_connect_timeout_to_dsn(self, dsn: str, timeout: int) -> str:
         """
         Add connect_timeout to DSN if not present.
 
+        The DSN is parsed by libpq, so key/value and URI forms are handled
+        alike and quoted values are kept intact.
+
         Args:
-            dsn: PostgreSQL connection string
+            dsn: PostgreSQL connection string (key/value or URI)
             timeout: Connection timeout in seconds
 
         Returns:
             DSN with connect_timeout parameter added if needed
         """
-        if "connect_timeout" not in dsn:
-            separator = "&" if "?" in dsn else " "
-            return f"{dsn}{separator}connect_timeout={timeout}"
-        return dsn
+        if "connect_timeout" in parse_dsn(dsn):
+            return dsn
+        return make_dsn(dsn, connect_timeout=timeout)
 
     def _establish_connection(self, dsn_with_timeout: str) -> Any:
         """
@@ -163,8 +305,13 @@ class OutboxRepository:
             psycopg2.OperationalError: If connection cannot be established
         """
         try:
-            conn = psycopg2.connect(dsn_with_timeout)
-            conn.autocommit = False
+            configured = parse_dsn(dsn_with_timeout)
+            keepalives = {key: value for key, value in self.TCP_KEEPALIVES.items() if key not in configured}
+            conn = psycopg2.connect(dsn_with_timeout, options=self._session_options(), **keepalives)
+            # SKIP LOCKED already keeps workers on disjoint rows; pin READ COMMITTED so a
+            # stricter server default cannot add serialization failures. psycopg2 puts the
+            # level in each BEGIN, so this costs no round trip.
+            conn.set_session(isolation_level=ISOLATION_LEVEL_READ_COMMITTED, autocommit=False)
             return conn
         except psycopg2.OperationalError as e:
             logger.error("Failed to connect to database: {}", e)
@@ -177,6 +324,7 @@ class OutboxRepository:
         connect_timeout: int = 10,
         query_timeout: int = 30,
         max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        claim_timeout_seconds: int = DEFAULT_CLAIM_TIMEOUT_SECONDS,
     ) -> None:
         """
         Initialize OutboxRepository.
@@ -188,31 +336,48 @@ class OutboxRepository:
             query_timeout: Query timeout in seconds (default: 30)
             max_attempts: Maximum number of retry attempts before marking event
                 as dead (default: 5)
+            claim_timeout_seconds: How long an event returned by fetch_pending()
+                is hidden from other workers; if it is not marked by then (e.g. the
+                worker died) it becomes due again (default: 300)
 
         Raises:
             ValueError: If DSN is empty or invalid
             psycopg2.OperationalError: If connection cannot be established
         """
         self._validate_dsn(dsn)
-        self._validate_parameters(retry_backoff_seconds, connect_timeout, query_timeout, max_attempts)
+        self._validate_parameters(
+            retry_backoff_seconds, connect_timeout, query_timeout, max_attempts, claim_timeout_seconds
+        )
 
         self.dsn: str = dsn.strip()
         self.retry_backoff: int = retry_backoff_seconds
         self.query_timeout: int = query_timeout
         self.max_attempts: int = max_attempts
+        self.claim_timeout: int = claim_timeout_seconds
+        self._listening: bool = False
+        # name -> "EXECUTE ..." statement, filled by prepare_statements()
+        self._execute_sql: Dict[str, str] = {}
+        # (aggregate_type, event_type) -> (monotonic time, count), see count_dead_events()
+        self._dead_count_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[float, int]] = {}
+        # Mark updates issued since the last commit, re-issued if their transaction is lost
+        self._pending_writes: List[Callable[[], None]] = []
 
         dsn_with_timeout = self._add_connect_timeout_to_dsn(self.dsn, connect_timeout)
         self.conn: Any = self._establish_connection(dsn_with_timeout)
 
-    def _set_query_timeout(self, cur: Any) -> None:
+    def _session_options(self) -> str:
         """
-        Set query timeout for current cursor.
+        Build the libpq options that apply query_timeout to the whole session.
 
-        Args:
-            cur: Database cursor
+        statement_timeout is sent once at connection startup instead of with a
+        SET before every query. Options already present in the DSN are kept.
+
+        Returns:
+            Value for the libpq "options" connection parameter
         """
         timeout_ms = self.query_timeout * 1000  # Convert to milliseconds
-        cur.execute(self.SET_TIMEOUT_SQL, (timeout_ms,))
+        existing = parse_dsn(self.dsn).get("options", "")
+        return f"{existing} -c statement_timeout={timeout_ms}".strip()
 
     def is_connected(self) -> bool:
         """
@@ -249,31 +414,198 @@ class OutboxRepository:
             # Reconnect with same timeout settings (default 10s for reconnect)
             dsn_with_timeout = self._add_connect_timeout_to_dsn(self.dsn, 10)
             self.conn = self._establish_connection(dsn_with_timeout)
+            if self._listening:
+                self.listen()
+            if self._execute_sql:
+                # Prepared statements belong to the old session
+                self.prepare_statements()
             logger.info("Database connection restored")
         except psycopg2.OperationalError as e:
             logger.error("Failed to reconnect to database: {}", e)
             raise
 
-    def _check_connection(self) -> None:
+    def _run(self, operation: Callable[[], T]) -> T:
         """
-        Check if database connection is alive and reconnect if needed.
+        Run a database operation, reconnecting and retrying once if the connection was lost.
+
+        A dead connection is noticed by the operation itself rather than by a
+        "SELECT 1" probe before every call. Mark updates not yet committed went
+        down with the old session, so they are re-issued on the new one before
+        the operation is retried. Errors on a live connection (e.g. a statement
+        timeout) abort the open transaction: it is rolled back, the pending mark
+        updates are re-issued and the error is re-raised.
+
+        Args:
+            operation: Callable issuing the queries; it is run again after a reconnect
+
+        Returns:
+            Result of the operation
 
         Raises:
-            psycopg2.OperationalError: If connection cannot be restored
+            psycopg2.OperationalError: If the connection cannot be restored
+            psycopg2.Error: If the operation fails on a live connection
         """
         try:
-            # Try to execute a simple query to check connection
-            with self.conn.cursor() as cur:
-                cur.execute(self.CHECK_CONNECTION_SQL)
-        except (psycopg2.OperationalError, psycopg2.InterfaceError):
-            self._reconnect()
+            return operation()
+        except psycopg2.Error:
+            # Reconnecting commits LISTEN and PREPARE, so keep the writes to redo aside
+            pending = list(self._pending_writes)
+            if self.conn.closed:
+                self._reconnect()
+                self._restore_writes(pending)
+                return operation()
+            self.conn.rollback()
+            self._restore_writes(pending)
+            raise
+
+    def _run_write(self, operation: Callable[[], None]) -> None:
+        """
+        Run a mark update that stays uncommitted until the next commit.
+
+        Args:
+            operation: Callable issuing the update
+        """
+        self._run(operation)
+        self._pending_writes.append(operation)
+
+    def _restore_writes(self, writes: List[Callable[[], None]]) -> None:
+        """
+        Re-issue uncommitted mark updates after their transaction was lost.
+
+        Args:
+            writes: Updates recorded by _run_write() since the last commit
+        """
+        self._pending_writes = writes
+        try:
+            for write in writes:
+                write()
+        except psycopg2.Error:
+            # Still pending, so the next operation tries again
+            if not self.conn.closed:
+                self.conn.rollback()
+            raise
+
+    def _commit(self) -> None:
+        """Commit the open transaction, including any pending mark updates."""
+        self.conn.commit()
+        self._pending_writes = []
+
+    def listen(self) -> None:
+        """
+        Subscribe the connection to new event notifications.
+
+        After calling this, wait_for_event() returns as soon as a producer
+        inserts into outbox_event instead of waiting for the full timeout.
+        The subscription is restored automatically after a reconnect.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(self.LISTEN_SQL)
+        self._commit()
+        self._listening = True
+
+    @staticmethod
+    def _numbered_params(sql: str) -> str:
+        """
+        Convert psycopg2 %s placeholders to PostgreSQL $1, $2, ... parameters.
+
+        Args:
+            sql: SQL text with %s placeholders
+
+        Returns:
+            SQL text usable in a PREPARE statement
+        """
+        counter = itertools.count(1)
+        parts = sql.strip().split("%s")
+        return "".join(part if i == 0 else f"${next(counter)}{part}" for i, part in enumerate(parts))
+
+    def prepare_statements(self) -> None:
+        """
+        Prepare the hot-path statements once for this session.
+
+        Afterwards fetch_pending(), mark_success_many() and mark_retry_many()
+        run them with EXECUTE, so PostgreSQL skips parsing and planning on
+        every call. The statements are prepared again after a reconnect.
+        """
+        execute_sql: Dict[str, str] = {}
+        with self.conn.cursor() as cur:
+            for name, sql in self.PREPARED_STATEMENTS.items():
+                statement = f"{self.PREPARED_NAME_PREFIX}{name}"
+                prepared = self._numbered_params(sql)
+                cur.execute(f"PREPARE {statement} AS {prepared}")
+                placeholders = ", ".join(["%s"] * sql.count("%s"))
+                execute_sql[name] = f"EXECUTE {statement}({placeholders});"
+        execute_sql["mark_many"] = f"{execute_sql['mark_success_many']}\n{execute_sql['mark_retry_many']}"
+        self._commit()
+        self._execute_sql = execute_sql
+
+    def _hot_sql(self, name: str) -> str:
+        """
+        Return the SQL to run one of PREPARED_STATEMENTS.
+
+        Args:
+            name: Key in PREPARED_STATEMENTS
+
+        Returns:
+            The EXECUTE statement once prepared, otherwise the plain SQL
+        """
+        return self._execute_sql.get(name) or self.PREPARED_STATEMENTS[name]
+
+    def _execute_hot(self, cur: Any, name: str, params: Tuple[Any, ...]) -> None:
+        """
+        Run one of PREPARED_STATEMENTS, via EXECUTE once it has been prepared.
+
+        Args:
+            cur: Database cursor
+            name: Key in PREPARED_STATEMENTS
+            params: Query parameters
+        """
+        cur.execute(self._hot_sql(name), params)
+
+    def wait_for_event(self, timeout: float, wakeup_fd: Optional[int] = None) -> bool:
+        """
+        Block until a new event notification arrives or the timeout expires.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+            wakeup_fd: Optional file descriptor (e.g. a signal wakeup pipe) that
+                ends the wait early when it becomes readable
 
-    def fetch_pending(self, batch_size: int) -> List[OutboxEvent]:
+        Returns:
+            True if at least one notification was received, False on timeout,
+            wakeup or a lost connection
+        """
+        if not self.conn.notifies:
+            try:
+                fds: List[Any] = [self.conn] if wakeup_fd is None else [self.conn, wakeup_fd]
+                ready, _, _ = select.select(fds, [], [], timeout)
+                if self.conn not in ready:
+                    return False
+                self.conn.poll()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                # A dropped connection shows up as readable; close it so the next
+                # operation reconnects through _run() instead of failing the worker
+                logger.warning("Database connection lost while waiting for events: {}", e)
+                try:
+                    self.conn.close()
+                except (psycopg2.InterfaceError, psycopg2.OperationalError):
+                    pass
+                return False
+
+        notified = bool(self.conn.notifies)
+        self.conn.notifies.clear()
+        return notified
+
+    def fetch_pending(self, batch_size: int, exclude_ids: Optional[List[int]] = None) -> List[OutboxEvent]:
         """
-        Fetch a batch of pending/retry events from the database.
+        Fetch and claim a batch of due pending/retry events.
+
+        The events are claimed for claim_timeout_seconds in the same statement,
+        so other workers do not fetch them while they are being processed.
 
         Args:
             batch_size: Maximum number of events to fetch
+            exclude_ids: IDs of events already being processed by the caller;
+                they are still pending in the database and must not be fetched twice
 
         Returns:
             List of OutboxEvent instances
@@ -281,18 +613,30 @@ class OutboxRepository:
         if batch_size < 1:
             raise ValueError("batch_size must be at least 1")
 
-        self._check_connection()
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            self._set_query_timeout(cur)
-            cur.execute(self.FETCH_PENDING_SQL, (batch_size,))
-            rows = cur.fetchall()
-            self.conn.commit()
-            return [OutboxEvent.from_dict(dict(row)) for row in rows]
+        def _fetch() -> List[OutboxEvent]:
+            # psycopg2 appends every NOTIFY it reads to conn.notifies; the claim below
+            # covers the ones received so far, and a busy worker never drains them in
+            # wait_for_event()
+            self.conn.notifies.clear()
+            with self.conn.cursor() as cur:
+                if exclude_ids:
+                    self._execute_hot(
+                        cur, "fetch_pending_excluding", (list(exclude_ids), batch_size, self.claim_timeout)
+                    )
+                else:
+                    self._execute_hot(cur, "fetch_pending", (batch_size, self.claim_timeout))
+                rows = cur.fetchall()
+                self._commit()
+                return [OutboxEvent.from_row(row) for row in rows]
+
+        return self._run(_fetch)
 
     def mark_success(self, event_id: int) -> None:
         """
         Mark an event as successfully processed.
 
+        The update is not committed; call flush() once the batch is complete.
+
         Args:
             event_id: ID of the event to mark as successful
 
@@ -302,20 +646,11 @@ class OutboxRepository:
         if event_id is None or event_id < 1:
             raise ValueError("event_id must be a positive integer")
 
-        self._check_connection()
-        with self.conn.cursor() as cur:
-            self._set_query_timeout(cur)
-            cur.execute(self.MARK_SUCCESS_SQL, (event_id,))
-        self.conn.commit()
-
-    def _calculate_next_run_at(self) -> datetime:
-        """
-        Calculate next_run_at timestamp based on retry backoff.
+        def _update() -> None:
+            with self.conn.cursor() as cur:
+                cur.execute(self.MARK_SUCCESS_SQL, (event_id,))
 
-        Returns:
-            Datetime for next retry attempt
-        """
-        return datetime.now(timezone.utc) + timedelta(seconds=self.retry_backoff)
+        self._run_write(_update)
 
     def _log_if_dead(self, event_id: int, cur: Any) -> None:
         """
@@ -339,6 +674,8 @@ class OutboxRepository:
         Mark an event for retry with updated next_run_at timestamp.
         If max_attempts is exceeded, mark event as 'dead' instead.
 
+        The update is not committed; call flush() once the batch is complete.
+
         Args:
             event_id: ID of the event to mark for retry
 
@@ -348,18 +685,146 @@ class OutboxRepository:
         if event_id is None or event_id < 1:
             raise ValueError("event_id must be a positive integer")
 
-        self._check_connection()
-        next_run_at = self._calculate_next_run_at()
+        def _update() -> None:
+            with self.conn.cursor() as cur:
+                # next_run_at is computed server-side to stay in the database clock domain
+                cur.execute(
+                    self.MARK_RETRY_SQL,
+                    (self.max_attempts, self.max_attempts, self.retry_backoff, event_id),
+                )
+                if cur.rowcount > 0:
+                    self._log_if_dead(event_id, cur)
+
+        self._run_write(_update)
+
+    @staticmethod
+    def _validate_event_ids(event_ids: List[int]) -> None:
+        """
+        Validate a list of event IDs.
 
-        with self.conn.cursor() as cur:
-            self._set_query_timeout(cur)
-            cur.execute(
-                self.MARK_RETRY_SQL,
-                (self.max_attempts, self.max_attempts, next_run_at, event_id),
-            )
-            if cur.rowcount > 0:
-                self._log_if_dead(event_id, cur)
-        self.conn.commit()
+        Args:
+            event_ids: List of event IDs
+
+        Raises:
+            ValueError: If any event ID is invalid
+        """
+        # Two C-level scans instead of a per-element Python generator
+        if None in event_ids or min(event_ids) < 1:
+            raise ValueError("All event_ids must be positive integers")
+
+    def mark_success_many(self, event_ids: List[int]) -> None:
+        """
+        Mark several events as successfully processed in one statement.
+
+        The update is not committed; call flush() once the batch is complete.
+
+        Args:
+            event_ids: IDs of the events to mark as successful
+
+        Raises:
+            ValueError: If any event ID is invalid
+        """
+        if not event_ids:
+            return
+        self._validate_event_ids(event_ids)
+
+        def _update() -> None:
+            with self.conn.cursor() as cur:
+                self._execute_hot(cur, "mark_success_many", (list(event_ids),))
+
+        self._run_write(_update)
+
+    def mark_retry_many(self, event_ids: List[int]) -> None:
+        """
+        Mark several events for retry in one statement.
+        Events that exceed max_attempts are marked as 'dead' instead.
+
+        The update is not committed; call flush() once the batch is complete.
+
+        Args:
+            event_ids: IDs of the events to mark for retry
+
+        Raises:
+            ValueError: If any event ID is invalid
+        """
+        if not event_ids:
+            return
+        self._validate_event_ids(event_ids)
+
+        def _update() -> None:
+            with self.conn.cursor() as cur:
+                self._execute_hot(
+                    cur,
+                    "mark_retry_many",
+                    (self.max_attempts, self.max_attempts, self.retry_backoff, list(event_ids)),
+                )
+                self._log_dead(cur.fetchall())
+
+        self._run_write(_update)
+
+    def mark_many(self, success_ids: List[int], retry_ids: List[int]) -> None:
+        """
+        Mark succeeded and failed events in a single round trip.
+
+        psycopg2 has no pipeline mode, but one execute() may carry several
+        statements: the mark_success_many() and mark_retry_many() updates are
+        sent together, the retry update last so its RETURNING rows are the
+        ones fetched. With only one kind of outcome this is the matching
+        single-statement call.
+
+        The updates are not committed; call flush() once the batch is complete.
+
+        Args:
+            success_ids: IDs of the events to mark as successful
+            retry_ids: IDs of the events to mark for retry
+
+        Raises:
+            ValueError: If any event ID is invalid
+        """
+        if not retry_ids:
+            self.mark_success_many(success_ids)
+            return
+        if not success_ids:
+            self.mark_retry_many(retry_ids)
+            return
+        self._validate_event_ids(success_ids)
+        self._validate_event_ids(retry_ids)
+
+        sql = self._execute_sql.get("mark_many", self.MARK_MANY_SQL)
+        params = (
+            list(success_ids),
+            self.max_attempts,
+            self.max_attempts,
+            self.retry_backoff,
+            list(retry_ids),
+        )
+
+        def _update() -> None:
+            with self.conn.cursor() as cur:
+                cur.execute(sql, params)
+                self._log_dead(cur.fetchall())
+
+        self._run_write(_update)
+
+    def _log_dead(self, rows: List[Tuple[int, str]]) -> None:
+        """
+        Log events that a retry update moved to 'dead'.
+
+        Args:
+            rows: (id, status) rows returned by MARK_RETRY_MANY_SQL
+        """
+        # RETURNING reports the new status, so no per-event status lookup is needed
+        for event_id, status in rows:
+            if status == "dead":
+                logger.warning(
+                    "Event {} exceeded max_attempts ({}), marked as dead",
+                    event_id,
+                    self.max_attempts,
+                )
+
+    def flush(self) -> None:
+        """Commit status updates recorded by mark_success() and mark_retry()."""
+        self._run(self._commit)
 
     def close(self) -> None:
         """Close the database connection."""
@@ -389,19 +854,8 @@ class OutboxRepository:
         Returns:
             Tuple of (SQL query string, parameters list)
         """
-        sql = self.FETCH_DEAD_EVENTS_BASE_SQL
-        params: List[Any] = []
-
-        if aggregate_type:
-            sql += " AND aggregate_type = %s"
-            params.append(aggregate_type)
-
-        if event_type:
-            sql += " AND event_type = %s"
-            params.append(event_type)
-
-        sql += self.FETCH_DEAD_EVENTS_ORDER_LIMIT_SQL
-
+        sql = self.FETCH_DEAD_EVENTS_SQL[(bool(aggregate_type), bool(event_type))]
+        params: List[Any] = [value for value in (aggregate_type, event_type) if value]
         return sql, params
 
     def fetch_dead_events(
@@ -428,17 +882,17 @@ class OutboxRepository:
         if offset < 0:
             raise ValueError("offset must be non-negative")
 
-        self._check_connection()
-
         sql, params = self._build_dead_events_sql(aggregate_type, event_type)
         params.extend([limit, offset])
 
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            self._set_query_timeout(cur)
-            cur.execute(sql, tuple(params))
-            rows = cur.fetchall()
-            self.conn.commit()
-            return [OutboxEvent.from_dict(dict(row)) for row in rows]
+        def _fetch() -> List[OutboxEvent]:
+            with self.conn.cursor() as cur:
+                cur.execute(sql, tuple(params))
+                rows = cur.fetchall()
+                self._commit()
+                return [OutboxEvent.from_row(row) for row in rows]
+
+        return self._run(_fetch)
 
     def _build_count_dead_events_sql(
         self,
@@ -455,17 +909,8 @@ class OutboxRepository:
         Returns:
             Tuple of (SQL query string, parameters list)
         """
-        sql = self.COUNT_DEAD_EVENTS_BASE_SQL
-        params: List[Any] = []
-
-        if aggregate_type:
-            sql += " AND aggregate_type = %s"
-            params.append(aggregate_type)
-
-        if event_type:
-            sql += " AND event_type = %s"
-            params.append(event_type)
-
+        sql = self.COUNT_DEAD_EVENTS_SQL[(bool(aggregate_type), bool(event_type))]
+        params: List[Any] = [value for value in (aggregate_type, event_type) if value]
         return sql, params
 
     def count_dead_events(
@@ -476,6 +921,12 @@ class OutboxRepository:
         """
         Count dead events matching criteria.
 
+        COUNT(*) scans every matching row, so a count is reused for
+        DEAD_COUNT_CACHE_TTL seconds per filter combination. Expired counts
+        are dropped when a new one is stored, and at most
+        DEAD_COUNT_CACHE_MAX_ENTRIES are kept. Retrying dead events through
+        this repository drops the cached counts.
+
         Args:
             aggregate_type: Filter by aggregate type (optional)
             event_type: Filter by event type (optional)
@@ -483,16 +934,30 @@ class OutboxRepository:
         Returns:
             Number of dead events
         """
-        self._check_connection()
+        key = (aggregate_type, event_type)
+        now = time.monotonic()
+        cached = self._dead_count_cache.get(key)
+        if cached is not None and now - cached[0] < self.DEAD_COUNT_CACHE_TTL:
+            return cached[1]
 
         sql, params = self._build_count_dead_events_sql(aggregate_type, event_type)
 
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            self._set_query_timeout(cur)
-            cur.execute(sql, tuple(params) if params else None)
-            result = cur.fetchone()
-            self.conn.commit()
-            return result["count"] if result else 0
+        def _count() -> int:
+            with self.conn.cursor() as cur:
+                cur.execute(sql, tuple(params) if params else None)
+                result = cur.fetchone()
+                self._commit()
+                return result[0] if result else 0
+
+        count = self._run(_count)
+        cache = self._dead_count_cache
+        # Drop expired counts so one-off filters do not stay cached for the repository's lifetime
+        for stale_key in [k for k, (cached_at, _) in cache.items() if now - cached_at >= self.DEAD_COUNT_CACHE_TTL]:
+            del cache[stale_key]
+        if len(cache) >= self.DEAD_COUNT_CACHE_MAX_ENTRIES:
+            cache.clear()
+        cache[key] = (now, count)
+        return count
 
     def get_dead_event(self, event_id: int) -> Optional[OutboxEvent]:
         """
@@ -507,15 +972,16 @@ class OutboxRepository:
         if event_id is None or event_id < 1:
             raise ValueError("event_id must be a positive integer")
 
-        self._check_connection()
-        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
-            self._set_query_timeout(cur)
-            cur.execute(self.FETCH_DEAD_EVENT_BY_ID_SQL, (event_id,))
-            row = cur.fetchone()
-            self.conn.commit()
-            if row:
-                return OutboxEvent.from_dict(dict(row))
-            return None
+        def _fetch() -> Optional[OutboxEvent]:
+            with self.conn.cursor() as cur:
+                cur.execute(self.FETCH_DEAD_EVENT_BY_ID_SQL, (event_id,))
+                row = cur.fetchone()
+                self._commit()
+                if row:
+                    return OutboxEvent.from_row(row)
+                return None
+
+        return self._run(_fetch)
 
     def retry_dead_event(self, event_id: int) -> bool:
         """
@@ -533,12 +999,14 @@ class OutboxRepository:
         if event_id is None or event_id < 1:
             raise ValueError("event_id must be a positive integer")
 
-        self._check_connection()
-        with self.conn.cursor() as cur:
-            self._set_query_timeout(cur)
-            cur.execute(self.RETRY_DEAD_EVENT_SQL, (event_id,))
-            self.conn.commit()
-            return cur.rowcount > 0
+        def _update() -> bool:
+            with self.conn.cursor() as cur:
+                cur.execute(self.RETRY_DEAD_EVENT_SQL, (event_id,))
+                self._commit()
+                self._dead_count_cache.clear()
+                return cur.rowcount > 0
+
+        return self._run(_update)
 
     def retry_dead_events_batch(self, event_ids: List[int]) -> int:
         """
@@ -556,14 +1024,63 @@ class OutboxRepository:
         if not event_ids:
             raise ValueError("event_ids cannot be empty")
 
-        if any(eid is None or eid < 1 for eid in event_ids):
-            raise ValueError("All event_ids must be positive integers")
+        self._validate_event_ids(event_ids)
 
-        self._check_connection()
+        def _update() -> int:
+            with self.conn.cursor() as cur:
+                # Use ANY(%s) with array parameter for better performance
+                cur.execute(self.RETRY_DEAD_EVENTS_BATCH_SQL, (event_ids,))
+                self._commit()
+                self._dead_count_cache.clear()
+                return cur.rowcount
 
-        with self.conn.cursor() as cur:
-            self._set_query_timeout(cur)
-            # Use ANY(%s) with array parameter for better performance
-            cur.execute(self.RETRY_DEAD_EVENTS_BATCH_SQL, (event_ids,))
-            self.conn.commit()
-            return cur.rowcount
+        return self._run(_update)
+
+    @classmethod
+    def _copy_line(cls, event: OutboxEvent) -> str:
+        """
+        Format an event as one line of COPY text input.
+
+        Args:
+            event: Event to insert
+
+        Returns:
+            Tab-separated line matching COPY_EVENTS_SQL's column list
+        """
+        values = (
+            event.aggregate_type,
+            event.aggregate_id,
+            event.event_type,
+            json.dumps(event.payload),
+            event.status,
+            str(event.attempts),
+            event.next_run_at.isoformat(),
+        )
+        return "\t".join(value.translate(cls._COPY_ESCAPES) for value in values) + "\n"
+
+    def insert_events(self, events: Iterable[OutboxEvent]) -> int:
+        """
+        Bulk-insert events with COPY FROM STDIN and commit.
+
+        COPY streams all rows in one command, skipping per-row statement
+        parsing; the insert trigger still sends a single NOTIFY. Event ids and
+        created_at are assigned by the database.
+
+        Args:
+            events: Events to insert
+
+        Returns:
+            Number of inserted events
+        """
+        buffer = io.StringIO("".join(self._copy_line(event) for event in events))
+        if not buffer.getvalue():
+            return 0
+
+        def _copy() -> int:
+            buffer.seek(0)
+            with self.conn.cursor() as cur:
+                cur.copy_expert(self.COPY_EVENTS_SQL, buffer)
+                self._commit()
+                return cur.rowcount
+
+        return self._run(_copy)
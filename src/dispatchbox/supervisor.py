@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """Process supervision for outbox workers."""
 
-from multiprocessing import Event, Process
+import asyncio
+import ctypes
+from multiprocessing import Event, Process, connection, get_context
 import os
+import select
 import signal
 import sys
-import time
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
@@ -14,6 +16,42 @@ from dispatchbox.config import DEFAULT_MAX_PARALLEL, DEFAULT_RETRY_BACKOFF_SECON
 from dispatchbox.repository import OutboxRepository
 from dispatchbox.worker import OutboxWorker
 
+# Workers are forked so they start from the parent's already imported modules and
+# logging setup instead of re-importing everything. Pinned explicitly because
+# Python 3.14 switches the Linux default to forkserver; elsewhere the platform
+# default (spawn) is kept since fork is unsafe on macOS.
+_MP_CONTEXT = get_context("fork" if sys.platform.startswith("linux") else None)
+
+
+class StopFlag:
+    """
+    Process-shared stop flag with the set()/is_set() interface of multiprocessing.Event.
+
+    Backed by one shared byte without a lock: is_set() is a plain memory read
+    and set() a plain store. Unlike Event, which takes a semaphore-backed lock
+    for both, this is cheap on every loop iteration and safe to call from a
+    signal handler that interrupted a thread in the middle of is_set().
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self) -> None:
+        """Initialize an unset flag in shared memory."""
+        self._value = _MP_CONTEXT.RawValue(ctypes.c_bool, False)
+
+    def set(self) -> None:
+        """Set the flag for this and every process sharing it."""
+        self._value.value = True
+
+    def is_set(self) -> bool:
+        """
+        Check whether the flag has been set.
+
+        Returns:
+            True once set() has been called in any process
+        """
+        return self._value.value
+
 
 def _setup_worker_logging(worker_name: str) -> str:
     """
@@ -32,21 +70,54 @@ def _setup_worker_logging(worker_name: str) -> str:
     return full_worker_name
 
 
-def _setup_worker_signal_handlers(stop_event: Event, worker_name: str) -> None:
+def _setup_worker_signal_handlers(stop_event: Event) -> int:
     """
     Setup signal handlers for worker process.
 
+    The handlers only set the stop event; logging from a signal handler can
+    deadlock on loguru's lock if the signal lands while the same thread is
+    emitting a record. Signal numbers are also written to a wakeup pipe
+    (signal.set_wakeup_fd) so an idle worker waiting for notifications stops
+    right away instead of at the end of its poll interval.
+
     Args:
         stop_event: Event to signal worker to stop
-        worker_name: Full worker name for logging
+
+    Returns:
+        Read end of the signal wakeup pipe
     """
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
 
     def _signal_handler(sig: int, frame: Any) -> None:
-        logger.info("Worker {} received signal {}, initiating shutdown...", worker_name, sig)
         stop_event.set()
 
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
+    return read_fd
+
+
+def _pin_to_cpu(cpu_index: int) -> None:
+    """
+    Pin the current process to a single CPU from its allowed set.
+
+    CPUs are taken round-robin from the affinity mask the process inherited,
+    so cgroup/cpuset limits are respected.
+
+    Args:
+        cpu_index: Index into the sorted list of allowed CPUs (wraps around)
+    """
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+        cpu = cpus[cpu_index % len(cpus)]
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError) as e:
+        # sched_*affinity is Linux-only and may be denied; keep the default scheduling
+        logger.warning("Could not pin worker to a CPU: {}", e)
+        return
+    logger.info("Pinned worker to CPU {}", cpu)
 
 
 def worker_loop(
@@ -57,6 +128,7 @@ def worker_loop(
     worker_name: str,
     max_parallel: int = DEFAULT_MAX_PARALLEL,
     retry_backoff_seconds: int = DEFAULT_RETRY_BACKOFF_SECONDS,
+    cpu_index: Optional[int] = None,
 ) -> None:
     """
     Worker process entry point.
@@ -65,13 +137,16 @@ def worker_loop(
         dsn: PostgreSQL connection string
         stop_event: Event to signal worker to stop
         batch_size: Number of events to fetch per batch
-        poll_interval: Seconds to sleep when no work available
+        poll_interval: Maximum seconds to wait for new events when no work available
         worker_name: Unique name for this worker (e.g., "worker-00")
         max_parallel: Maximum number of parallel threads
         retry_backoff_seconds: Seconds to wait before retrying failed events
+        cpu_index: If set, pin this process to one CPU (see _pin_to_cpu)
     """
     full_worker_name = _setup_worker_logging(worker_name)
-    _setup_worker_signal_handlers(stop_event, full_worker_name)
+    wakeup_fd = _setup_worker_signal_handlers(stop_event)
+    if cpu_index is not None:
+        _pin_to_cpu(cpu_index)
 
     repository = OutboxRepository(dsn=dsn, retry_backoff_seconds=retry_backoff_seconds)
 
@@ -81,30 +156,66 @@ def worker_loop(
         max_parallel=max_parallel,
         stop_event=stop_event,
         repository=repository,
+        wakeup_fd=wakeup_fd,
     )
 
     with repository:
-        worker.run_loop()
+        repository.listen()
+        repository.prepare_statements()
+        if worker.is_async:
+            asyncio.run(worker.run_loop_async())
+        else:
+            worker.run_loop()
+
+    logger.info("Worker {} stopped", full_worker_name)
 
 
-def _setup_signal_handlers(stop_event: Event, children: List[Process]) -> None:
+def _setup_signal_handlers(stop_event: Event) -> int:
     """
     Setup signal handlers for graceful shutdown.
 
+    The handlers only set the stop event. Signal numbers are also written to
+    a wakeup pipe (signal.set_wakeup_fd) so the wait loop in the main thread
+    wakes up, logs the signal and keeps reaping children as they exit.
+
     Args:
         stop_event: Event to signal workers to stop
-        children: List of child processes
+
+    Returns:
+        Read end of the signal wakeup pipe
     """
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
 
     def _signal_handler(sig: int, frame: Any) -> None:
-        logger.info("Parent received signal {}, stopping children...", sig)
         stop_event.set()
-        for p in children:
-            p.join(timeout=5)
-        sys.exit(0)
 
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
+    return read_fd
+
+
+def _drain_wakeup_fd(wakeup_fd: int, stop_event: Event) -> None:
+    """
+    Consume pending signal numbers from the wakeup pipe and stop the workers.
+
+    Args:
+        wakeup_fd: Read end of the signal wakeup pipe
+        stop_event: Event to signal workers to stop
+    """
+    while True:
+        try:
+            data = os.read(wakeup_fd, 512)
+        except BlockingIOError:
+            # Pipe drained
+            return
+        if not data:
+            return
+        for sig in data:
+            logger.info("Parent received signal {}, stopping children...", sig)
+        stop_event.set()
 
 
 def _start_worker_processes(
@@ -115,6 +226,7 @@ def _start_worker_processes(
     poll_interval: float,
     max_parallel: int,
     retry_backoff_seconds: int,
+    pin_cpus: bool = False,
 ) -> List[Process]:
     """
     Start all worker processes.
@@ -124,9 +236,10 @@ def _start_worker_processes(
         num_processes: Number of worker processes to start
         stop_event: Event to signal workers to stop
         batch_size: Number of events to fetch per batch
-        poll_interval: Seconds to sleep when no work available
+        poll_interval: Maximum seconds to wait for new events when no work available
         max_parallel: Maximum number of parallel threads per process
         retry_backoff_seconds: Seconds to wait before retrying failed events
+        pin_cpus: Pin each worker process to its own CPU
 
     Returns:
         List of started Process objects
@@ -135,9 +248,18 @@ def _start_worker_processes(
 
     for i in range(num_processes):
         worker_name = f"worker-{i:02d}"
-        p: Process = Process(
+        p: Process = _MP_CONTEXT.Process(
             target=worker_loop,
-            args=(dsn, stop_event, batch_size, poll_interval, worker_name, max_parallel, retry_backoff_seconds),
+            args=(
+                dsn,
+                stop_event,
+                batch_size,
+                poll_interval,
+                worker_name,
+                max_parallel,
+                retry_backoff_seconds,
+                i if pin_cpus else None,
+            ),
             name=f"dispatchbox-worker-{i:02d}",
         )
         p.start()
@@ -147,21 +269,111 @@ def _start_worker_processes(
     return children
 
 
-def _wait_for_processes(children: List[Process], stop_event: Event) -> None:
+def _open_pidfds(children: List[Process]) -> Optional[Dict[int, Process]]:
+    """
+    Open a pidfd for every live child process.
+
+    Args:
+        children: List of child processes
+
+    Returns:
+        Mapping of pidfd -> process, or None if pidfds are not supported on this platform
+    """
+    pidfds: Dict[int, Process] = {}
+    for p in children:
+        if not p.is_alive():
+            continue
+        try:
+            pidfds[os.pidfd_open(p.pid)] = p
+        except ProcessLookupError:
+            # Child exited between is_alive() and pidfd_open()
+            continue
+        except (AttributeError, OSError):
+            for fd in pidfds:
+                os.close(fd)
+            return None
+    return pidfds
+
+
+def _wait_for_exit_pidfd(children: List[Process], stop_event: Event, wakeup_fd: Optional[int] = None) -> bool:
+    """
+    Block until all children exit, using one poll() over their pidfds.
+
+    The kernel wakes the supervisor only when a child dies, so there is no
+    periodic wakeup while the workers are running.
+
+    Args:
+        children: List of child processes
+        stop_event: Event to signal workers to stop
+        wakeup_fd: Optional read end of the signal wakeup pipe
+
+    Returns:
+        True if all children have exited, False if pidfds are not supported
+    """
+    pidfds = _open_pidfds(children)
+    if pidfds is None:
+        return False
+
+    poller = select.poll()
+    for fd in pidfds:
+        poller.register(fd, select.POLLIN)
+    if wakeup_fd is not None:
+        poller.register(wakeup_fd, select.POLLIN)
+
+    try:
+        while pidfds:
+            for fd, _ in poller.poll():
+                if fd == wakeup_fd:
+                    _drain_wakeup_fd(wakeup_fd, stop_event)
+                    continue
+                poller.unregister(fd)
+                os.close(fd)
+                pidfds.pop(fd).join()
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+    return True
+
+
+def _wait_for_exit_sentinels(children: List[Process], stop_event: Event, wakeup_fd: Optional[int] = None) -> None:
+    """
+    Block until all children exit, using multiprocessing process sentinels.
+
+    Portable fallback for platforms without pidfds: connection.wait() blocks
+    on the sentinel handles until at least one child has exited.
+
+    Args:
+        children: List of child processes
+        stop_event: Event to signal workers to stop
+        wakeup_fd: Optional read end of the signal wakeup pipe
+    """
+    sentinels: Dict[int, Process] = {p.sentinel: p for p in children if p.is_alive()}
+    extra = [wakeup_fd] if wakeup_fd is not None else []
+    while sentinels:
+        for ready in connection.wait(list(sentinels) + extra):
+            if ready == wakeup_fd:
+                _drain_wakeup_fd(wakeup_fd, stop_event)
+                continue
+            sentinels.pop(ready).join()
+
+
+def _wait_for_processes(children: List[Process], stop_event: Event, wakeup_fd: Optional[int] = None) -> None:
     """
     Wait for all worker processes to complete.
 
+    Uses pidfds on Linux and falls back to process sentinels elsewhere.
+    Children are reaped in whatever order they exit, so shutdown takes as
+    long as the slowest worker rather than the sum of all of them.
+
     Args:
         children: List of child processes
         stop_event: Event to signal workers to stop
+        wakeup_fd: Optional read end of the signal wakeup pipe
     """
     try:
-        while True:
-            alive: bool = any(p.is_alive() for p in children)
-            if not alive:
-                logger.info("All children have exited")
-                break
-            time.sleep(1)
+        if not _wait_for_exit_pidfd(children, stop_event, wakeup_fd):
+            _wait_for_exit_sentinels(children, stop_event, wakeup_fd)
+        logger.info("All children have exited")
     except KeyboardInterrupt:
         logger.info("KeyboardInterrupt - stopping")
         stop_event.set()
@@ -176,6 +388,7 @@ def start_processes(
     poll_interval: float,
     max_parallel: int = DEFAULT_MAX_PARALLEL,
     retry_backoff_seconds: int = DEFAULT_RETRY_BACKOFF_SECONDS,
+    pin_cpus: bool = False,
 ) -> None:
     """
     Start and supervise multiple worker processes.
@@ -184,11 +397,12 @@ def start_processes(
         dsn: PostgreSQL connection string
         num_processes: Number of worker processes to start
         batch_size: Number of events to fetch per batch
-        poll_interval: Seconds to sleep when no work available
+        poll_interval: Maximum seconds to wait for new events when no work available
         max_parallel: Maximum number of parallel threads per process
         retry_backoff_seconds: Seconds to wait before retrying failed events
+        pin_cpus: Pin each worker process to its own CPU (Linux only)
     """
-    stop_event: Event = Event()
+    stop_event = StopFlag()
     children = _start_worker_processes(
         dsn,
         num_processes,
@@ -197,7 +411,8 @@ def start_processes(
         poll_interval,
         max_parallel,
         retry_backoff_seconds,
+        pin_cpus,
     )
 
-    _setup_signal_handlers(stop_event, children)
-    _wait_for_processes(children, stop_event)
+    wakeup_fd = _setup_signal_handlers(stop_event)
+    _wait_for_processes(children, stop_event, wakeup_fd)
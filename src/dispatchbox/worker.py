@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """OutboxWorker class for processing outbox events."""
 
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import inspect
 from multiprocessing import Event
-import time
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
@@ -17,9 +18,29 @@ class HandlerNotFoundError(RuntimeError):
     """Raised when no handler is found for an event type."""
 
 
+async def _await(awaitable: Any) -> Any:
+    """Await any awaitable, so asyncio.run() also accepts non-coroutine awaitables."""
+    return await awaitable
+
+
 class OutboxWorker:
     """Worker for processing outbox events in a single process with multi-threading."""
 
+    # Fixed attribute layout: no per-instance __dict__ on the per-event path
+    __slots__ = (
+        "batch_size",
+        "poll_interval",
+        "stop_event",
+        "handlers",
+        "repository",
+        "max_parallel",
+        "is_async",
+        "max_in_flight",
+        "executor",
+        "wakeup_fd",
+        "_get_handler",
+    )
+
     def __init__(
         self,
         batch_size: int,
@@ -28,17 +49,19 @@ class OutboxWorker:
         stop_event: Optional[Event] = None,
         handlers: Optional[Dict[str, Callable[[Dict[str, Any]], None]]] = None,
         repository: Optional[OutboxRepository] = None,
+        wakeup_fd: Optional[int] = None,
     ) -> None:
         """
         Initialize OutboxWorker.
 
         Args:
             batch_size: Number of events to fetch per batch
-            poll_interval: Seconds to sleep when no work available
+            poll_interval: Maximum seconds to wait for new events when no work available
             max_parallel: Maximum number of parallel threads
             stop_event: Event to signal worker to stop
             handlers: Dictionary of event_type -> handler function (defaults to HANDLERS)
             repository: OutboxRepository instance (required)
+            wakeup_fd: Optional signal wakeup pipe; ends the idle wait as soon as a signal arrives
         """
         if repository is None:
             raise ValueError("repository is required")
@@ -47,9 +70,23 @@ class OutboxWorker:
         self.poll_interval: float = poll_interval
         self.stop_event: Optional[Event] = stop_event
         self.handlers: Dict[str, Callable[[Dict[str, Any]], None]] = handlers or HANDLERS
+        # Bound once so each event costs one call instead of an attribute lookup plus a method lookup
+        self._get_handler: Callable[[str], Optional[Callable[[Dict[str, Any]], None]]] = self.handlers.get
         self.repository: OutboxRepository = repository
+        self.max_parallel: int = max_parallel
+        # Coroutine handlers run on one event loop instead of one thread each
+        self.is_async: bool = bool(self.handlers) and all(
+            inspect.iscoroutinefunction(handler) for handler in self.handlers.values()
+        )
+        # Keep the pool busy while the next batch is fetched, without queueing unbounded work
+        self.max_in_flight: int = 2 * max_parallel
 
-        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_parallel)
+        # With a single slot the handoff to a pool thread buys nothing; run events inline instead.
+        # Coroutine handlers run on run_loop_async()'s event loop, so they need no pool either.
+        self.executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=max_parallel) if max_parallel > 1 and not self.is_async else None
+        )
+        self.wakeup_fd: Optional[int] = wakeup_fd
 
     def process_event(self, event: OutboxEvent) -> None:
         """
@@ -64,45 +101,288 @@ class OutboxWorker:
         event_type: str = event.event_type
         payload: Dict[str, Any] = event.payload
 
-        handler: Optional[Callable[[Dict[str, Any]], None]] = self.handlers.get(event_type)
+        handler: Optional[Callable[[Dict[str, Any]], None]] = self._get_handler(event_type)
         if not handler:
             raise HandlerNotFoundError(f"No handler for event_type={event_type}")
 
-        handler(payload)
+        result = handler(payload)
+        # A coroutine handler reached the threaded/inline path (mixed registry, or run_loop()
+        # called directly): run it to completion on this thread instead of dropping the
+        # un-awaited coroutine and reporting success
+        if inspect.isawaitable(result):
+            asyncio.run(_await(result))
+
+    async def process_event_async(self, event: OutboxEvent) -> None:
+        """
+        Process a single event by awaiting its coroutine handler.
+
+        Args:
+            event: OutboxEvent instance
+
+        Raises:
+            HandlerNotFoundError: If no handler is found for the event type
+        """
+        handler = self._get_handler(event.event_type)
+        if not handler:
+            raise HandlerNotFoundError(f"No handler for event_type={event.event_type}")
+
+        await handler(event.payload)
+
+    async def _dispatch(
+        self,
+        event: OutboxEvent,
+        semaphore: asyncio.Semaphore,
+        success_ids: List[int],
+        retry_ids: List[int],
+    ) -> None:
+        """
+        Run one event under the concurrency limit and record its outcome.
+
+        Args:
+            event: OutboxEvent instance
+            semaphore: Semaphore bounding concurrent handlers to max_parallel
+            success_ids: Accumulator for IDs of events to mark as done
+            retry_ids: Accumulator for IDs of events to mark for retry
+        """
+        event_id: Optional[int] = event.id
+
+        if event_id is None:
+            logger.error("Event has no ID, skipping")
+            return
+
+        async with semaphore:
+            try:
+                await self.process_event_async(event)
+                success_ids.append(event_id)
+                logger.debug("Successfully processed event {}", event_id)
+            # Same rationale as in _process_and_tag(): every failure becomes a retry
+            except Exception as e:
+                self._log_failure(event_id, e)
+                retry_ids.append(event_id)
+
+    def _process_and_tag(self, event: OutboxEvent) -> Tuple[Optional[int], Optional[Exception]]:
+        """
+        Process an event on a pool thread and report its outcome with its ID.
+
+        Carrying the ID in the result lets the caller match completions to
+        events without a Future -> event map.
+
+        Args:
+            event: OutboxEvent instance
+
+        Returns:
+            Tuple of event ID and the exception raised while processing (None on success)
+        """
+        try:
+            self.process_event(event)
+        # Catching generic Exception is intentional for security:
+        # - Prevents information leakage about specific failure types
+        # - Ensures all events are properly marked for retry
+        # - Protects against revealing internal implementation details
+        except Exception as e:
+            return event.id, e
+        return event.id, None
+
+    @staticmethod
+    def _log_failure(event_id: int, error: Exception) -> None:
+        """
+        Log a failed event.
+
+        The ERROR line carries only the exception type and message. The
+        traceback is attached at DEBUG, which loguru filters before formatting,
+        so a burst of failures does not format a traceback per event.
+
+        Args:
+            event_id: ID of the failed event
+            error: Exception raised while processing
+        """
+        logger.error("Error processing event {}: {}: {}", event_id, type(error).__name__, error)
+        logger.opt(exception=error).debug("Traceback for event {}", event_id)
+
+    def _complete(
+        self, event_id: Optional[int], error: Optional[Exception], success_ids: List[int], retry_ids: List[int]
+    ) -> None:
+        """
+        Record the outcome of a finished event.
+
+        Args:
+            event_id: ID of the processed event
+            error: Exception raised while processing, or None on success
+            success_ids: Accumulator for IDs of events to mark as done
+            retry_ids: Accumulator for IDs of events to mark for retry
+        """
+        if event_id is None:
+            logger.error("Event has no ID, skipping")
+            return
+
+        if error is None:
+            success_ids.append(event_id)
+            logger.debug("Successfully processed event {}", event_id)
+        else:
+            self._log_failure(event_id, error)
+            retry_ids.append(event_id)
+
+    def _write_marks(self, success_ids: List[int], retry_ids: List[int]) -> None:
+        """
+        Send accumulated status updates to the database in one round trip.
+
+        Args:
+            success_ids: IDs of events to mark as done
+            retry_ids: IDs of events to mark for retry
+        """
+        if success_ids and retry_ids:
+            self.repository.mark_many(success_ids, retry_ids)
+        elif success_ids:
+            self.repository.mark_success_many(success_ids)
+        elif retry_ids:
+            self.repository.mark_retry_many(retry_ids)
+
+    def _stop_check(self) -> Callable[[], bool]:
+        """
+        Return a callable reporting whether the worker was asked to stop.
+
+        Returns:
+            The stop event's bound is_set, or a function always returning False without a stop event
+        """
+        if self.stop_event is None:
+            return lambda: False
+        return self.stop_event.is_set
 
     def run_loop(self) -> None:
-        """Main processing loop that fetches and processes events."""
+        """
+        Main processing loop that fetches and processes events.
+
+        Up to max_in_flight events are kept in the executor. As soon as half of
+        them have finished, the next batch is fetched and submitted while the
+        rest are still running, so the threads are not idle during database
+        round-trips. On stop, events already submitted are drained first.
+
+        Outcomes are accumulated and written in one round trip (see
+        _write_marks()) right before the next fetch, or when the pipeline drains.
+        """
+        if self.executor is None:
+            self._run_loop_inline()
+            return
+
         logger.info("Worker started")
 
-        while not (self.stop_event and self.stop_event.is_set()):
+        in_flight: Set[Future[Tuple[Optional[int], Optional[Exception]]]] = set()
+        in_flight_ids: Set[int] = set()
+        success_ids: List[int] = []
+        retry_ids: List[int] = []
+        # Set when the last fetch came back short; no top-ups until the pipeline drains
+        exhausted: bool = False
+
+        # Bound methods and settings resolved once instead of on every iteration
+        is_stopped: Callable[[], bool] = self._stop_check()
+        fetch_pending = self.repository.fetch_pending
+        submit = self.executor.submit
+        process_and_tag = self._process_and_tag
+        complete = self._complete
+        max_parallel: int = self.max_parallel
+        max_in_flight: int = self.max_in_flight
+        batch_size: int = self.batch_size
+
+        while True:
+            stopping: bool = is_stopped()
+            if stopping and not in_flight:
+                break
+
+            if not stopping and not exhausted and len(in_flight) <= max_parallel:
+                limit: int = min(batch_size, max_in_flight - len(in_flight))
+                exclude_ids: List[int] = list(in_flight_ids)
+                # fetch_pending() commits, which also commits these marks
+                self._write_marks(success_ids, retry_ids)
+                success_ids, retry_ids = [], []
+                batch: List[OutboxEvent] = fetch_pending(limit, exclude_ids=exclude_ids)
+                exhausted = len(batch) < limit
+
+                if batch:
+                    logger.debug("Fetched {} events for processing", len(batch))
+                for evt in batch:
+                    in_flight.add(submit(process_and_tag, evt))
+                    if evt.id is not None:
+                        in_flight_ids.add(evt.id)
+
+            if not in_flight:
+                exhausted = False
+                self.repository.wait_for_event(self.poll_interval, self.wakeup_fd)
+                continue
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                event_id, error = future.result()
+                if event_id is not None:
+                    in_flight_ids.discard(event_id)
+                complete(event_id, error, success_ids, retry_ids)
+
+            if not in_flight:
+                # One round trip for all outcomes and one COMMIT per drained pipeline
+                self._write_marks(success_ids, retry_ids)
+                success_ids, retry_ids = [], []
+                self.repository.flush()
+                exhausted = False
+
+    def _run_loop_inline(self) -> None:
+        """
+        Processing loop for max_parallel == 1.
+
+        Events are processed one by one on the calling thread, in the order
+        fetch_pending() returns them (oldest next_run_at first), with no
+        executor submit/wakeup per event. Outcomes of a batch are
+        written and committed once it is done.
+        """
+        logger.info("Worker started (inline)")
+
+        is_stopped: Callable[[], bool] = self._stop_check()
+        fetch_pending = self.repository.fetch_pending
+        process_and_tag = self._process_and_tag
+        complete = self._complete
+
+        while not is_stopped():
+            batch: List[OutboxEvent] = fetch_pending(self.batch_size)
+
+            if not batch:
+                self.repository.wait_for_event(self.poll_interval, self.wakeup_fd)
+                continue
+
+            logger.debug("Fetched {} events for processing", len(batch))
+
+            success_ids: List[int] = []
+            retry_ids: List[int] = []
+            for evt in batch:
+                event_id, error = process_and_tag(evt)
+                complete(event_id, error, success_ids, retry_ids)
+
+            self._write_marks(success_ids, retry_ids)
+            self.repository.flush()
+
+    async def run_loop_async(self) -> None:
+        """
+        Processing loop for coroutine handlers.
+
+        Each batch is dispatched on the running event loop with at most
+        max_parallel handlers awaiting at once, then its outcomes are written
+        and committed. Database calls stay synchronous; nothing else runs on
+        the loop while they are in progress.
+        """
+        logger.info("Worker started (async handlers)")
+
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        is_stopped: Callable[[], bool] = self._stop_check()
+
+        while not is_stopped():
             batch: List[OutboxEvent] = self.repository.fetch_pending(self.batch_size)
 
             if not batch:
-                time.sleep(self.poll_interval)
+                self.repository.wait_for_event(self.poll_interval, self.wakeup_fd)
                 continue
 
             logger.debug("Fetched {} events for processing", len(batch))
 
-            futures: Dict[Future[None], OutboxEvent] = {
-                self.executor.submit(self.process_event, evt): evt for evt in batch
-            }
-
-            for future in as_completed(futures):
-                event: OutboxEvent = futures[future]
-                event_id: Optional[int] = event.id
-
-                if event_id is None:
-                    logger.error("Event has no ID, skipping")
-                    continue
-
-                try:
-                    future.result()
-                    self.repository.mark_success(event_id)
-                    logger.debug("Successfully processed event {}", event_id)
-                # Catching generic Exception is intentional for security:
-                # - Prevents information leakage about specific failure types
-                # - Ensures all events are properly marked for retry
-                # - Protects against revealing internal implementation details
-                except Exception as e:
-                    logger.error("Error processing event {}: {}", event_id, e, exc_info=True)
-                    self.repository.mark_retry(event_id)
+            success_ids: List[int] = []
+            retry_ids: List[int] = []
+            await asyncio.gather(*(self._dispatch(evt, semaphore, success_ids, retry_ids) for evt in batch))
+
+            self._write_marks(success_ids, retry_ids)
+            self.repository.flush()
@@ -1,7 +1,8 @@
 """Shared fixtures for tests."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 from unittest.mock import MagicMock, Mock
 
 import pytest
@@ -9,6 +10,55 @@ import pytest
 from dispatchbox.models import OutboxEvent
 
 
+class FakeRepository:
+    """Hand-written stand-in for the OutboxRepository DLQ methods HttpServer calls.
+
+    Cheaper than a MagicMock: every call is appended to ``calls`` as ``(name, args, kwargs)``,
+    then the method raises ``errors[name]`` if one is set, otherwise returns ``returns[name]``
+    (None by default).
+    """
+
+    METHODS = (
+        "fetch_dead_events",
+        "count_dead_events",
+        "get_dead_event",
+        "retry_dead_event",
+        "retry_dead_events_batch",
+    )
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+        self.returns: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+
+    def reset(self) -> None:
+        """Forget recorded calls, return values and errors."""
+        self.calls.clear()
+        self.returns.clear()
+        self.errors.clear()
+
+    def _call(self, name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        self.calls.append((name, args, kwargs))
+        if name in self.errors:
+            raise self.errors[name]
+        return self.returns.get(name)
+
+    def fetch_dead_events(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("fetch_dead_events", args, kwargs)
+
+    def count_dead_events(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("count_dead_events", args, kwargs)
+
+    def get_dead_event(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("get_dead_event", args, kwargs)
+
+    def retry_dead_event(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("retry_dead_event", args, kwargs)
+
+    def retry_dead_events_batch(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("retry_dead_events_batch", args, kwargs)
+
+
 @pytest.fixture
 def sample_event_dict() -> Dict[str, Any]:
     """Sample event dictionary for testing."""
@@ -25,6 +75,12 @@ def sample_event_dict() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+def sample_event_row(sample_event_dict: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Sample event as a plain database row (columns in OutboxEvent field order)."""
+    return tuple(sample_event_dict.values())
+
+
 @pytest.fixture
 def sample_event(sample_event_dict: Dict[str, Any]) -> OutboxEvent:
     """Sample OutboxEvent instance for testing."""
@@ -45,14 +101,33 @@ def sample_event_dict_minimal() -> Dict[str, Any]:
     }
 
 
-@pytest.fixture
-def sample_payload() -> Dict[str, Any]:
-    """Sample payload for handlers."""
-    return {
-        "orderId": "12345",
-        "customerId": "C001",
-        "totalCents": 5000,
-    }
+@pytest.fixture(scope="session")
+def sample_dead_event() -> OutboxEvent:
+    """Sample dead event with a fixed timestamp (shared by all tests, so read-only)."""
+    timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return OutboxEvent(
+        id=1,
+        aggregate_type="order",
+        aggregate_id="12345",
+        event_type="order.created",
+        payload={"orderId": "12345"},
+        status="dead",
+        attempts=5,
+        next_run_at=timestamp,
+        created_at=timestamp,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_payload() -> Mapping[str, Any]:
+    """Sample payload for handlers (shared by all tests, so read-only)."""
+    return MappingProxyType(
+        {
+            "orderId": "12345",
+            "customerId": "C001",
+            "totalCents": 5000,
+        }
+    )
 
 
 @pytest.fixture
@@ -60,6 +135,7 @@ def mock_db_connection(mocker):
     """Mock PostgreSQL connection."""
     mock_conn = MagicMock()
     mock_conn.autocommit = False
+    mock_conn.closed = 0
     mock_conn.cursor.return_value.__enter__ = Mock(return_value=Mock())
     mock_conn.cursor.return_value.__exit__ = Mock(return_value=None)
     mocker.patch("psycopg2.connect", return_value=mock_conn)
@@ -87,9 +163,16 @@ def mock_repository(mocker):
     mock_repo.fetch_pending.return_value = []
     mock_repo.mark_success = mocker.Mock()
     mock_repo.mark_retry = mocker.Mock()
+    mock_repo.wait_for_event.return_value = False
     mock_repo.close = mocker.Mock()
     mock_repo.__enter__ = Mock(return_value=mock_repo)
     mock_repo.__exit__ = Mock(return_value=None)
     mock_repo.dsn = "host=localhost dbname=test"
     mock_repo.retry_backoff = 30
     return mock_repo
+
+
+@pytest.fixture(scope="module")
+def fake_repository() -> FakeRepository:
+    """FakeRepository shared by a module; reset it after each test (see the reset_mock_repository fixtures)."""
+    return FakeRepository()
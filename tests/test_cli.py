@@ -1,7 +1,8 @@
 """Tests for CLI module."""
 
 import sys
-from unittest.mock import MagicMock, Mock, call, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, call, patch
 
 import psycopg2
 import pytest
@@ -15,6 +16,14 @@ from dispatchbox.cli import (
     setup_http_server,
     setup_logging,
 )
+from dispatchbox.config import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_HTTP_HOST,
+    DEFAULT_HTTP_PORT,
+    DEFAULT_LOG_LEVEL,
+    DEFAULT_NUM_PROCESSES,
+    DEFAULT_POLL_INTERVAL,
+)
 from dispatchbox.http_server import HttpServer
 from dispatchbox.repository import OutboxRepository
 
@@ -28,17 +37,17 @@ class TestParseArgs:
             args = parse_args()
             assert args.dsn == "host=localhost dbname=test"
 
+    def test_parse_args_is_cached_per_argv(self):
+        """Test parse_args reuses the parsed Namespace until sys.argv changes."""
+        with patch("sys.argv", ["dispatchbox", "--dsn", "host=cached"]):
+            first = parse_args()
+            assert parse_args() is first
+
+        with patch("sys.argv", ["dispatchbox", "--dsn", "host=other"]):
+            assert parse_args().dsn == "host=other"
+
     def test_parse_args_with_defaults(self):
         """Test parse_args uses default values."""
-        from dispatchbox.config import (
-            DEFAULT_BATCH_SIZE,
-            DEFAULT_HTTP_HOST,
-            DEFAULT_HTTP_PORT,
-            DEFAULT_LOG_LEVEL,
-            DEFAULT_NUM_PROCESSES,
-            DEFAULT_POLL_INTERVAL,
-        )
-
         with patch("sys.argv", ["dispatchbox", "--dsn", "host=localhost"]):
             args = parse_args()
             assert args.processes == DEFAULT_NUM_PROCESSES
@@ -95,14 +104,19 @@ class TestParseArgs:
 class TestHelp:
     """Tests for help function."""
 
-    @patch("dispatchbox.cli.argparse.ArgumentParser")
-    def test_help_calls_print_help(self, mock_parser_class):
+    @patch("dispatchbox.cli._PARSER")
+    def test_help_calls_print_help(self, mock_parser):
         """Test help function calls print_help."""
-        mock_parser = Mock()
-        mock_parser_class.return_value = mock_parser
         help()
         mock_parser.print_help.assert_called_once()
 
+    @patch("dispatchbox.cli.argparse.ArgumentParser")
+    def test_help_does_not_build_a_parser(self, mock_parser_class, capsys):
+        """Test help reuses the parser built at import, which lists every option."""
+        help()
+        mock_parser_class.assert_not_called()
+        assert "--dsn" in capsys.readouterr().out
+
 
 class TestSetupLogging:
     """Tests for setup_logging function."""
@@ -131,67 +145,108 @@ class TestSetupLogging:
         mock_logger.configure.assert_called_once_with(extra={"worker": "main"})
 
 
+@pytest.fixture
+def mock_pool_class():
+    """Patch the connection pool class used by the DB check."""
+    with patch("dispatchbox.cli.ThreadedConnectionPool") as pool_class:
+        yield pool_class
+
+
+@pytest.fixture
+def check_fn(mock_pool_class):
+    """DB check closure; the pool is created lazily, so tests configure mock_pool_class before calling it."""
+    return create_db_check_function("host=localhost dbname=test", cache_ttl=0)
+
+
 class TestCreateDbCheckFunction:
     """Tests for create_db_check_function."""
 
-    @patch("dispatchbox.cli.OutboxRepository")
-    def test_create_db_check_function_returns_true_when_connected(self, mock_repo_class):
-        """Test db check function returns True when connected."""
-        mock_repo = Mock()
-        mock_repo.is_connected.return_value = True
-        mock_repo_class.return_value = mock_repo
+    def test_create_db_check_function_returns_true_when_connected(self, mock_pool_class, check_fn):
+        """Test db check function returns True when SELECT 1 succeeds on a pooled connection."""
+        mock_pool = mock_pool_class.return_value
+        mock_conn = mock_pool.getconn.return_value
 
-        check_fn = create_db_check_function("host=localhost dbname=test")
         result = check_fn()
 
         assert result is True
-        mock_repo.is_connected.assert_called_once()
-        mock_repo.close.assert_called_once()
+        mock_conn.cursor.return_value.__enter__.return_value.execute.assert_called_once_with("SELECT 1;")
+        mock_pool.putconn.assert_called_once_with(mock_conn, close=False)
 
-    @patch("dispatchbox.cli.OutboxRepository")
-    def test_create_db_check_function_returns_false_when_not_connected(self, mock_repo_class):
-        """Test db check function returns False when not connected."""
-        mock_repo = Mock()
-        mock_repo.is_connected.return_value = False
-        mock_repo_class.return_value = mock_repo
+    def test_create_db_check_function_returns_false_when_not_connected(self, mock_pool_class, check_fn):
+        """Test db check function returns False and discards the connection when the query fails."""
+        mock_pool = mock_pool_class.return_value
+        mock_conn = mock_pool.getconn.return_value
+        mock_conn.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError("gone")
 
-        check_fn = create_db_check_function("host=localhost dbname=test")
         result = check_fn()
 
         assert result is False
-        mock_repo.close.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(mock_conn, close=True)
 
-    @patch("dispatchbox.cli.OutboxRepository")
-    def test_create_db_check_function_returns_false_on_psycopg2_error(self, mock_repo_class):
-        """Test db check function returns False on psycopg2 error."""
-        mock_repo_class.side_effect = psycopg2.OperationalError("Connection failed")
+    def test_create_db_check_function_returns_false_on_psycopg2_error(self, mock_pool_class, check_fn):
+        """Test db check function returns False when the pool cannot connect."""
+        mock_pool_class.side_effect = psycopg2.OperationalError("Connection failed")
 
-        check_fn = create_db_check_function("host=localhost dbname=test")
         result = check_fn()
 
         assert result is False
 
-    @patch("dispatchbox.cli.OutboxRepository")
-    def test_create_db_check_function_returns_false_on_value_error(self, mock_repo_class):
+    def test_create_db_check_function_returns_false_on_value_error(self, mock_pool_class, check_fn):
         """Test db check function returns False on ValueError."""
-        mock_repo_class.side_effect = ValueError("Invalid DSN")
+        mock_pool_class.side_effect = ValueError("Invalid DSN")
 
-        check_fn = create_db_check_function("host=localhost dbname=test")
         result = check_fn()
 
         assert result is False
 
-    @patch("dispatchbox.cli.OutboxRepository")
-    def test_create_db_check_function_uses_correct_timeouts(self, mock_repo_class):
+    def test_create_db_check_function_uses_correct_timeouts(self, mock_pool_class, check_fn):
         """Test db check function uses correct timeouts."""
-        mock_repo = Mock()
-        mock_repo.is_connected.return_value = True
-        mock_repo_class.return_value = mock_repo
-
-        check_fn = create_db_check_function("host=localhost dbname=test")
         check_fn()
 
-        mock_repo_class.assert_called_once_with("host=localhost dbname=test", connect_timeout=2, query_timeout=2)
+        mock_pool_class.assert_called_once_with(
+            1, 2, "host=localhost dbname=test", connect_timeout=2, options="-c statement_timeout=2000"
+        )
+
+    @patch("dispatchbox.cli.OutboxRepository")
+    def test_create_db_check_function_reuses_pool(self, mock_repo_class, mock_pool_class, check_fn):
+        """Test repeated checks borrow from one pool instead of opening a connection each time."""
+        mock_repo_class.CHECK_CONNECTION_SQL = "SELECT 1;"
+        mock_pool = mock_pool_class.return_value
+
+        for _ in range(3):
+            assert check_fn() is True
+
+        mock_pool_class.assert_called_once()
+        mock_repo_class.assert_not_called()
+        assert mock_pool.getconn.call_count == 3
+        assert mock_pool.putconn.call_count == 3
+
+    @patch("dispatchbox.cli.time.monotonic")
+    def test_create_db_check_function_caches_result(self, mock_monotonic, mock_pool_class):
+        """Test a result is reused within cache_ttl and re-probed after it expires."""
+        mock_pool = mock_pool_class.return_value
+        check_fn = create_db_check_function("host=localhost dbname=test", cache_ttl=0.5)
+
+        mock_monotonic.return_value = 100.0
+        assert check_fn() is True
+        mock_monotonic.return_value = 100.4
+        assert check_fn() is True
+        assert mock_pool.getconn.call_count == 1
+
+        mock_monotonic.return_value = 100.6
+        assert check_fn() is True
+        assert mock_pool.getconn.call_count == 2
+
+    @patch("dispatchbox.cli.time.monotonic")
+    def test_create_db_check_function_caches_failure(self, mock_monotonic, mock_pool_class):
+        """Test a failed probe is also cached, so a down database is not hammered."""
+        mock_pool_class.side_effect = psycopg2.OperationalError("down")
+        check_fn = create_db_check_function("host=localhost dbname=test", cache_ttl=0.5)
+
+        mock_monotonic.return_value = 100.0
+        assert check_fn() is False
+        assert check_fn() is False
+        mock_pool_class.assert_called_once()
 
 
 class TestCreateRepositoryFactory:
@@ -204,8 +259,8 @@ class TestCreateRepositoryFactory:
         assert callable(factory)
 
     @patch("dispatchbox.cli.OutboxRepository")
-    def test_create_repository_factory_creates_new_repository(self, mock_repo_class):
-        """Test factory creates new repository instance."""
+    def test_create_repository_factory_reuses_repository(self, mock_repo_class):
+        """Test factory connects once and shares the repository between requests."""
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
 
@@ -213,9 +268,21 @@ class TestCreateRepositoryFactory:
         repo1 = factory()
         repo2 = factory()
 
-        assert mock_repo_class.call_count == 2
-        assert repo1 == mock_repo
-        assert repo2 == mock_repo
+        assert mock_repo_class.call_count == 1
+        assert repo1 is mock_repo
+        assert repo2 is mock_repo
+
+    @patch("dispatchbox.cli.OutboxRepository")
+    def test_create_repository_factory_retries_after_failed_connect(self, mock_repo_class):
+        """Test a failed connection is not cached."""
+        mock_repo = Mock()
+        mock_repo_class.side_effect = [psycopg2.OperationalError("down"), mock_repo]
+
+        factory = create_repository_factory("host=localhost dbname=test")
+        with pytest.raises(psycopg2.OperationalError):
+            factory()
+
+        assert factory() is mock_repo
 
     @patch("dispatchbox.cli.OutboxRepository")
     def test_create_repository_factory_uses_correct_timeouts(self, mock_repo_class):
@@ -232,151 +299,142 @@ class TestCreateRepositoryFactory:
 class TestSetupHttpServer:
     """Tests for setup_http_server function."""
 
-    @patch("dispatchbox.cli.create_db_check_function")
-    @patch("dispatchbox.cli.create_repository_factory")
-    @patch("dispatchbox.cli.HttpServer")
-    @patch("dispatchbox.cli.logger")
-    def test_setup_http_server_when_enabled(
-        self, mock_logger, mock_http_server_class, mock_repo_factory, mock_db_check
-    ):
+    def test_setup_http_server_when_enabled(self):
         """Test setup_http_server when HTTP is enabled."""
-        mock_db_check_fn = Mock()
-        mock_repo_fn = Mock()
-        mock_db_check.return_value = mock_db_check_fn
-        mock_repo_factory.return_value = mock_repo_fn
-
-        mock_server = Mock()
-        mock_http_server_class.return_value = mock_server
-
-        args = Mock()
-        args.disable_http = False
-        args.dsn = "host=localhost dbname=test"
-        args.http_host = "127.0.0.1"
-        args.http_port = 8080
-
-        result = setup_http_server(args)
-
-        assert result == mock_server
-        mock_http_server_class.assert_called_once_with(
-            host="127.0.0.1",
-            port=8080,
-            db_check_fn=mock_db_check_fn,
-            repository_fn=mock_repo_fn,
-        )
-        mock_server.start.assert_called_once()
-        mock_logger.info.assert_called_once()
+        with patch.multiple(
+            "dispatchbox.cli",
+            create_db_check_function=DEFAULT,
+            create_repository_factory=DEFAULT,
+            HttpServer=DEFAULT,
+            logger=DEFAULT,
+        ) as mocks:
+            mock_db_check_fn = Mock()
+            mock_repo_fn = Mock()
+            mocks["create_db_check_function"].return_value = mock_db_check_fn
+            mocks["create_repository_factory"].return_value = mock_repo_fn
+
+            mock_server = Mock()
+            mocks["HttpServer"].return_value = mock_server
+
+            args = SimpleNamespace(
+                disable_http=False,
+                dsn="host=localhost dbname=test",
+                http_host="127.0.0.1",
+                http_port=8080,
+            )
+
+            result = setup_http_server(args)
+
+            assert result == mock_server
+            mocks["HttpServer"].assert_called_once_with(
+                host="127.0.0.1",
+                port=8080,
+                db_check_fn=mock_db_check_fn,
+                repository_fn=mock_repo_fn,
+            )
+            mock_server.start.assert_called_once()
+            mocks["logger"].info.assert_called_once()
 
     def test_setup_http_server_when_disabled(self):
         """Test setup_http_server returns None when HTTP is disabled."""
-        args = Mock()
-        args.disable_http = True
+        args = SimpleNamespace(disable_http=True)
 
         result = setup_http_server(args)
 
         assert result is None
 
 
+@pytest.fixture
+def cli_mocks():
+    """Patch everything main() calls out to with a single patcher."""
+    with patch.multiple(
+        "dispatchbox.cli",
+        parse_args=DEFAULT,
+        help=DEFAULT,
+        setup_logging=DEFAULT,
+        setup_http_server=DEFAULT,
+        start_processes=DEFAULT,
+        logger=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
 class TestMain:
     """Tests for main function."""
 
-    @patch("dispatchbox.cli.parse_args")
-    @patch("dispatchbox.cli.help")
-    @patch("dispatchbox.cli.setup_logging")
-    @patch("dispatchbox.cli.setup_http_server")
-    @patch("dispatchbox.cli.start_processes")
-    @patch("dispatchbox.cli.logger")
-    def test_main_with_show_help(
-        self, mock_logger, mock_start_processes, mock_setup_http, mock_setup_logging, mock_help, mock_parse_args
-    ):
+    def test_main_with_show_help(self, cli_mocks):
         """Test main function with --show-help flag."""
-        args = Mock()
-        args.show_help = True
-        args.log_level = "INFO"
-        mock_parse_args.return_value = args
+        args = SimpleNamespace(show_help=True, log_level="INFO")
+        cli_mocks["parse_args"].return_value = args
 
         main()
 
-        mock_parse_args.assert_called_once()
-        mock_help.assert_called_once()
-        mock_setup_logging.assert_not_called()
-        mock_start_processes.assert_not_called()
+        cli_mocks["parse_args"].assert_called_once()
+        cli_mocks["help"].assert_called_once()
+        cli_mocks["setup_logging"].assert_not_called()
+        cli_mocks["start_processes"].assert_not_called()
 
-    @patch("dispatchbox.cli.parse_args")
-    @patch("dispatchbox.cli.setup_logging")
-    @patch("dispatchbox.cli.setup_http_server")
-    @patch("dispatchbox.cli.start_processes")
-    @patch("dispatchbox.cli.logger")
-    def test_main_normal_execution(
-        self, mock_logger, mock_start_processes, mock_setup_http, mock_setup_logging, mock_parse_args
-    ):
+    def test_main_normal_execution(self, cli_mocks):
         """Test main function normal execution."""
-        args = Mock()
-        args.show_help = False
-        args.log_level = "INFO"
-        args.processes = 4
-        args.batch_size = 100
-        args.poll_interval = 1.0
-        args.dsn = "host=localhost dbname=test"
-        mock_parse_args.return_value = args
+        args = SimpleNamespace(
+            show_help=False,
+            log_level="INFO",
+            processes=4,
+            batch_size=100,
+            poll_interval=1.0,
+            pin_cpus=False,
+            dsn="host=localhost dbname=test",
+        )
+        cli_mocks["parse_args"].return_value = args
 
         mock_http_server = Mock()
-        mock_setup_http.return_value = mock_http_server
+        cli_mocks["setup_http_server"].return_value = mock_http_server
 
         main()
 
-        mock_setup_logging.assert_called_once_with("INFO")
-        mock_logger.info.assert_called_once()
-        mock_start_processes.assert_called_once_with("host=localhost dbname=test", 4, 100, 1.0)
+        cli_mocks["setup_logging"].assert_called_once_with("INFO")
+        cli_mocks["logger"].info.assert_called_once()
+        cli_mocks["start_processes"].assert_called_once_with("host=localhost dbname=test", 4, 100, 1.0, pin_cpus=False)
         mock_http_server.stop.assert_called_once()
 
-    @patch("dispatchbox.cli.parse_args")
-    @patch("dispatchbox.cli.setup_logging")
-    @patch("dispatchbox.cli.setup_http_server")
-    @patch("dispatchbox.cli.start_processes")
-    @patch("dispatchbox.cli.logger")
-    def test_main_stops_http_server_on_exception(
-        self, mock_logger, mock_start_processes, mock_setup_http, mock_setup_logging, mock_parse_args
-    ):
+    def test_main_stops_http_server_on_exception(self, cli_mocks):
         """Test main function stops HTTP server even on exception."""
-        args = Mock()
-        args.show_help = False
-        args.log_level = "INFO"
-        args.processes = 4
-        args.batch_size = 100
-        args.poll_interval = 1.0
-        args.dsn = "host=localhost dbname=test"
-        mock_parse_args.return_value = args
+        args = SimpleNamespace(
+            show_help=False,
+            log_level="INFO",
+            processes=4,
+            batch_size=100,
+            poll_interval=1.0,
+            pin_cpus=False,
+            dsn="host=localhost dbname=test",
+        )
+        cli_mocks["parse_args"].return_value = args
 
         mock_http_server = Mock()
-        mock_setup_http.return_value = mock_http_server
-        mock_start_processes.side_effect = KeyboardInterrupt()
+        cli_mocks["setup_http_server"].return_value = mock_http_server
+        cli_mocks["start_processes"].side_effect = KeyboardInterrupt()
 
         with pytest.raises(KeyboardInterrupt):
             main()
 
         mock_http_server.stop.assert_called_once()
 
-    @patch("dispatchbox.cli.parse_args")
-    @patch("dispatchbox.cli.setup_logging")
-    @patch("dispatchbox.cli.setup_http_server")
-    @patch("dispatchbox.cli.start_processes")
-    @patch("dispatchbox.cli.logger")
-    def test_main_without_http_server(
-        self, mock_logger, mock_start_processes, mock_setup_http, mock_setup_logging, mock_parse_args
-    ):
+    def test_main_without_http_server(self, cli_mocks):
         """Test main function when HTTP server is disabled."""
-        args = Mock()
-        args.show_help = False
-        args.log_level = "INFO"
-        args.processes = 4
-        args.batch_size = 100
-        args.poll_interval = 1.0
-        args.dsn = "host=localhost dbname=test"
-        mock_parse_args.return_value = args
+        args = SimpleNamespace(
+            show_help=False,
+            log_level="INFO",
+            processes=4,
+            batch_size=100,
+            poll_interval=1.0,
+            pin_cpus=False,
+            dsn="host=localhost dbname=test",
+        )
+        cli_mocks["parse_args"].return_value = args
 
-        mock_setup_http.return_value = None
+        cli_mocks["setup_http_server"].return_value = None
 
         main()
 
-        mock_start_processes.assert_called_once()
+        cli_mocks["start_processes"].assert_called_once()
         # Should not raise AttributeError when http_server is None
@@ -1,68 +1,51 @@
 """Tests for event handlers."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from dispatchbox.handlers import HANDLERS, push_to_crm, record_analytics, send_email
 
 
-def test_send_email(sample_payload):
-    """Test send_email handler."""
-    with patch("dispatchbox.handlers.time.sleep"):
+def assert_logger_called(mock_logger, fmt_contains, arg_contains):
+    """Assert a single info() call whose format string and arguments contain the given text."""
+    mock_logger.info.assert_called_once()
+    # Loguru uses format string and arguments
+    fmt, *args = mock_logger.info.call_args.args
+    assert fmt_contains in fmt
+    assert any(arg_contains in str(arg) for arg in args)
+
+
+@pytest.mark.parametrize(
+    "handler, message, expected_arg",
+    [
+        (send_email, "Email sent to customer", "C001"),
+        (push_to_crm, "CRM updated for order", "12345"),
+        (record_analytics, "Analytics recorded for order", "12345"),
+    ],
+)
+def test_handler_logs(handler, message, expected_arg, sample_payload):
+    """Test each handler logs its outcome with the relevant payload field."""
+    with patch("dispatchbox.handlers.asyncio.sleep", new_callable=AsyncMock):
         with patch("dispatchbox.handlers.logger") as mock_logger:
-            send_email(sample_payload)
-            mock_logger.info.assert_called_once()
-            # Loguru uses format string and arguments
-            format_str = mock_logger.info.call_args[0][0]
-            args = mock_logger.info.call_args[0][1:]
-            assert "Email sent to customer" in format_str
-            assert "C001" in str(args)
-
-
-def test_push_to_crm(sample_payload):
-    """Test push_to_crm handler."""
-    with patch("dispatchbox.handlers.time.sleep"):
-        with patch("dispatchbox.handlers.logger") as mock_logger:
-            push_to_crm(sample_payload)
-            mock_logger.info.assert_called_once()
-            format_str = mock_logger.info.call_args[0][0]
-            args = mock_logger.info.call_args[0][1:]
-            assert "CRM updated for order" in format_str
-            assert "12345" in str(args)
-
-
-def test_record_analytics(sample_payload):
-    """Test record_analytics handler."""
-    with patch("dispatchbox.handlers.time.sleep"):
-        with patch("dispatchbox.handlers.logger") as mock_logger:
-            record_analytics(sample_payload)
-            mock_logger.info.assert_called_once()
-            format_str = mock_logger.info.call_args[0][0]
-            args = mock_logger.info.call_args[0][1:]
-            assert "Analytics recorded for order" in format_str
-            assert "12345" in str(args)
-
-
-def test_send_email_sleeps():
-    """Test that send_email calls time.sleep."""
-    with patch("dispatchbox.handlers.time.sleep") as mock_sleep:
-        send_email({"customerId": "C001"})
-        mock_sleep.assert_called_once_with(0.2)
+            asyncio.run(handler(sample_payload))
+            assert_logger_called(mock_logger, message, expected_arg)
 
 
-def test_push_to_crm_sleeps():
-    """Test that push_to_crm calls time.sleep."""
-    with patch("dispatchbox.handlers.time.sleep") as mock_sleep:
-        push_to_crm({"orderId": "123"})
-        mock_sleep.assert_called_once_with(0.1)
-
-
-def test_record_analytics_sleeps():
-    """Test that record_analytics calls time.sleep."""
-    with patch("dispatchbox.handlers.time.sleep") as mock_sleep:
-        record_analytics({"orderId": "123"})
-        mock_sleep.assert_called_once_with(0.05)
+@pytest.mark.parametrize(
+    "handler, delay",
+    [
+        (send_email, 0.2),
+        (push_to_crm, 0.1),
+        (record_analytics, 0.05),
+    ],
+)
+def test_handler_sleeps(handler, delay, sample_payload):
+    """Test each handler awaits asyncio.sleep for its simulated I/O delay."""
+    with patch("dispatchbox.handlers.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        asyncio.run(handler(sample_payload))
+        mock_sleep.assert_awaited_once_with(delay)
 
 
 def test_handlers_registry():
@@ -80,8 +63,14 @@ def test_handlers_are_callable():
 
 def test_handlers_call_with_payload(sample_payload):
     """Test that handlers can be called with payload."""
-    with patch("dispatchbox.handlers.time.sleep"):
+    with patch("dispatchbox.handlers.asyncio.sleep", new_callable=AsyncMock):
         # Should not raise
-        HANDLERS["order.created"](sample_payload)
-        HANDLERS["order.created.analytics"](sample_payload)
-        HANDLERS["order.created.crm"](sample_payload)
+        asyncio.run(HANDLERS["order.created"](sample_payload))
+        asyncio.run(HANDLERS["order.created.analytics"](sample_payload))
+        asyncio.run(HANDLERS["order.created.crm"](sample_payload))
+
+
+def test_handlers_are_coroutine_functions():
+    """Test that default handlers are coroutines so a worker runs them on one event loop."""
+    for event_type, handler in HANDLERS.items():
+        assert asyncio.iscoroutinefunction(handler), f"Handler for {event_type} is not a coroutine function"
@@ -2,15 +2,47 @@
 
 import json
 import threading
-import time
 from unittest.mock import MagicMock, Mock, patch
 
 from bottle import response as bottle_response
+import psycopg2
 import pytest
 
 from dispatchbox.http_server import HttpServer
 
 
+@pytest.fixture(scope="module")
+def server():
+    """Share one HttpServer between tests that only call its endpoint methods."""
+    return HttpServer(port=0)
+
+
+def _raiser(exc):
+    """Build a callable that raises exc, for tests that only need a failing callback."""
+
+    def raise_exc(*args, **kwargs):
+        raise exc
+
+    return raise_exc
+
+
+def _blocking_run(started, done):
+    """Build a fake bottle.run that reports it started and blocks until done is set."""
+
+    def fake_run(*args, **kwargs):
+        started.set()
+        done.wait(timeout=2.0)
+
+    return fake_run
+
+
+@pytest.fixture(autouse=True)
+def reset_bottle_response():
+    """Reset bottle's thread-local response so status from one test does not leak into the next."""
+    bottle_response.status = "200 OK"
+    bottle_response.content_type = None
+
+
 def test_health_endpoint():
     """Test /health endpoint returns ok."""
     server = HttpServer(port=0)  # Use random port
@@ -18,126 +50,130 @@ def test_health_endpoint():
     # Mock bottle's run to avoid actually starting server
     with patch("dispatchbox.http_server.run"):
         server.start()
-        time.sleep(0.1)  # Give thread time to start
+        server._server_thread.join(timeout=1.0)
 
         # Simulate request
         result = server._health()
         assert result == {"status": "ok"}
 
 
-def test_ready_endpoint_with_db_check():
+def test_ready_endpoint_with_db_check(server, monkeypatch):
     """Test /ready endpoint with DB check function."""
     mock_db_check = Mock(return_value=True)
-    server = HttpServer(port=0, db_check_fn=mock_db_check)
+    monkeypatch.setattr(server, "db_check_fn", mock_db_check)
 
     result = server._ready()
     assert result == {"status": "ready"}
     mock_db_check.assert_called_once()
 
 
-def test_ready_endpoint_db_not_connected():
+def test_ready_endpoint_db_not_connected(server, monkeypatch):
     """Test /ready endpoint when DB is not connected."""
     mock_db_check = Mock(return_value=False)
-    server = HttpServer(port=0, db_check_fn=mock_db_check)
+    monkeypatch.setattr(server, "db_check_fn", mock_db_check)
 
     # Call endpoint - it should set status to 503
     result = server._ready()
     assert result["status"] == "not ready"
     assert "reason" in result
-    assert "503" in str(bottle_response.status)
+    assert bottle_response.status_code == 503
 
 
-def test_ready_endpoint_db_check_exception():
+def test_ready_endpoint_db_check_exception(server, monkeypatch):
     """Test /ready endpoint when DB check raises exception."""
-    import psycopg2
-
-    mock_db_check = Mock(side_effect=psycopg2.OperationalError("Connection failed"))
-    server = HttpServer(port=0, db_check_fn=mock_db_check)
+    monkeypatch.setattr(server, "db_check_fn", _raiser(psycopg2.OperationalError("Connection failed")))
 
     # Call endpoint - it should set status to 503
     result = server._ready()
     assert result["status"] == "not ready"
     assert "reason" in result
-    assert "503" in str(bottle_response.status)
+    assert bottle_response.status_code == 503
 
 
-def test_ready_endpoint_no_db_check():
+def test_ready_endpoint_no_db_check(server, monkeypatch):
     """Test /ready endpoint without DB check function."""
-    server = HttpServer(port=0, db_check_fn=None)
+    monkeypatch.setattr(server, "db_check_fn", None)
 
     result = server._ready()
     assert result == {"status": "ready"}
 
 
-def test_metrics_endpoint_with_function():
+def test_metrics_endpoint_with_function(server, monkeypatch):
     """Test /metrics endpoint with metrics function."""
     mock_metrics = Mock(return_value="# HELP test_metric\n# TYPE test_metric counter\ntest_metric 1\n")
-    server = HttpServer(port=0, metrics_fn=mock_metrics)
+    monkeypatch.setattr(server, "metrics_fn", mock_metrics)
 
-    # Reset response for test
-    bottle_response.content_type = None
     result = server._metrics()
     assert "# HELP test_metric" in result
     assert bottle_response.content_type == "text/plain; version=0.0.4; charset=utf-8"
     mock_metrics.assert_called_once()
 
 
-def test_metrics_endpoint_no_function():
+def test_metrics_endpoint_no_function(server, monkeypatch):
     """Test /metrics endpoint without metrics function."""
-    server = HttpServer(port=0, metrics_fn=None)
+    monkeypatch.setattr(server, "metrics_fn", None)
 
     # Call endpoint - it should set status to 501
     result = server._metrics()
     assert "# Metrics not available" in result
-    assert "501" in str(bottle_response.status)
+    assert bottle_response.status_code == 501
 
 
-def test_metrics_endpoint_exception():
+def test_metrics_endpoint_exception(server, monkeypatch):
     """Test /metrics endpoint when metrics function raises exception."""
-    mock_metrics = Mock(side_effect=Exception("Metrics error"))
-    server = HttpServer(port=0, metrics_fn=mock_metrics)
+    monkeypatch.setattr(server, "metrics_fn", _raiser(Exception("Metrics error")))
 
     # Call endpoint - it should set status to 500
     result = server._metrics()
     assert "Error generating metrics" in result
-    assert "500" in str(bottle_response.status)
+    assert bottle_response.status_code == 500
 
 
 def test_server_start_stop():
     """Test server start and stop."""
     server = HttpServer(port=0)
 
+    started = threading.Event()
+    done = threading.Event()
+
     with patch("dispatchbox.http_server.run") as mock_run:
         # Make run block to keep thread alive
-        mock_run.side_effect = lambda *args, **kwargs: time.sleep(0.2)
+        mock_run.side_effect = _blocking_run(started, done)
 
         server.start()
-        time.sleep(0.05)  # Give thread time to start
+        assert started.wait(timeout=1.0)
 
         assert server.is_running()
         assert mock_run.called
 
+    done.set()
     server.stop()
-    # Thread will die when run completes or process exits
+    assert not server.is_running()
 
 
 def test_server_start_twice():
     """Test starting server twice doesn't create duplicate threads."""
     server = HttpServer(port=0)
 
+    started = threading.Event()
+    done = threading.Event()
+
     with patch("dispatchbox.http_server.run") as mock_run:
         # Make run block to keep thread alive
-        mock_run.side_effect = lambda *args, **kwargs: time.sleep(0.2)
+        mock_run.side_effect = _blocking_run(started, done)
 
         server.start()
-        time.sleep(0.05)
+        assert started.wait(timeout=1.0)
         first_thread = server._server_thread
 
         server.start()  # Should not create new thread (logs warning)
-        time.sleep(0.05)
 
         # Should still be the same thread
         assert server._server_thread is first_thread
+        assert mock_run.call_count == 1
+
+    done.set()
+    first_thread.join(timeout=1.0)
 
 
 def test_server_is_running():
@@ -146,35 +182,35 @@ def test_server_is_running():
 
     assert not server.is_running()
 
+    started = threading.Event()
+    done = threading.Event()
+
     with patch("dispatchbox.http_server.run") as mock_run:
         # Make run block to keep thread alive
-        mock_run.side_effect = lambda *args, **kwargs: time.sleep(0.2)
+        mock_run.side_effect = _blocking_run(started, done)
 
         server.start()
-        time.sleep(0.05)  # Give thread time to start
+        assert started.wait(timeout=1.0)
         assert server.is_running()
 
+    done.set()
+    server._server_thread.join(timeout=1.0)
+    assert not server.is_running()
 
-def test_error_500_handler():
-    """Test 500 error handler returns JSON response."""
-    server = HttpServer(port=0)
 
+def test_error_500_handler(server):
+    """Test 500 error handler returns JSON response."""
     # Verify error handler is registered
     assert 500 in server.app.error_handler
     error_handler = server.app.error_handler[500]
 
-    # Reset response state
-    bottle_response.content_type = None
-    bottle_response.status = "200 OK"
-
     # Call the error handler directly to test it
     mock_error = Mock()
     result = error_handler(mock_error)
 
     # Verify response
     assert bottle_response.content_type == "application/json"
-    # Bottle response.status can be string or int, check both
-    assert bottle_response.status == 500 or str(bottle_response.status) == "500" or "500" in str(bottle_response.status)
+    assert bottle_response.status_code == 500
     data = json.loads(result)
     assert data["error"] == "Internal Server Error"
     assert "message" in data
@@ -187,7 +223,7 @@ def test_server_start_handles_oserror():
     with patch("dispatchbox.http_server.run", side_effect=OSError("Address already in use")):
         with patch("dispatchbox.http_server.logger") as mock_logger:
             server.start()
-            time.sleep(0.1)  # Give thread time to start and fail
+            server._server_thread.join(timeout=1.0)  # Wait for the thread to fail and exit
 
             # Should log error
             mock_logger.error.assert_called()
@@ -201,8 +237,24 @@ def test_server_start_handles_valueerror():
     with patch("dispatchbox.http_server.run", side_effect=ValueError("Invalid port")):
         with patch("dispatchbox.http_server.logger") as mock_logger:
             server.start()
-            time.sleep(0.1)  # Give thread time to start and fail
+            server._server_thread.join(timeout=1.0)  # Wait for the thread to fail and exit
 
             # Should log error
             mock_logger.error.assert_called()
             assert "HTTP server error" in mock_logger.error.call_args[0][0]
+
+
+def test_bound_port_reports_os_assigned_port():
+    """Test ready_event fires once a port=0 server listens and bound_port then reports the assigned port."""
+    server = HttpServer(host="127.0.0.1", port=0)
+    assert server.bound_port is None
+
+    ready = threading.Event()
+    server.start(ready_event=ready)
+
+    assert ready.wait(timeout=2.0)
+    assert server.bound_port is not None
+    assert server.bound_port > 0
+
+    server.stop()
+    assert not server.is_running()
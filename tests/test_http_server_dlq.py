@@ -3,45 +3,52 @@
 # pylint: disable=protected-access,redefined-outer-name
 
 import io
-import json
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from bottle import response as bottle_response
+import psycopg2
 import pytest
 
 from dispatchbox.http_server import HttpServer
-from dispatchbox.models import OutboxEvent
 from dispatchbox.repository import OutboxRepository
 
+# Request bodies for POST /api/dead-events/retry-batch
+_BATCH_BODY_123 = b'{"event_ids": [1, 2, 3]}'
+_BATCH_BODY_EMPTY = b'{"event_ids": []}'
 
-@pytest.fixture
-def mock_repository():
-    """Mock OutboxRepository."""
-    mock_repo = MagicMock(spec=OutboxRepository)
-    return mock_repo
+
+@pytest.fixture(scope="module")
+def mock_repository(fake_repository):
+    """Stand-in for OutboxRepository exposing only the DLQ methods the server calls."""
+    return fake_repository
 
 
 @pytest.fixture
-def sample_dead_event():
-    """Sample dead event."""
-    from datetime import datetime, timezone  # pylint: disable=import-outside-toplevel
-
-    return OutboxEvent(
-        id=1,
-        aggregate_type="order",
-        aggregate_id="12345",
-        event_type="order.created",
-        payload={"orderId": "12345"},
-        status="dead",
-        attempts=5,
-        next_run_at=datetime.now(timezone.utc),
-        created_at=datetime.now(timezone.utc),
-    )
+def http_request(monkeypatch):
+    """Replace bottle's request with a plain stand-in; tests set its query string and body."""
+    req = SimpleNamespace(query={}, body=io.BytesIO(b""))
+    monkeypatch.setattr("dispatchbox.http_server.request", req)
 
+    def set_query(params):
+        req.query = params
 
-@pytest.fixture
+    def set_body(data):
+        req.body = io.BytesIO(data)
+
+    return SimpleNamespace(set_query=set_query, set_body=set_body, raw=req)
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_repository(mock_repository):
+    """Clear calls, return values and side effects on the shared repository stand-in after each test."""
+    yield
+    mock_repository.reset()
+
+
+@pytest.fixture(scope="module")
 def http_server_with_repo(mock_repository):
-    """HttpServer with repository function."""
+    """HttpServer with repository function (shared by the module)."""
 
     def get_repo():
         return mock_repository
@@ -54,74 +61,46 @@ def http_server_with_repo(mock_repository):
     return server, mock_repository
 
 
-def test_list_dead_events(http_server_with_repo, sample_dead_event):
-    """Test GET /api/dead-events lists dead events."""
+def test_mock_repository_matches_repository_api(mock_repository):
+    """Test the stand-in only defines methods that exist on OutboxRepository."""
+    for name in mock_repository.METHODS:
+        assert callable(getattr(OutboxRepository, name, None)), name
+
+
+@pytest.mark.parametrize(
+    "query, call_kwargs",
+    [
+        (
+            {"limit": "100", "offset": "0"},
+            {"limit": 100, "offset": 0, "aggregate_type": None, "event_type": None},
+        ),
+        (
+            {"limit": "50", "offset": "10", "aggregate_type": "order", "event_type": "order.created"},
+            {"limit": 50, "offset": 10, "aggregate_type": "order", "event_type": "order.created"},
+        ),
+        # limit is capped at 1000
+        (
+            {"limit": "5000"},
+            {"limit": 1000, "offset": 0, "aggregate_type": None, "event_type": None},
+        ),
+    ],
+    ids=["defaults", "filters", "limit-capped"],
+)
+def test_list_dead_events(http_server_with_repo, sample_dead_event, http_request, query, call_kwargs):
+    """Test GET /api/dead-events passes parsed query parameters through and lists dead events."""
     server, mock_repo = http_server_with_repo
-    mock_repo.fetch_dead_events.return_value = [sample_dead_event]
-
-    # Mock request.query
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: {
-            "limit": "100",
-            "offset": "0",
-        }.get(key, default)
-        result = server._list_dead_events()
-
-        assert "events" in result
-        assert len(result["events"]) == 1
-        assert result["events"][0]["id"] == 1
-        assert result["events"][0]["status"] == "dead"
-        assert result["count"] == 1
-        assert result["limit"] == 100
-        assert result["offset"] == 0
-        mock_repo.fetch_dead_events.assert_called_once_with(
-            limit=100,
-            offset=0,
-            aggregate_type=None,
-            event_type=None,
-        )
-
-
-def test_list_dead_events_with_filters(http_server_with_repo, sample_dead_event):
-    """Test GET /api/dead-events with filters."""
-    server, mock_repo = http_server_with_repo
-    mock_repo.fetch_dead_events.return_value = [sample_dead_event]
+    mock_repo.returns["fetch_dead_events"] = [sample_dead_event]
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: {
-            "limit": "50",
-            "offset": "10",
-            "aggregate_type": "order",
-            "event_type": "order.created",
-        }.get(key, default)
-
-        server._list_dead_events()
-        mock_repo.fetch_dead_events.assert_called_once_with(
-            limit=50,
-            offset=10,
-            aggregate_type="order",
-            event_type="order.created",
-        )
-
-
-def test_list_dead_events_limit_max(http_server_with_repo):
-    """Test GET /api/dead-events limits max to 1000."""
-    server, mock_repo = http_server_with_repo
-    mock_repo.fetch_dead_events.return_value = []
-
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: {
-            "limit": "5000",  # Should be capped at 1000
-        }.get(key, default)
-
-        server._list_dead_events()
+    http_request.set_query(query)
+    result = server._list_dead_events()
 
-        mock_repo.fetch_dead_events.assert_called_once_with(
-            limit=1000,  # Capped
-            offset=0,
-            aggregate_type=None,
-            event_type=None,
-        )
+    assert len(result["events"]) == 1
+    assert result["events"][0]["id"] == 1
+    assert result["events"][0]["status"] == "dead"
+    assert result["count"] == 1
+    assert result["limit"] == call_kwargs["limit"]
+    assert result["offset"] == call_kwargs["offset"]
+    assert mock_repo.calls == [("fetch_dead_events", (), call_kwargs)]
 
 
 def test_list_dead_events_no_repository():
@@ -131,40 +110,36 @@ def test_list_dead_events_no_repository():
     result = server._list_dead_events()
     assert "error" in result
     assert "Repository not available" in result["error"]
-    assert "501" in str(bottle_response.status)
+    assert bottle_response.status_code == 501
 
 
-def test_list_dead_events_invalid_params(http_server_with_repo):
+def test_list_dead_events_invalid_params(http_server_with_repo, http_request):
     """Test GET /api/dead-events with invalid parameters."""
     server, mock_repo = http_server_with_repo
-    mock_repo.fetch_dead_events.side_effect = ValueError("limit must be at least 1")
+    mock_repo.errors["fetch_dead_events"] = ValueError("limit must be at least 1")
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: {
+    http_request.set_query(
+        {
             "limit": "0",
-        }.get(key, default)
-        result = server._list_dead_events()
+        }
+    )
+    result = server._list_dead_events()
 
-        assert "error" in result
-        assert "400" in str(bottle_response.status)
+    assert "error" in result
+    assert bottle_response.status_code == 400
 
 
-def test_dead_events_stats(http_server_with_repo):
+def test_dead_events_stats(http_server_with_repo, http_request):
     """Test GET /api/dead-events/stats returns statistics."""
     server, mock_repo = http_server_with_repo
-    mock_repo.count_dead_events.return_value = 42
+    mock_repo.returns["count_dead_events"] = 42
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: default
-        result = server._dead_events_stats()
+    result = server._dead_events_stats()
 
-        assert result["total"] == 42
-        assert result["aggregate_type"] is None
-        assert result["event_type"] is None
-        mock_repo.count_dead_events.assert_called_once_with(
-            aggregate_type=None,
-            event_type=None,
-        )
+    assert result["total"] == 42
+    assert result["aggregate_type"] is None
+    assert result["event_type"] is None
+    assert mock_repo.calls == [("count_dead_events", (), {"aggregate_type": None, "event_type": None})]
 
 
 def test_dead_events_stats_no_repository():
@@ -174,46 +149,47 @@ def test_dead_events_stats_no_repository():
     result = server._dead_events_stats()
     assert "error" in result
     assert "Repository not available" in result["error"]
-    assert "501" in str(bottle_response.status)
+    assert bottle_response.status_code == 501
 
 
-def test_dead_events_stats_with_filters(http_server_with_repo):
+def test_dead_events_stats_with_filters(http_server_with_repo, http_request):
     """Test GET /api/dead-events/stats with filters."""
     server, mock_repo = http_server_with_repo
-    mock_repo.count_dead_events.return_value = 5
+    mock_repo.returns["count_dead_events"] = 5
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: {
+    http_request.set_query(
+        {
             "aggregate_type": "order",
             "event_type": "order.created",
-        }.get(key, default)
-        result = server._dead_events_stats()
+        }
+    )
+    result = server._dead_events_stats()
 
-        assert result["total"] == 5
-        assert result["aggregate_type"] == "order"
-        assert result["event_type"] == "order.created"
+    assert result["total"] == 5
+    assert result["aggregate_type"] == "order"
+    assert result["event_type"] == "order.created"
 
 
 def test_get_dead_event(http_server_with_repo, sample_dead_event):
     """Test GET /api/dead-events/:id returns event."""
     server, mock_repo = http_server_with_repo
-    mock_repo.get_dead_event.return_value = sample_dead_event
+    mock_repo.returns["get_dead_event"] = sample_dead_event
     result = server._get_dead_event(1)
 
     assert result["id"] == 1
     assert result["status"] == "dead"
-    mock_repo.get_dead_event.assert_called_once_with(1)
+    assert mock_repo.calls == [("get_dead_event", (1,), {})]
 
 
 def test_get_dead_event_not_found(http_server_with_repo):
     """Test GET /api/dead-events/:id returns 404 if not found."""
     server, mock_repo = http_server_with_repo
-    mock_repo.get_dead_event.return_value = None
+    mock_repo.returns["get_dead_event"] = None
 
     result = server._get_dead_event(999)
     assert "error" in result
     assert "not found" in result["error"].lower()
-    assert "404" in str(bottle_response.status)
+    assert bottle_response.status_code == 404
 
 
 def test_get_dead_event_no_repository():
@@ -223,43 +199,43 @@ def test_get_dead_event_no_repository():
     result = server._get_dead_event(1)
     assert "error" in result
     assert "Repository not available" in result["error"]
-    assert "501" in str(bottle_response.status)
+    assert bottle_response.status_code == 501
 
 
 def test_get_dead_event_invalid_id(http_server_with_repo):
     """Test GET /api/dead-events/:id with invalid ID."""
     server, mock_repo = http_server_with_repo
-    mock_repo.get_dead_event.side_effect = ValueError("event_id must be a positive integer")
+    mock_repo.errors["get_dead_event"] = ValueError("event_id must be a positive integer")
 
     result = server._get_dead_event(0)
 
     assert "error" in result
-    assert "400" in str(bottle_response.status)
+    assert bottle_response.status_code == 400
 
 
 def test_retry_dead_event(http_server_with_repo):
     """Test POST /api/dead-events/:id/retry resets event."""
     server, mock_repo = http_server_with_repo
-    mock_repo.retry_dead_event.return_value = True
+    mock_repo.returns["retry_dead_event"] = True
 
     result = server._retry_dead_event(123)
 
     assert result["status"] == "success"
     assert result["event_id"] == 123
     assert "reset to pending" in result["message"]
-    mock_repo.retry_dead_event.assert_called_once_with(123)
+    assert mock_repo.calls == [("retry_dead_event", (123,), {})]
 
 
 def test_retry_dead_event_not_found(http_server_with_repo):
     """Test POST /api/dead-events/:id/retry returns 404 if not found."""
     server, mock_repo = http_server_with_repo
-    mock_repo.retry_dead_event.return_value = False
+    mock_repo.returns["retry_dead_event"] = False
 
     result = server._retry_dead_event(999)
 
     assert "error" in result
     assert "not found" in result["error"].lower()
-    assert "404" in str(bottle_response.status)
+    assert bottle_response.status_code == 404
 
 
 def test_retry_dead_event_no_repository():
@@ -269,171 +245,138 @@ def test_retry_dead_event_no_repository():
     result = server._retry_dead_event(1)
     assert "error" in result
     assert "Repository not available" in result["error"]
-    assert "501" in str(bottle_response.status)
+    assert bottle_response.status_code == 501
 
 
 def test_retry_dead_event_invalid_id(http_server_with_repo):
     """Test POST /api/dead-events/:id/retry with invalid ID."""
     server, mock_repo = http_server_with_repo
-    mock_repo.retry_dead_event.side_effect = ValueError("event_id must be a positive integer")
+    mock_repo.errors["retry_dead_event"] = ValueError("event_id must be a positive integer")
 
     result = server._retry_dead_event(0)
 
     assert "error" in result
-    assert "400" in str(bottle_response.status)
+    assert bottle_response.status_code == 400
 
 
-def test_retry_dead_events_batch(http_server_with_repo):
-    """Test POST /api/dead-events/retry-batch resets multiple events."""
+@pytest.mark.parametrize("processed", [3, 2])
+def test_retry_dead_events_batch(http_server_with_repo, http_request, processed):
+    """Test POST /api/dead-events/retry-batch resets events and reports how many were processed."""
     server, mock_repo = http_server_with_repo
-    mock_repo.retry_dead_events_batch.return_value = 3
+    mock_repo.returns["retry_dead_events_batch"] = processed
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        # Bottle's request.body is a file-like object or bytes
-        mock_request.body = io.BytesIO(json.dumps({"event_ids": [1, 2, 3]}).encode())
-        result = server._retry_dead_events_batch()
+    http_request.set_body(_BATCH_BODY_123)
+    result = server._retry_dead_events_batch()
 
-        assert result["status"] == "success"
-        assert result["requested"] == 3
-        assert result["processed"] == 3
-        assert "reset to pending" in result["message"]
-        mock_repo.retry_dead_events_batch.assert_called_once_with([1, 2, 3])
+    assert result["status"] == "success"
+    assert result["requested"] == 3
+    assert result["processed"] == processed
+    assert "reset to pending" in result["message"]
+    assert mock_repo.calls == [("retry_dead_events_batch", ([1, 2, 3],), {})]
 
 
-def test_retry_dead_events_batch_invalid_json(http_server_with_repo):
+def test_retry_dead_events_batch_invalid_json(http_server_with_repo, http_request):
     """Test POST /api/dead-events/retry-batch with invalid JSON."""
     server, _mock_repo = http_server_with_repo
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.body = io.BytesIO(b"invalid json")
-        result = server._retry_dead_events_batch()
+    http_request.set_body(b"invalid json")
+    result = server._retry_dead_events_batch()
 
-        assert "error" in result
-        assert "Invalid JSON" in result["error"]
-        assert "400" in str(bottle_response.status)
+    assert "error" in result
+    assert "Invalid JSON" in result["error"]
+    assert bottle_response.status_code == 400
 
 
-def test_retry_dead_events_batch_empty_list(http_server_with_repo):
+def test_retry_dead_events_batch_empty_list(http_server_with_repo, http_request):
     """Test POST /api/dead-events/retry-batch with empty list."""
     server, _mock_repo = http_server_with_repo
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.body = io.BytesIO(json.dumps({"event_ids": []}).encode())
-        result = server._retry_dead_events_batch()
+    http_request.set_body(_BATCH_BODY_EMPTY)
+    result = server._retry_dead_events_batch()
 
-        assert "error" in result
-        assert "non-empty list" in result["error"]
-        assert "400" in str(bottle_response.status)
+    assert "error" in result
+    assert "non-empty list" in result["error"]
+    assert bottle_response.status_code == 400
 
 
-def test_retry_dead_events_batch_no_repository():
+def test_retry_dead_events_batch_no_repository(http_request):
     """Test POST /api/dead-events/retry-batch returns 501 if no repository."""
     server = HttpServer(host="127.0.0.1", port=8080)
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.body = io.BytesIO(json.dumps({"event_ids": [1, 2, 3]}).encode())
-        result = server._retry_dead_events_batch()
-
-        assert "error" in result
-        assert "Repository not available" in result["error"]
-        assert "501" in str(bottle_response.status)
-
+    http_request.set_body(_BATCH_BODY_123)
+    result = server._retry_dead_events_batch()
 
-def test_retry_dead_events_batch_success_returns_count(http_server_with_repo):
-    """Test POST /api/dead-events/retry-batch returns correct count."""
-    server, mock_repo = http_server_with_repo
-    mock_repo.retry_dead_events_batch.return_value = 2
-
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.body = io.BytesIO(json.dumps({"event_ids": [1, 2, 3]}).encode())
-        result = server._retry_dead_events_batch()
-
-        assert result["status"] == "success"
-        assert result["processed"] == 2
-        assert result["requested"] == 3
+    assert "error" in result
+    assert "Repository not available" in result["error"]
+    assert bottle_response.status_code == 501
 
 
-def test_retry_dead_events_batch_handles_psycopg2_error(http_server_with_repo):
+def test_retry_dead_events_batch_handles_psycopg2_error(http_server_with_repo, http_request):
     """Test POST /api/dead-events/retry-batch handles psycopg2.Error."""
-    import psycopg2
-
     server, mock_repo = http_server_with_repo
-    mock_repo.retry_dead_events_batch.side_effect = psycopg2.OperationalError("Database error")
+    mock_repo.errors["retry_dead_events_batch"] = psycopg2.OperationalError("Database error")
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.body = io.BytesIO(json.dumps({"event_ids": [1, 2, 3]}).encode())
-        with patch("dispatchbox.http_server.logger") as mock_logger:
-            result = server._retry_dead_events_batch()
+    http_request.set_body(_BATCH_BODY_123)
+    with patch("dispatchbox.http_server.logger") as mock_logger:
+        result = server._retry_dead_events_batch()
 
-            assert "error" in result
-            assert "Internal server error" in result["error"]
-            assert "500" in str(bottle_response.status)
-            mock_logger.error.assert_called_once()
+        assert "error" in result
+        assert "Internal server error" in result["error"]
+        assert bottle_response.status_code == 500
+        mock_logger.error.assert_called_once()
 
 
-def test_list_dead_events_handles_psycopg2_error(http_server_with_repo):
+def test_list_dead_events_handles_psycopg2_error(http_server_with_repo, http_request):
     """Test GET /api/dead-events handles psycopg2.Error."""
-    import psycopg2
-
     server, mock_repo = http_server_with_repo
-    mock_repo.fetch_dead_events.side_effect = psycopg2.OperationalError("Database error")
+    mock_repo.errors["fetch_dead_events"] = psycopg2.OperationalError("Database error")
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: default
-        with patch("dispatchbox.http_server.logger") as mock_logger:
-            result = server._list_dead_events()
+    with patch("dispatchbox.http_server.logger") as mock_logger:
+        result = server._list_dead_events()
 
-            assert "error" in result
-            assert "Internal server error" in result["error"]
-            assert "500" in str(bottle_response.status)
-            mock_logger.error.assert_called_once()
+        assert "error" in result
+        assert "Internal server error" in result["error"]
+        assert bottle_response.status_code == 500
+        mock_logger.error.assert_called_once()
 
 
-def test_dead_events_stats_handles_psycopg2_error(http_server_with_repo):
+def test_dead_events_stats_handles_psycopg2_error(http_server_with_repo, http_request):
     """Test GET /api/dead-events/stats handles psycopg2.Error."""
-    import psycopg2
-
     server, mock_repo = http_server_with_repo
-    mock_repo.count_dead_events.side_effect = psycopg2.OperationalError("Database error")
+    mock_repo.errors["count_dead_events"] = psycopg2.OperationalError("Database error")
 
-    with patch("dispatchbox.http_server.request") as mock_request:
-        mock_request.query.get.side_effect = lambda key, default=None: default
-        with patch("dispatchbox.http_server.logger") as mock_logger:
-            result = server._dead_events_stats()
+    with patch("dispatchbox.http_server.logger") as mock_logger:
+        result = server._dead_events_stats()
 
-            assert "error" in result
-            assert "Internal server error" in result["error"]
-            assert "500" in str(bottle_response.status)
-            mock_logger.error.assert_called_once()
+        assert "error" in result
+        assert "Internal server error" in result["error"]
+        assert bottle_response.status_code == 500
+        mock_logger.error.assert_called_once()
 
 
 def test_get_dead_event_handles_psycopg2_error(http_server_with_repo):
     """Test GET /api/dead-events/:id handles psycopg2.Error."""
-    import psycopg2
-
     server, mock_repo = http_server_with_repo
-    mock_repo.get_dead_event.side_effect = psycopg2.OperationalError("Database error")
+    mock_repo.errors["get_dead_event"] = psycopg2.OperationalError("Database error")
 
     with patch("dispatchbox.http_server.logger") as mock_logger:
         result = server._get_dead_event(1)
 
         assert "error" in result
         assert "Internal server error" in result["error"]
-        assert "500" in str(bottle_response.status)
+        assert bottle_response.status_code == 500
         mock_logger.error.assert_called_once()
 
 
 def test_retry_dead_event_handles_psycopg2_error(http_server_with_repo):
     """Test POST /api/dead-events/:id/retry handles psycopg2.Error."""
-    import psycopg2
-
     server, mock_repo = http_server_with_repo
-    mock_repo.retry_dead_event.side_effect = psycopg2.OperationalError("Database error")
+    mock_repo.errors["retry_dead_event"] = psycopg2.OperationalError("Database error")
 
     with patch("dispatchbox.http_server.logger") as mock_logger:
         result = server._retry_dead_event(1)
 
         assert "error" in result
         assert "Internal server error" in result["error"]
-        assert "500" in str(bottle_response.status)
+        assert bottle_response.status_code == 500
         mock_logger.error.assert_called_once()
@@ -1,55 +1,111 @@
 """Integration tests for HTTP server endpoints."""
 
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
 import json
-import socket
 import threading
-import time
-from unittest.mock import MagicMock, Mock
+from unittest.mock import Mock
+from urllib.parse import urlsplit
 
+import psycopg2
 import pytest
-import requests
 
 from dispatchbox.http_server import HttpServer
-from dispatchbox.models import OutboxEvent
-from dispatchbox.repository import OutboxRepository
-
-
-def find_free_port():
-    """Find a free port for testing."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("", 0))
-        s.listen(1)
-        port = s.getsockname()[1]
-    return port
-
-
-@pytest.fixture
-def mock_repository():
-    """Mock OutboxRepository."""
-    mock_repo = MagicMock(spec=OutboxRepository)
-    return mock_repo
-
-
-@pytest.fixture
-def sample_dead_event():
-    """Sample dead event."""
-    return OutboxEvent(
-        id=1,
-        aggregate_type="order",
-        aggregate_id="12345",
-        event_type="order.created",
-        payload={"orderId": "12345"},
-        status="dead",
-        attempts=5,
-        next_run_at=datetime.now(timezone.utc),
-        created_at=datetime.now(timezone.utc),
-    )
 
 
-@pytest.fixture
-def http_server(mock_repository):
-    """Create and start HTTP server for integration tests."""
+def start_server(server, timeout=2.0):
+    """Start a server created with port=0, wait until it is listening and return the assigned port."""
+    ready = threading.Event()
+    server.start(ready_event=ready)
+    if not ready.wait(timeout):
+        pytest.fail("Server failed to start within timeout")
+    return server.bound_port
+
+
+class LoopbackResponse:
+    """Status, headers and body of one response from a test server."""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class LoopbackClient:
+    """Bare http.client client for the loopback test servers.
+
+    The servers speak HTTP/1.0 and close the connection after every response, so each request
+    opens a fresh HTTPConnection; nothing else (retries, cookies, hooks) is needed on 127.0.0.1.
+    """
+
+    def request(self, method, url, body=None, json_body=None, headers=None, timeout=1):
+        parts = urlsplit(url)
+        headers = dict(headers or {})
+        if json_body is not None:
+            body = json.dumps(json_body)
+            headers["Content-Type"] = "application/json"
+        conn = HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+        try:
+            path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            return LoopbackResponse(resp.status, resp.headers, resp.read())
+        finally:
+            conn.close()
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+class ApiClient:
+    """Client bound to one test server: tests pass endpoint paths, e.g. api.get("/health")."""
+
+    def __init__(self, base_url, client):
+        self.base_url = base_url
+        self.client = client
+
+    def request(self, method, path, timeout=1, **kwargs):
+        return self.client.request(method, self.base_url + path, timeout=timeout, **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def http():
+    """HTTP client shared by the whole run."""
+    return LoopbackClient()
+
+
+@pytest.fixture(scope="module")
+def mock_repository(fake_repository):
+    """Stand-in for OutboxRepository (shared by the module, reset after each test)."""
+    return fake_repository
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_repository(mock_repository):
+    """Clear calls, return values and side effects on the shared repository mock after each test."""
+    yield
+    mock_repository.reset()
+
+
+@pytest.fixture(scope="module")
+def http_server(http, mock_repository):
+    """Create and start one HTTP server for the module's integration tests."""
 
     def get_repo():
         return mock_repository
@@ -57,34 +113,51 @@ def http_server(mock_repository):
     def db_check():
         return True
 
-    # Find a free port
-    port = find_free_port()
-
     server = HttpServer(
         host="127.0.0.1",
-        port=port,
+        port=0,
         db_check_fn=db_check,
         repository_fn=get_repo,
     )
 
-    server.start()
-    # Wait for server to start - give it more time
-    max_attempts = 10
-    for _ in range(max_attempts):
-        try:
-            # Try to connect to verify server is up
-            test_response = requests.get(f"http://127.0.0.1:{port}/health", timeout=0.5)
-            if test_response.status_code == 200:
-                break
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-            time.sleep(0.1)
-    else:
-        pytest.fail("Server failed to start within timeout")
+    port = start_server(server)
 
-    yield server, mock_repository, f"http://127.0.0.1:{port}"
+    yield mock_repository, ApiClient(f"http://127.0.0.1:{port}", http)
 
     server.stop()
-    time.sleep(0.1)  # Give server time to stop
+
+
+def _db_not_connected():
+    return False
+
+
+def _db_check_raises():
+    raise psycopg2.OperationalError("Connection failed")
+
+
+def _metrics():
+    return "# HELP test_metric\n# TYPE test_metric counter\ntest_metric 1\n"
+
+
+# HttpServer kwargs for the alternative configurations tests can pick from variant_servers
+SERVER_VARIANTS = {
+    "bare": {},
+    "db_not_connected": {"db_check_fn": _db_not_connected},
+    "db_check_raises": {"db_check_fn": _db_check_raises},
+    "metrics": {"metrics_fn": _metrics},
+}
+
+
+@pytest.fixture(scope="module")
+def variant_servers(http):
+    """Start one server per SERVER_VARIANTS entry for the module and map variant name to its ApiClient."""
+    servers = {name: HttpServer(host="127.0.0.1", port=0, **kwargs) for name, kwargs in SERVER_VARIANTS.items()}
+    clients = {name: ApiClient(f"http://127.0.0.1:{start_server(server)}", http) for name, server in servers.items()}
+
+    yield clients
+
+    for server in servers.values():
+        server.stop()
 
 
 class TestHealthEndpoint:
@@ -92,18 +165,18 @@ class TestHealthEndpoint:
 
     def test_health_endpoint_returns_ok(self, http_server):
         """Test /health endpoint returns 200 OK."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
-        response = requests.get(f"{base_url}/health", timeout=1)
+        response = api.get("/health")
 
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
     def test_health_endpoint_content_type(self, http_server):
         """Test /health endpoint has correct Content-Type."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
-        response = requests.get(f"{base_url}/health", timeout=1)
+        response = api.get("/health")
 
         assert "application/json" in response.headers.get("Content-Type", "")
 
@@ -113,111 +186,51 @@ class TestReadyEndpoint:
 
     def test_ready_endpoint_returns_ready(self, http_server):
         """Test /ready endpoint returns ready when DB is connected."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
-        response = requests.get(f"{base_url}/ready", timeout=1)
+        response = api.get("/ready")
 
         assert response.status_code == 200
         assert response.json() == {"status": "ready"}
 
-    def test_ready_endpoint_db_not_connected(self, mock_repository):
+    def test_ready_endpoint_db_not_connected(self, variant_servers):
         """Test /ready endpoint returns 503 when DB is not connected."""
+        api = variant_servers["db_not_connected"]
+        response = api.get("/ready")
 
-        def db_check():
-            return False
+        assert response.status_code == 503
+        assert response.json()["status"] == "not ready"
+        assert "reason" in response.json()
 
-        port = find_free_port()
-        server = HttpServer(
-            host="127.0.0.1",
-            port=port,
-            db_check_fn=db_check,
-        )
-        server.start()
-        time.sleep(0.3)  # Wait for server to start
-
-        try:
-            base_url = f"http://127.0.0.1:{port}"
-            response = requests.get(f"{base_url}/ready", timeout=1)
-
-            assert response.status_code == 503
-            assert response.json()["status"] == "not ready"
-            assert "reason" in response.json()
-        finally:
-            server.stop()
-
-    def test_ready_endpoint_db_check_exception(self, mock_repository):
+    def test_ready_endpoint_db_check_exception(self, variant_servers):
         """Test /ready endpoint handles DB check exceptions."""
-        import psycopg2
-
-        def db_check():
-            raise psycopg2.OperationalError("Connection failed")
-
-        port = find_free_port()
-        server = HttpServer(
-            host="127.0.0.1",
-            port=port,
-            db_check_fn=db_check,
-        )
-        server.start()
-        time.sleep(0.3)  # Wait for server to start
-
-        try:
-            base_url = f"http://127.0.0.1:{port}"
-            response = requests.get(f"{base_url}/ready", timeout=1)
+        api = variant_servers["db_check_raises"]
+        response = api.get("/ready")
 
-            assert response.status_code == 503
-            assert response.json()["status"] == "not ready"
-            assert "reason" in response.json()
-        finally:
-            server.stop()
+        assert response.status_code == 503
+        assert response.json()["status"] == "not ready"
+        assert "reason" in response.json()
 
 
 class TestMetricsEndpoint:
     """Tests for /metrics endpoint."""
 
-    def test_metrics_endpoint_with_function(self, mock_repository):
+    def test_metrics_endpoint_with_function(self, variant_servers):
         """Test /metrics endpoint returns metrics when function is provided."""
+        api = variant_servers["metrics"]
+        response = api.get("/metrics")
 
-        def metrics_fn():
-            return "# HELP test_metric\n# TYPE test_metric counter\ntest_metric 1\n"
-
-        port = find_free_port()
-        server = HttpServer(
-            host="127.0.0.1",
-            port=port,
-            metrics_fn=metrics_fn,
-        )
-        server.start()
-        time.sleep(0.3)  # Wait for server to start
-
-        try:
-            base_url = f"http://127.0.0.1:{port}"
-            response = requests.get(f"{base_url}/metrics", timeout=1)
-
-            assert response.status_code == 200
-            assert "# HELP test_metric" in response.text
-            assert response.headers.get("Content-Type") == "text/plain; version=0.0.4; charset=utf-8"
-        finally:
-            server.stop()
+        assert response.status_code == 200
+        assert "# HELP test_metric" in response.text
+        assert response.headers.get("Content-Type") == "text/plain; version=0.0.4; charset=utf-8"
 
-    def test_metrics_endpoint_no_function(self, mock_repository):
+    def test_metrics_endpoint_no_function(self, variant_servers):
         """Test /metrics endpoint returns 404 when no function is provided (endpoint not registered)."""
-        port = find_free_port()
-        server = HttpServer(
-            host="127.0.0.1",
-            port=port,
-        )
-        server.start()
-        time.sleep(0.3)  # Wait for server to start
-
-        try:
-            base_url = f"http://127.0.0.1:{port}"
-            response = requests.get(f"{base_url}/metrics", timeout=1)
+        api = variant_servers["bare"]
+        response = api.get("/metrics")
 
-            # When metrics_fn is not provided, endpoint is not registered, so 404
-            assert response.status_code == 404
-        finally:
-            server.stop()
+        # When metrics_fn is not provided, endpoint is not registered, so 404
+        assert response.status_code == 404
 
 
 class TestDeadEventsListEndpoint:
@@ -225,10 +238,10 @@ class TestDeadEventsListEndpoint:
 
     def test_list_dead_events_success(self, http_server, sample_dead_event):
         """Test listing dead events returns correct data."""
-        server, mock_repo, base_url = http_server
-        mock_repo.fetch_dead_events.return_value = [sample_dead_event]
+        mock_repo, api = http_server
+        mock_repo.returns["fetch_dead_events"] = [sample_dead_event]
 
-        response = requests.get(f"{base_url}/api/dead-events", timeout=1)
+        response = api.get("/api/dead-events")
 
         assert response.status_code == 200
         data = response.json()
@@ -242,84 +255,91 @@ class TestDeadEventsListEndpoint:
 
     def test_list_dead_events_with_pagination(self, http_server, sample_dead_event):
         """Test listing dead events with limit and offset."""
-        server, mock_repo, base_url = http_server
-        mock_repo.fetch_dead_events.return_value = [sample_dead_event]
+        mock_repo, api = http_server
+        mock_repo.returns["fetch_dead_events"] = [sample_dead_event]
 
-        response = requests.get(f"{base_url}/api/dead-events?limit=50&offset=10", timeout=1)
+        response = api.get("/api/dead-events?limit=50&offset=10")
 
         assert response.status_code == 200
-        mock_repo.fetch_dead_events.assert_called_once_with(
-            limit=50,
-            offset=10,
-            aggregate_type=None,
-            event_type=None,
-        )
+        assert mock_repo.calls == [
+            (
+                "fetch_dead_events",
+                (),
+                {
+                    "limit": 50,
+                    "offset": 10,
+                    "aggregate_type": None,
+                    "event_type": None,
+                },
+            )
+        ]
 
     def test_list_dead_events_with_filters(self, http_server, sample_dead_event):
         """Test listing dead events with aggregate_type and event_type filters."""
-        server, mock_repo, base_url = http_server
-        mock_repo.fetch_dead_events.return_value = [sample_dead_event]
+        mock_repo, api = http_server
+        mock_repo.returns["fetch_dead_events"] = [sample_dead_event]
 
-        response = requests.get(f"{base_url}/api/dead-events?aggregate_type=order&event_type=order.created", timeout=1)
+        response = api.get("/api/dead-events?aggregate_type=order&event_type=order.created")
 
         assert response.status_code == 200
-        mock_repo.fetch_dead_events.assert_called_once_with(
-            limit=100,
-            offset=0,
-            aggregate_type="order",
-            event_type="order.created",
-        )
+        assert mock_repo.calls == [
+            (
+                "fetch_dead_events",
+                (),
+                {
+                    "limit": 100,
+                    "offset": 0,
+                    "aggregate_type": "order",
+                    "event_type": "order.created",
+                },
+            )
+        ]
 
     def test_list_dead_events_limit_max(self, http_server):
         """Test listing dead events limits max to 1000."""
-        server, mock_repo, base_url = http_server
-        mock_repo.fetch_dead_events.return_value = []
+        mock_repo, api = http_server
+        mock_repo.returns["fetch_dead_events"] = []
 
-        response = requests.get(f"{base_url}/api/dead-events?limit=5000", timeout=1)
+        response = api.get("/api/dead-events?limit=5000")
 
         assert response.status_code == 200
-        mock_repo.fetch_dead_events.assert_called_once_with(
-            limit=1000,  # Capped at 1000
-            offset=0,
-            aggregate_type=None,
-            event_type=None,
-        )
-
-    def test_list_dead_events_no_repository(self, mock_repository):
+        assert mock_repo.calls == [
+            (
+                "fetch_dead_events",
+                (),
+                {
+                    "limit": 1000,  # Capped at 1000
+                    "offset": 0,
+                    "aggregate_type": None,
+                    "event_type": None,
+                },
+            )
+        ]
+
+    def test_list_dead_events_no_repository(self, variant_servers):
         """Test listing dead events returns 404 when no repository (endpoint not registered)."""
-        port = find_free_port()
-        server = HttpServer(
-            host="127.0.0.1",
-            port=port,
-        )
-        server.start()
-        time.sleep(0.3)  # Wait for server to start
-
-        try:
-            base_url = f"http://127.0.0.1:{port}"
-            response = requests.get(f"{base_url}/api/dead-events", timeout=1)
+        api = variant_servers["bare"]
+        response = api.get("/api/dead-events")
 
-            # When repository_fn is not provided, DLQ endpoints are not registered, so 404
-            assert response.status_code == 404
-        finally:
-            server.stop()
+        # When repository_fn is not provided, DLQ endpoints are not registered, so 404
+        assert response.status_code == 404
 
     def test_list_dead_events_invalid_limit(self, http_server):
         """Test listing dead events with invalid limit parameter."""
-        server, mock_repo, base_url = http_server
-        mock_repo.fetch_dead_events.side_effect = ValueError("limit must be at least 1")
+        mock_repo, api = http_server
+        mock_repo.errors["fetch_dead_events"] = ValueError("limit must be at least 1")
 
-        response = requests.get(f"{base_url}/api/dead-events?limit=0", timeout=1)
+        response = api.get("/api/dead-events?limit=0")
 
         assert response.status_code == 400
         assert "error" in response.json()
 
     def test_list_dead_events_invalid_offset(self, http_server):
         """Test listing dead events with invalid offset parameter."""
-        server, mock_repo, base_url = http_server
-        mock_repo.fetch_dead_events.side_effect = ValueError("offset must be non-negative")
+        mock_repo, api = http_server
+        mock_repo.errors["fetch_dead_events"] = ValueError("offset must be non-negative")
 
-        response = requests.get(f"{base_url}/api/dead-events?offset=-1", timeout=1)
+        response = api.get("/api/dead-events?offset=-1")
 
         assert response.status_code == 400
         assert "error" in response.json()
@@ -330,10 +350,10 @@ class TestDeadEventsStatsEndpoint:
 
     def test_dead_events_stats_success(self, http_server):
         """Test getting dead events statistics."""
-        server, mock_repo, base_url = http_server
-        mock_repo.count_dead_events.return_value = 42
+        mock_repo, api = http_server
+        mock_repo.returns["count_dead_events"] = 42
 
-        response = requests.get(f"{base_url}/api/dead-events/stats", timeout=1)
+        response = api.get("/api/dead-events/stats")
 
         assert response.status_code == 200
         data = response.json()
@@ -343,12 +363,10 @@ class TestDeadEventsStatsEndpoint:
 
     def test_dead_events_stats_with_filters(self, http_server):
         """Test getting dead events statistics with filters."""
-        server, mock_repo, base_url = http_server
-        mock_repo.count_dead_events.return_value = 5
+        mock_repo, api = http_server
+        mock_repo.returns["count_dead_events"] = 5
 
-        response = requests.get(
-            f"{base_url}/api/dead-events/stats?aggregate_type=order&event_type=order.created", timeout=1
-        )
+        response = api.get("/api/dead-events/stats?aggregate_type=order&event_type=order.created")
 
         assert response.status_code == 200
         data = response.json()
@@ -362,10 +380,10 @@ class TestGetDeadEventEndpoint:
 
     def test_get_dead_event_success(self, http_server, sample_dead_event):
         """Test getting a single dead event."""
-        server, mock_repo, base_url = http_server
-        mock_repo.get_dead_event.return_value = sample_dead_event
+        mock_repo, api = http_server
+        mock_repo.returns["get_dead_event"] = sample_dead_event
 
-        response = requests.get(f"{base_url}/api/dead-events/1", timeout=1)
+        response = api.get("/api/dead-events/1")
 
         assert response.status_code == 200
         data = response.json()
@@ -376,10 +394,10 @@ class TestGetDeadEventEndpoint:
 
     def test_get_dead_event_not_found(self, http_server):
         """Test getting non-existent dead event returns 404."""
-        server, mock_repo, base_url = http_server
-        mock_repo.get_dead_event.return_value = None
+        mock_repo, api = http_server
+        mock_repo.returns["get_dead_event"] = None
 
-        response = requests.get(f"{base_url}/api/dead-events/999", timeout=1)
+        response = api.get("/api/dead-events/999")
 
         assert response.status_code == 404
         assert "error" in response.json()
@@ -387,10 +405,10 @@ class TestGetDeadEventEndpoint:
 
     def test_get_dead_event_invalid_id(self, http_server):
         """Test getting dead event with invalid ID returns 400."""
-        server, mock_repo, base_url = http_server
-        mock_repo.get_dead_event.side_effect = ValueError("event_id must be a positive integer")
+        mock_repo, api = http_server
+        mock_repo.errors["get_dead_event"] = ValueError("event_id must be a positive integer")
 
-        response = requests.get(f"{base_url}/api/dead-events/0", timeout=1)
+        response = api.get("/api/dead-events/0")
 
         assert response.status_code == 400
         assert "error" in response.json()
@@ -401,24 +419,24 @@ class TestRetryDeadEventEndpoint:
 
     def test_retry_dead_event_success(self, http_server):
         """Test retrying a single dead event."""
-        server, mock_repo, base_url = http_server
-        mock_repo.retry_dead_event.return_value = True
+        mock_repo, api = http_server
+        mock_repo.returns["retry_dead_event"] = True
 
-        response = requests.post(f"{base_url}/api/dead-events/123/retry", timeout=1)
+        response = api.post("/api/dead-events/123/retry")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
         assert data["event_id"] == 123
         assert "reset to pending" in data["message"]
-        mock_repo.retry_dead_event.assert_called_once_with(123)
+        assert mock_repo.calls == [("retry_dead_event", (123,), {})]
 
     def test_retry_dead_event_not_found(self, http_server):
         """Test retrying non-existent dead event returns 404."""
-        server, mock_repo, base_url = http_server
-        mock_repo.retry_dead_event.return_value = False
+        mock_repo, api = http_server
+        mock_repo.returns["retry_dead_event"] = False
 
-        response = requests.post(f"{base_url}/api/dead-events/999/retry", timeout=1)
+        response = api.post("/api/dead-events/999/retry")
 
         assert response.status_code == 404
         assert "error" in response.json()
@@ -426,10 +444,10 @@ class TestRetryDeadEventEndpoint:
 
     def test_retry_dead_event_invalid_id(self, http_server):
         """Test retrying dead event with invalid ID returns 400."""
-        server, mock_repo, base_url = http_server
-        mock_repo.retry_dead_event.side_effect = ValueError("event_id must be a positive integer")
+        mock_repo, api = http_server
+        mock_repo.errors["retry_dead_event"] = ValueError("event_id must be a positive integer")
 
-        response = requests.post(f"{base_url}/api/dead-events/0/retry", timeout=1)
+        response = api.post("/api/dead-events/0/retry")
 
         assert response.status_code == 400
         assert "error" in response.json()
@@ -440,11 +458,11 @@ class TestRetryDeadEventsBatchEndpoint:
 
     def test_retry_dead_events_batch_success(self, http_server):
         """Test retrying multiple dead events."""
-        server, mock_repo, base_url = http_server
-        mock_repo.retry_dead_events_batch.return_value = 3
+        mock_repo, api = http_server
+        mock_repo.returns["retry_dead_events_batch"] = 3
 
         payload = {"event_ids": [1, 2, 3]}
-        response = requests.post(f"{base_url}/api/dead-events/retry-batch", json=payload, timeout=1)
+        response = api.post("/api/dead-events/retry-batch", json_body=payload)
 
         assert response.status_code == 200
         data = response.json()
@@ -452,14 +470,14 @@ class TestRetryDeadEventsBatchEndpoint:
         assert data["requested"] == 3
         assert data["processed"] == 3
         assert "reset to pending" in data["message"]
-        mock_repo.retry_dead_events_batch.assert_called_once_with([1, 2, 3])
+        assert mock_repo.calls == [("retry_dead_events_batch", ([1, 2, 3],), {})]
 
     def test_retry_dead_events_batch_empty_list(self, http_server):
         """Test retrying with empty list returns 400."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
         payload = {"event_ids": []}
-        response = requests.post(f"{base_url}/api/dead-events/retry-batch", json=payload, timeout=1)
+        response = api.post("/api/dead-events/retry-batch", json_body=payload)
 
         assert response.status_code == 400
         assert "error" in response.json()
@@ -467,13 +485,12 @@ class TestRetryDeadEventsBatchEndpoint:
 
     def test_retry_dead_events_batch_invalid_json(self, http_server):
         """Test retrying with invalid JSON returns 400."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
-        response = requests.post(
-            f"{base_url}/api/dead-events/retry-batch",
-            data="invalid json",
+        response = api.post(
+            "/api/dead-events/retry-batch",
+            body="invalid json",
             headers={"Content-Type": "application/json"},
-            timeout=1,
         )
 
         assert response.status_code == 400
@@ -482,33 +499,59 @@ class TestRetryDeadEventsBatchEndpoint:
 
     def test_retry_dead_events_batch_missing_event_ids(self, http_server):
         """Test retrying with missing event_ids field returns 400."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
         payload = {}  # Missing event_ids
-        response = requests.post(f"{base_url}/api/dead-events/retry-batch", json=payload, timeout=1)
+        response = api.post("/api/dead-events/retry-batch", json_body=payload)
 
         assert response.status_code == 400
         assert "error" in response.json()
 
-    def test_retry_dead_events_batch_no_repository(self, mock_repository):
+    def test_retry_dead_events_batch_no_repository(self, variant_servers):
         """Test retrying batch returns 404 when no repository (endpoint not registered)."""
-        port = find_free_port()
-        server = HttpServer(
-            host="127.0.0.1",
-            port=port,
-        )
-        server.start()
-        time.sleep(0.3)  # Wait for server to start
+        api = variant_servers["bare"]
+        payload = {"event_ids": [1, 2, 3]}
+        response = api.post("/api/dead-events/retry-batch", json_body=payload)
 
-        try:
-            base_url = f"http://127.0.0.1:{port}"
-            payload = {"event_ids": [1, 2, 3]}
-            response = requests.post(f"{base_url}/api/dead-events/retry-batch", json=payload, timeout=1)
+        # When repository_fn is not provided, DLQ endpoints are not registered, so 404
+        assert response.status_code == 404
 
-            # When repository_fn is not provided, DLQ endpoints are not registered, so 404
-            assert response.status_code == 404
-        finally:
-            server.stop()
+
+class TestConcurrentDeadEventsRequests:
+    """Tests for DLQ endpoints hit by several clients at once."""
+
+    def test_dlq_endpoints_concurrent(self, http_server, sample_dead_event):
+        """Test overlapping DLQ requests against the shared server all get correct answers."""
+        mock_repo, api = http_server
+        mock_repo.returns.update(
+            fetch_dead_events=[sample_dead_event],
+            count_dead_events=42,
+            get_dead_event=sample_dead_event,
+            retry_dead_event=True,
+            retry_dead_events_batch=3,
+        )
+        probes = [
+            ("GET", "/api/dead-events", None),
+            ("GET", "/api/dead-events?limit=50&offset=10", None),
+            ("GET", "/api/dead-events/stats", None),
+            ("GET", "/api/dead-events/stats?aggregate_type=order", None),
+            ("GET", "/api/dead-events/1", None),
+            ("GET", "/api/dead-events/2", None),
+            ("POST", "/api/dead-events/1/retry", None),
+            ("POST", "/api/dead-events/2/retry", None),
+            ("POST", "/api/dead-events/retry-batch", {"event_ids": [1, 2, 3]}),
+            ("POST", "/api/dead-events/retry-batch", {"event_ids": [4, 5, 6]}),
+        ]
+
+        # Stay under the server's listen backlog (5) so no connection waits for a SYN retry
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(api.request, method, path, json_body=body, timeout=2) for method, path, body in probes
+            ]
+            statuses = [future.result().status_code for future in futures]
+
+        assert statuses == [200] * len(probes)
+        assert len(mock_repo.calls) == len(probes)
 
 
 class TestErrorHandling:
@@ -516,12 +559,10 @@ class TestErrorHandling:
 
     def test_internal_server_error(self, http_server):
         """Test handling of internal server errors."""
-        import psycopg2
-
-        server, mock_repo, base_url = http_server
-        mock_repo.fetch_dead_events.side_effect = psycopg2.OperationalError("Database error")
+        mock_repo, api = http_server
+        mock_repo.errors["fetch_dead_events"] = psycopg2.OperationalError("Database error")
 
-        response = requests.get(f"{base_url}/api/dead-events", timeout=1)
+        response = api.get("/api/dead-events")
 
         assert response.status_code == 500
         assert response.headers.get("Content-Type") == "application/json"
@@ -531,9 +572,9 @@ class TestErrorHandling:
 
     def test_not_found_endpoint(self, http_server):
         """Test accessing non-existent endpoint returns 404 with JSON."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
-        response = requests.get(f"{base_url}/api/nonexistent", timeout=1)
+        response = api.get("/api/nonexistent")
 
         assert response.status_code == 404
         assert response.headers.get("Content-Type") == "application/json"
@@ -543,9 +584,9 @@ class TestErrorHandling:
 
     def test_not_found_simple_path(self, http_server):
         """Test accessing simple non-existent path returns 404 with JSON."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
-        response = requests.get(f"{base_url}/x", timeout=1)
+        response = api.get("/x")
 
         assert response.status_code == 404
         assert response.headers.get("Content-Type") == "application/json"
@@ -554,10 +595,10 @@ class TestErrorHandling:
 
     def test_method_not_allowed(self, http_server):
         """Test using wrong HTTP method returns 405 with JSON."""
-        server, mock_repo, base_url = http_server
+        mock_repo, api = http_server
 
         # POST to GET-only endpoint
-        response = requests.post(f"{base_url}/api/dead-events/stats", timeout=1)
+        response = api.post("/api/dead-events/stats")
 
         assert response.status_code == 405
         assert response.headers.get("Content-Type") == "application/json"
@@ -1,7 +1,9 @@
 """Tests for OutboxEvent model."""
 
 from datetime import datetime, timezone
+import sys
 
+from faker import Faker
 import pytest
 
 from dispatchbox.models import OutboxEvent
@@ -36,6 +38,11 @@ def test_from_dict_with_minimal_fields(sample_event_dict_minimal):
     assert event.created_at is None
 
 
+def test_from_row_matches_from_dict(sample_event_dict, sample_event_row):
+    """Test creating OutboxEvent from a tuple row in column order."""
+    assert OutboxEvent.from_row(sample_event_row) == OutboxEvent.from_dict(sample_event_dict)
+
+
 def test_from_dict_missing_next_run_at():
     """Test that ValueError is raised when next_run_at is missing."""
     data = {
@@ -95,43 +102,55 @@ def test_to_dict_without_optional_fields(sample_event_dict_minimal):
     assert result["status"] == "pending"
 
 
-def test_round_trip(sample_event_dict):
+def _random_event_dicts(count: int, seed: int = 20240101):
+    """Generate reproducible, varied event dictionaries for round-trip checks."""
+    fake = Faker()
+    fake.seed_instance(seed)
+    return [
+        {
+            "id": fake.random_int(1, 10**9) if fake.boolean() else None,
+            "aggregate_type": fake.pystr(min_chars=1, max_chars=30),
+            "aggregate_id": fake.pystr(min_chars=1, max_chars=30),
+            "event_type": fake.random_element(["order.created", "order.paid"]),
+            "payload": fake.pydict(nb_elements=fake.random_int(0, 5), value_types=[int]),
+            "status": fake.random_element(["pending", "retry", "done", "dead"]),
+            "attempts": fake.random_int(0, 100),
+            "next_run_at": fake.date_time(tzinfo=timezone.utc),
+            "created_at": fake.date_time(tzinfo=timezone.utc) if fake.boolean() else None,
+        }
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("event_dict", _random_event_dicts(50))
+def test_round_trip(event_dict):
     """Test round-trip conversion: dict -> OutboxEvent -> dict -> OutboxEvent."""
-    # First conversion
-    event1 = OutboxEvent.from_dict(sample_event_dict)
+    event1 = OutboxEvent.from_dict(event_dict)
     dict1 = event1.to_dict()
 
-    # Second conversion (need to ensure next_run_at is present)
+    # to_dict() serializes datetimes to ISO strings; put the originals back for from_dict()
     dict1["next_run_at"] = event1.next_run_at
+    if event1.created_at is not None:
+        dict1["created_at"] = event1.created_at
     event2 = OutboxEvent.from_dict(dict1)
-    dict2 = event2.to_dict()
 
-    # Compare key fields
-    assert event1.id == event2.id
-    assert event1.aggregate_type == event2.aggregate_type
-    assert event1.aggregate_id == event2.aggregate_id
-    assert event1.event_type == event2.event_type
-    assert event1.payload == event2.payload
-    assert event1.status == event2.status
-    assert event1.attempts == event2.attempts
+    assert event2 == event1
 
 
-def test_different_status_values():
+@pytest.mark.parametrize("status", ["pending", "retry", "done", "dead"])
+def test_different_status_values(status):
     """Test that different status values are accepted."""
-    statuses = ["pending", "retry", "done", "dead"]
-
-    for status in statuses:
-        data = {
-            "aggregate_type": "order",
-            "aggregate_id": "123",
-            "event_type": "order.created",
-            "payload": {},
-            "status": status,
-            "attempts": 0,
-            "next_run_at": datetime.now(timezone.utc),
-        }
-        event = OutboxEvent.from_dict(data)
-        assert event.status == status
+    data = {
+        "aggregate_type": "order",
+        "aggregate_id": "123",
+        "event_type": "order.created",
+        "payload": {},
+        "status": status,
+        "attempts": 0,
+        "next_run_at": datetime.now(timezone.utc),
+    }
+    event = OutboxEvent.from_dict(data)
+    assert event.status == status
 
 
 def test_event_with_high_attempts():
@@ -150,3 +169,10 @@ def test_event_with_high_attempts():
     event = OutboxEvent.from_dict(data)
     assert event.attempts == 5
     assert event.status == "retry"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_event_has_no_instance_dict(sample_event):
+    """Test OutboxEvent uses __slots__ instead of a per-instance __dict__."""
+    assert not hasattr(sample_event, "__dict__")
+    assert "payload" in OutboxEvent.__slots__
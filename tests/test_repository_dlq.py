@@ -53,24 +53,7 @@ def sample_dead_event_dict():
 def test_fetch_dead_events(mock_db_connection, mock_cursor, sample_dead_event_dict):
     """Test fetch_dead_events returns dead events."""
 
-    class MockRow:
-        def __init__(self, data):
-            self._data = data
-
-        def __getitem__(self, key):
-            return self._data[key]
-
-        def keys(self):
-            return self._data.keys()
-
-        def __iter__(self):
-            return iter(self._data)
-
-        def __contains__(self, key):
-            return key in self._data
-
-    mock_row = MockRow(sample_dead_event_dict)
-    mock_cursor.fetchall.return_value = [mock_row]
+    mock_cursor.fetchall.return_value = [tuple(sample_dead_event_dict.values())]
 
     repo = OutboxRepository("host=localhost dbname=test")
     events = repo.fetch_dead_events(limit=10, offset=0)
@@ -89,14 +72,38 @@ def test_fetch_dead_events_with_filters(mock_db_connection, mock_cursor):
     repo = OutboxRepository("host=localhost dbname=test")
     repo.fetch_dead_events(limit=10, offset=0, aggregate_type="order", event_type="order.created")
 
-    # Verify SQL contains filters (after SELECT 1 and SET timeout)
-    assert mock_cursor.execute.call_count >= 3
+    # Verify SQL contains filters in a single round trip
+    assert mock_cursor.execute.call_count == 1
     call_args = mock_cursor.execute.call_args_list[-1]
     sql = call_args[0][0]
     assert "aggregate_type" in sql
     assert "event_type" in sql
 
 
+@pytest.mark.parametrize(
+    "aggregate_type, event_type, params",
+    [
+        (None, None, (10, 0)),
+        ("order", None, ("order", 10, 0)),
+        (None, "order.created", ("order.created", 10, 0)),
+        ("order", "order.created", ("order", "order.created", 10, 0)),
+    ],
+)
+def test_fetch_dead_events_uses_prebuilt_filter_sql(
+    mock_db_connection, mock_cursor, aggregate_type, event_type, params
+):
+    """Test fetch_dead_events picks the prebuilt statement for its filter combination."""
+    mock_cursor.fetchall.return_value = []
+
+    repo = OutboxRepository("host=localhost dbname=test")
+    repo.fetch_dead_events(limit=10, offset=0, aggregate_type=aggregate_type, event_type=event_type)
+
+    sql, sent = mock_cursor.execute.call_args[0]
+    assert sql is OutboxRepository.FETCH_DEAD_EVENTS_SQL[(aggregate_type is not None, event_type is not None)]
+    assert sql.count("%s") == len(sent)
+    assert sent == params
+
+
 def test_fetch_dead_events_invalid_params(mock_db_connection):
     """Test fetch_dead_events with invalid parameters."""
     repo = OutboxRepository("host=localhost dbname=test")
@@ -111,82 +118,86 @@ def test_fetch_dead_events_invalid_params(mock_db_connection):
 def test_count_dead_events(mock_db_connection, mock_cursor):
     """Test count_dead_events returns count."""
 
-    class MockRow:
-        def __init__(self, count):
-            self._data = {"count": count}
+    mock_cursor.fetchone.return_value = (42,)
 
-        def __getitem__(self, key):
-            return self._data[key]
+    repo = OutboxRepository("host=localhost dbname=test")
+    count = repo.count_dead_events()
 
-        def keys(self):
-            return self._data.keys()
+    assert count == 42
 
-        def __iter__(self):
-            return iter(self._data)
 
-        def __contains__(self, key):
-            return key in self._data
+def test_count_dead_events_with_filters(mock_db_connection, mock_cursor):
+    """Test count_dead_events with filters."""
 
-    mock_cursor.fetchone.return_value = MockRow(42)
+    mock_cursor.fetchone.return_value = (5,)
 
     repo = OutboxRepository("host=localhost dbname=test")
-    count = repo.count_dead_events()
+    count = repo.count_dead_events(aggregate_type="order")
 
-    assert count == 42
+    assert count == 5
+    # Verify SQL contains filter in a single round trip
+    assert mock_cursor.execute.call_count == 1
+    call_args = mock_cursor.execute.call_args_list[-1]
+    sql = call_args[0][0]
+    assert "aggregate_type" in sql
 
 
-def test_count_dead_events_with_filters(mock_db_connection, mock_cursor):
-    """Test count_dead_events with filters."""
+def test_count_dead_events_reuses_recent_count(mock_db_connection, mock_cursor):
+    """Test count_dead_events caches counts per filter for DEAD_COUNT_CACHE_TTL seconds."""
+    mock_cursor.fetchone.return_value = (5,)
+    repo = OutboxRepository("host=localhost dbname=test")
 
-    class MockRow:
-        def __init__(self, count):
-            self._data = {"count": count}
+    with patch("dispatchbox.repository.time.monotonic", side_effect=[100.0, 100.5, 100.6, 101.5]):
+        assert repo.count_dead_events() == 5
+        assert repo.count_dead_events() == 5  # Cached
+        repo.count_dead_events(aggregate_type="order")  # Different filter
+        repo.count_dead_events()  # Expired
 
-        def __getitem__(self, key):
-            return self._data[key]
+    assert mock_cursor.execute.call_count == 3
 
-        def keys(self):
-            return self._data.keys()
 
-        def __iter__(self):
-            return iter(self._data)
+def test_count_dead_events_drops_expired_counts(mock_db_connection, mock_cursor):
+    """Test counts for filters that are not asked again are removed once they expire."""
+    mock_cursor.fetchone.return_value = (5,)
+    repo = OutboxRepository("host=localhost dbname=test")
+
+    with patch("dispatchbox.repository.time.monotonic", side_effect=[100.0, 100.5, 102.0]):
+        repo.count_dead_events(aggregate_type="a")
+        repo.count_dead_events(aggregate_type="b")
+        repo.count_dead_events(aggregate_type="c")
 
-        def __contains__(self, key):
-            return key in self._data
+    assert list(repo._dead_count_cache) == [("c", None)]
 
-    mock_cursor.fetchone.return_value = MockRow(5)
 
+def test_count_dead_events_bounds_cache_size(mock_db_connection, mock_cursor):
+    """Test many distinct filters within one TTL do not grow the cache past its limit."""
+    mock_cursor.fetchone.return_value = (5,)
     repo = OutboxRepository("host=localhost dbname=test")
-    count = repo.count_dead_events(aggregate_type="order")
 
-    assert count == 5
-    # Verify SQL contains filter (after SELECT 1 and SET timeout)
-    assert mock_cursor.execute.call_count >= 3
-    call_args = mock_cursor.execute.call_args_list[-1]
-    sql = call_args[0][0]
-    assert "aggregate_type" in sql
+    with patch("dispatchbox.repository.time.monotonic", return_value=100.0):
+        for i in range(OutboxRepository.DEAD_COUNT_CACHE_MAX_ENTRIES + 10):
+            repo.count_dead_events(event_type=f"type-{i}")
 
+    assert len(repo._dead_count_cache) <= OutboxRepository.DEAD_COUNT_CACHE_MAX_ENTRIES
 
-def test_get_dead_event(mock_db_connection, mock_cursor, sample_dead_event_dict):
-    """Test get_dead_event returns event if found."""
 
-    class MockRow:
-        def __init__(self, data):
-            self._data = data
+def test_retry_dead_event_drops_cached_counts(mock_db_connection, mock_cursor):
+    """Test retrying dead events invalidates cached counts."""
+    mock_cursor.fetchone.return_value = (5,)
+    mock_cursor.rowcount = 1
+    repo = OutboxRepository("host=localhost dbname=test")
 
-        def __getitem__(self, key):
-            return self._data[key]
+    repo.count_dead_events()
+    repo.retry_dead_event(1)
+    repo.count_dead_events()
 
-        def keys(self):
-            return self._data.keys()
+    assert mock_cursor.execute.call_count == 3
 
-        def __iter__(self):
-            return iter(self._data)
 
-        def __contains__(self, key):
-            return key in self._data
+def test_get_dead_event(mock_db_connection, mock_cursor, sample_dead_event_dict):
+    """Test get_dead_event returns event if found."""
 
-    mock_cursor.fetchone.return_value = MockRow(sample_dead_event_dict)
+    mock_cursor.fetchone.return_value = tuple(sample_dead_event_dict.values())
 
     repo = OutboxRepository("host=localhost dbname=test")
     event = repo.get_dead_event(1)
@@ -206,6 +217,20 @@ def test_get_dead_event_not_found(mock_db_connection, mock_cursor):
     assert event is None
 
 
+def test_get_dead_event_query_error_rolls_back(mock_db_connection, mock_cursor, sample_dead_event_dict):
+    """Test a failed query leaves the shared connection usable for the next request."""
+    mock_db_connection.closed = 0
+    mock_cursor.execute.side_effect = [psycopg2.errors.QueryCanceled("statement timeout"), None]
+    mock_cursor.fetchone.return_value = tuple(sample_dead_event_dict.values())
+
+    repo = OutboxRepository("host=localhost dbname=test")
+    with pytest.raises(psycopg2.OperationalError):
+        repo.get_dead_event(1)
+
+    mock_db_connection.rollback.assert_called_once()
+    assert repo.get_dead_event(1).id == 1
+
+
 def test_get_dead_event_invalid_id(mock_db_connection):
     """Test get_dead_event with invalid event_id."""
     repo = OutboxRepository("host=localhost dbname=test")
@@ -225,8 +250,8 @@ def test_retry_dead_event(mock_db_connection, mock_cursor):
     success = repo.retry_dead_event(123)
 
     assert success is True
-    # Verify UPDATE was called (after SELECT 1 and SET timeout)
-    assert mock_cursor.execute.call_count >= 3
+    # Verify UPDATE was called in a single round trip
+    assert mock_cursor.execute.call_count == 1
     call_args = mock_cursor.execute.call_args_list[-1]
     sql = call_args[0][0]
     assert "UPDATE" in sql
@@ -261,8 +286,8 @@ def test_retry_dead_events_batch(mock_db_connection, mock_cursor):
     count = repo.retry_dead_events_batch([1, 2, 3])
 
     assert count == 3
-    # Verify UPDATE was called with ANY clause (after SELECT 1 and SET timeout)
-    assert mock_cursor.execute.call_count >= 3
+    # Verify UPDATE was called with ANY clause in a single round trip
+    assert mock_cursor.execute.call_count == 1
     call_args = mock_cursor.execute.call_args_list[-1]
     sql = call_args[0][0]
     assert "UPDATE" in sql
@@ -289,3 +314,6 @@ def test_retry_dead_events_batch_invalid_ids(mock_db_connection):
 
     with pytest.raises(ValueError, match="All event_ids must be positive integers"):
         repo.retry_dead_events_batch([-1, 1, 2])
+
+    with pytest.raises(ValueError, match="All event_ids must be positive integers"):
+        repo.retry_dead_events_batch([1, None, 2])
@@ -1,17 +1,25 @@
 """Tests for supervisor module."""
 
 from multiprocessing import Event, Process
-from unittest.mock import MagicMock, Mock, patch
+import sys
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from dispatchbox.supervisor import start_processes, worker_loop
 
 
+@pytest.fixture(autouse=True)
+def no_signal_wakeup_fd(mocker):
+    """Keep signal.set_wakeup_fd from redirecting signals of the test process to a pipe."""
+    return mocker.patch("dispatchbox.supervisor.signal.set_wakeup_fd")
+
+
 def test_worker_loop_initializes_repository_and_worker(mocker):
     """Test worker_loop initializes repository and worker correctly."""
     mock_repository = MagicMock()
     mock_worker = MagicMock()
+    mock_worker.is_async = False
 
     with patch("dispatchbox.supervisor.OutboxRepository", return_value=mock_repository):
         with patch("dispatchbox.supervisor.OutboxWorker", return_value=mock_worker):
@@ -33,15 +41,39 @@ def test_worker_loop_initializes_repository_and_worker(mocker):
 
             # Check that repository and worker were created
             mock_repository.__enter__.assert_called()
+            mock_repository.listen.assert_called_once()
+            mock_repository.prepare_statements.assert_called_once()
             mock_worker.run_loop.assert_called()
 
 
+def test_worker_loop_runs_async_loop_for_coroutine_handlers(mocker):
+    """Test worker_loop drives run_loop_async on an event loop when handlers are coroutines."""
+    mock_repository = MagicMock()
+    mock_worker = MagicMock()
+    mock_worker.is_async = True
+    mock_worker.run_loop_async = AsyncMock()
+
+    with patch("dispatchbox.supervisor.OutboxRepository", return_value=mock_repository):
+        with patch("dispatchbox.supervisor.OutboxWorker", return_value=mock_worker):
+            worker_loop(
+                dsn="host=localhost dbname=test",
+                stop_event=Event(),
+                batch_size=10,
+                poll_interval=1.0,
+                worker_name="worker-0",
+            )
+
+    mock_worker.run_loop_async.assert_awaited_once()
+    mock_worker.run_loop.assert_not_called()
+
+
 def test_worker_loop_uses_context_manager(mocker):
     """Test worker_loop uses repository as context manager."""
     import signal
 
     mock_repository = MagicMock()
     mock_worker = MagicMock()
+    mock_worker.is_async = False
 
     with patch("dispatchbox.supervisor.OutboxRepository", return_value=mock_repository):
         with patch("dispatchbox.supervisor.OutboxWorker", return_value=mock_worker):
@@ -65,8 +97,9 @@ def test_worker_loop_uses_context_manager(mocker):
             mock_repository.__exit__.assert_called()
 
 
-def test_worker_signal_handler(mocker):
-    """Test worker signal handler sets stop event."""
+def test_worker_signal_handler(mocker, no_signal_wakeup_fd):
+    """Test worker signal handler sets stop event without logging from the handler."""
+    import os
     import signal
 
     from dispatchbox.supervisor import _setup_worker_signal_handlers
@@ -74,21 +107,22 @@ def test_worker_signal_handler(mocker):
     stop_event = Event()
 
     with patch("dispatchbox.supervisor.logger") as mock_logger:
-        # Setup signal handlers
-        _setup_worker_signal_handlers(stop_event, "worker-0")
+        with patch("dispatchbox.supervisor.signal.signal") as mock_signal:
+            read_fd = _setup_worker_signal_handlers(stop_event)
+        write_fd = no_signal_wakeup_fd.call_args[0][0]
+        os.close(read_fd)
+        os.close(write_fd)
 
         # Get the signal handler that was registered
-        handler = signal.signal(signal.SIGTERM, signal.SIG_DFL)
-        signal.signal(signal.SIGTERM, handler)
+        handler = mock_signal.call_args_list[0][0][1]
 
         # Call the handler directly with a mock frame
-        mock_frame = Mock()
-        handler(signal.SIGTERM, mock_frame)
+        handler(signal.SIGTERM, Mock())
 
         # Verify stop_event was set
         assert stop_event.is_set()
-        # Verify logger was called (may be called during handler execution)
-        # The exact call count depends on implementation
+        # Logging inside a signal handler can deadlock on the logger lock
+        mock_logger.info.assert_not_called()
 
 
 def test_wait_for_processes_handles_keyboard_interrupt(mocker):
@@ -103,9 +137,11 @@ def test_wait_for_processes_handles_keyboard_interrupt(mocker):
     stop_event = Event()
 
     with patch("dispatchbox.supervisor.logger") as mock_logger:
-        with patch("dispatchbox.supervisor.time.sleep", side_effect=KeyboardInterrupt()):
-            # _wait_for_processes catches KeyboardInterrupt, so it won't raise
-            _wait_for_processes(children, stop_event)
+        with patch("dispatchbox.supervisor.connection.wait", side_effect=KeyboardInterrupt()):
+            # Force the portable sentinel path
+            with patch("dispatchbox.supervisor.os.pidfd_open", side_effect=OSError("not supported"), create=True):
+                # _wait_for_processes catches KeyboardInterrupt, so it won't raise
+                _wait_for_processes(children, stop_event)
 
             # Verify logger was called with KeyboardInterrupt message
             mock_logger.info.assert_called()
@@ -119,62 +155,162 @@ def test_wait_for_processes_handles_keyboard_interrupt(mocker):
             mock_process.join.assert_called()
 
 
+def test_wait_for_exit_pidfd_joins_children_when_pidfd_ready(mocker):
+    """Test _wait_for_exit_pidfd blocks on pidfds and joins each child once it exits."""
+    import os
+
+    from dispatchbox.supervisor import _wait_for_exit_pidfd
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"x")  # A readable pidfd means the child has exited
+
+    mock_process = MagicMock()
+    mock_process.is_alive.return_value = True
+    mock_process.pid = 12345
+
+    try:
+        with patch("dispatchbox.supervisor.os.pidfd_open", return_value=read_fd, create=True) as mock_pidfd_open:
+            assert _wait_for_exit_pidfd([mock_process], Event()) is True
+
+        mock_pidfd_open.assert_called_once_with(12345)
+        mock_process.join.assert_called_once()
+        # The pidfd is closed once the child has been reaped
+        with pytest.raises(OSError):
+            os.fstat(read_fd)
+    finally:
+        os.close(write_fd)
+
+
+def test_wait_for_exit_pidfd_returns_false_when_unsupported(mocker):
+    """Test _wait_for_exit_pidfd reports unsupported platforms so the caller can fall back."""
+    from dispatchbox.supervisor import _wait_for_exit_pidfd
+
+    mock_process = MagicMock()
+    mock_process.is_alive.return_value = True
+    mock_process.pid = 12345
+
+    with patch("dispatchbox.supervisor.os.pidfd_open", side_effect=OSError("not supported"), create=True):
+        assert _wait_for_exit_pidfd([mock_process], Event()) is False
+
+    mock_process.join.assert_not_called()
+
+
+def test_wait_for_exit_pidfd_skips_exited_children(mocker):
+    """Test _wait_for_exit_pidfd does not open pidfds for children that already exited."""
+    from dispatchbox.supervisor import _wait_for_exit_pidfd
+
+    mock_process = MagicMock()
+    mock_process.is_alive.return_value = False
+
+    with patch("dispatchbox.supervisor.os.pidfd_open", create=True) as mock_pidfd_open:
+        assert _wait_for_exit_pidfd([mock_process], Event()) is True
+
+    mock_pidfd_open.assert_not_called()
+
+
+def test_wait_for_exit_sentinels_joins_exited_children(mocker):
+    """Test _wait_for_exit_sentinels blocks on sentinels and joins each exited child."""
+    from dispatchbox.supervisor import _wait_for_exit_sentinels
+
+    first = MagicMock()
+    first.is_alive.return_value = True
+    first.sentinel = 10
+    second = MagicMock()
+    second.is_alive.return_value = True
+    second.sentinel = 11
+
+    with patch("dispatchbox.supervisor.connection.wait", side_effect=[[10], [11]]) as mock_wait:
+        _wait_for_exit_sentinels([first, second], Event())
+
+    assert mock_wait.call_count == 2
+    assert mock_wait.call_args_list[0][0][0] == [10, 11]
+    assert mock_wait.call_args_list[1][0][0] == [11]
+    first.join.assert_called_once()
+    second.join.assert_called_once()
+
+
 def test_setup_signal_handlers_calls_signal_handler(mocker):
-    """Test _setup_signal_handlers signal handler is called."""
+    """Test _setup_signal_handlers installs a handler that only sets the stop event."""
+    import os
     import signal
 
     from dispatchbox.supervisor import _setup_signal_handlers
 
-    mock_process = MagicMock()
-    mock_process.join = Mock()
-    children = [mock_process]
     stop_event = Event()
 
-    with patch("dispatchbox.supervisor.logger") as mock_logger:
+    with patch("dispatchbox.supervisor.signal.set_wakeup_fd") as mock_set_wakeup_fd:
         with patch("dispatchbox.supervisor.signal.signal") as mock_signal:
-            with patch("dispatchbox.supervisor.sys.exit") as mock_exit:
-                _setup_signal_handlers(stop_event, children)
+            read_fd = _setup_signal_handlers(stop_event)
 
-                # Get the handler that was registered (second argument of signal.signal call)
-                handler = mock_signal.call_args_list[0][0][1]
+    write_fd = mock_set_wakeup_fd.call_args[0][0]
+    try:
+        # Get the handler that was registered (second argument of signal.signal call)
+        handler = mock_signal.call_args_list[0][0][1]
+        handler(signal.SIGTERM, Mock())
 
-                # Call the handler directly - it will call sys.exit(0)
-                mock_frame = Mock()
-                handler(signal.SIGTERM, mock_frame)
+        # The handler must not block or exit; it only flags the shutdown
+        assert stop_event.is_set()
+        assert not os.get_blocking(write_fd)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
 
-                # Verify logger was called
-                mock_logger.info.assert_called()
-                assert "Parent received signal" in mock_logger.info.call_args[0][0]
 
-                # Verify stop_event was set
-                assert stop_event.is_set()
+def test_drain_wakeup_fd_logs_signals_and_sets_stop_event(mocker):
+    """Test _drain_wakeup_fd consumes queued signal numbers and stops the workers."""
+    import os
+    import signal
 
-                # Verify join was called
-                mock_process.join.assert_called()
+    from dispatchbox.supervisor import _drain_wakeup_fd
 
-                # Verify sys.exit was called
-                mock_exit.assert_called_once_with(0)
-    mock_repository = MagicMock()
-    mock_worker = MagicMock()
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.write(write_fd, bytes([signal.SIGTERM]))
+    stop_event = Event()
 
-    with patch("dispatchbox.supervisor.OutboxRepository", return_value=mock_repository):
-        with patch("dispatchbox.supervisor.OutboxWorker", return_value=mock_worker):
-            stop_event = Event()
-            stop_event.set()
+    try:
+        with patch("dispatchbox.supervisor.logger") as mock_logger:
+            _drain_wakeup_fd(read_fd, stop_event)
 
-            mock_worker.run_loop = Mock()
+        assert stop_event.is_set()
+        assert "Parent received signal" in mock_logger.info.call_args[0][0]
+        assert mock_logger.info.call_args[0][1] == signal.SIGTERM
+        # Pipe is empty afterwards
+        with pytest.raises(BlockingIOError):
+            os.read(read_fd, 1)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_wait_for_exit_pidfd_keeps_waiting_after_signal(mocker):
+    """Test _wait_for_exit_pidfd handles a signal wakeup and still reaps the child."""
+    import os
+    import signal
 
-            worker_loop(
-                dsn="host=localhost dbname=test",
-                stop_event=stop_event,
-                batch_size=10,
-                poll_interval=1.0,
-                worker_name="worker-0",
-            )
+    from dispatchbox.supervisor import _wait_for_exit_pidfd
 
-            # Repository should be used as context manager
-            mock_repository.__enter__.assert_called()
-            mock_repository.__exit__.assert_called()
+    pid_read, pid_write = os.pipe()
+    wake_read, wake_write = os.pipe()
+    os.set_blocking(wake_read, False)
+    os.write(wake_write, bytes([signal.SIGINT]))
+    os.write(pid_write, b"x")
+
+    mock_process = MagicMock()
+    mock_process.is_alive.return_value = True
+    mock_process.pid = 12345
+    stop_event = Event()
+
+    try:
+        with patch("dispatchbox.supervisor.os.pidfd_open", return_value=pid_read, create=True):
+            assert _wait_for_exit_pidfd([mock_process], stop_event, wake_read) is True
+
+        assert stop_event.is_set()
+        mock_process.join.assert_called_once()
+    finally:
+        os.close(pid_write)
+        os.close(wake_read)
+        os.close(wake_write)
 
 
 def test_start_processes_creates_processes(mocker):
@@ -183,26 +319,18 @@ def test_start_processes_creates_processes(mocker):
     mock_process.is_alive.return_value = False  # Process exits immediately
     mock_process.pid = 12345
 
-    with patch("dispatchbox.supervisor.Process", return_value=mock_process):
-        with patch("dispatchbox.supervisor.signal.signal"):  # Mock signal handlers
-            with patch("dispatchbox.supervisor.time.sleep"):  # Mock sleep in wait loop
-                # Use threading.Event instead of multiprocessing.Event for testing
-                import threading
-
-                stop_event = threading.Event()
-                stop_event.set()  # Stop immediately
-
-                # Mock the wait loop to exit quickly
-                with patch("dispatchbox.supervisor.any", return_value=False):
-                    start_processes(
-                        dsn="host=localhost dbname=test",
-                        num_processes=3,
-                        batch_size=10,
-                        poll_interval=1.0,
-                    )
+    with patch("dispatchbox.supervisor._MP_CONTEXT.Process", return_value=mock_process):
+        with patch("dispatchbox.supervisor.signal.signal"):
+            # Children report as exited, so the wait returns immediately
+            start_processes(
+                dsn="host=localhost dbname=test",
+                num_processes=3,
+                batch_size=10,
+                poll_interval=1.0,
+            )
 
-                # Check that Process was called 3 times
-                assert mock_process.start.call_count == 3
+            # Check that Process was called 3 times
+            assert mock_process.start.call_count == 3
 
 
 def test_start_processes_sets_signal_handlers(mocker):
@@ -213,18 +341,16 @@ def test_start_processes_sets_signal_handlers(mocker):
 
     mock_signal = mocker.patch("dispatchbox.supervisor.signal.signal")
 
-    with patch("dispatchbox.supervisor.Process", return_value=mock_process):
-        with patch("dispatchbox.supervisor.time.sleep"):
-            with patch("dispatchbox.supervisor.any", return_value=False):
-                start_processes(
-                    dsn="host=localhost dbname=test",
-                    num_processes=1,
-                    batch_size=10,
-                    poll_interval=1.0,
-                )
+    with patch("dispatchbox.supervisor._MP_CONTEXT.Process", return_value=mock_process):
+        start_processes(
+            dsn="host=localhost dbname=test",
+            num_processes=1,
+            batch_size=10,
+            poll_interval=1.0,
+        )
 
-                # Should set signal handlers for SIGINT and SIGTERM
-                assert mock_signal.call_count >= 2
+        # Should set signal handlers for SIGINT and SIGTERM
+        assert mock_signal.call_count >= 2
 
 
 def test_start_processes_with_custom_parameters(mocker):
@@ -232,22 +358,85 @@ def test_start_processes_with_custom_parameters(mocker):
     mock_process = MagicMock(spec=Process)
     mock_process.is_alive.return_value = False
 
-    with patch("dispatchbox.supervisor.Process", return_value=mock_process) as mock_process_class:
+    with patch("dispatchbox.supervisor._MP_CONTEXT.Process", return_value=mock_process) as mock_process_class:
         with patch("dispatchbox.supervisor.signal.signal"):
-            with patch("dispatchbox.supervisor.time.sleep"):
-                with patch("dispatchbox.supervisor.any", return_value=False):
-                    start_processes(
-                        dsn="host=localhost dbname=test",
-                        num_processes=2,
-                        batch_size=20,
-                        poll_interval=2.0,
-                        max_parallel=15,
-                        retry_backoff_seconds=60,
-                    )
-
-                    # Check that Process was created with correct target
-                    calls = mock_process_class.call_args_list
-                    assert len(calls) == 2
-                    # Check that worker_loop is the target
-                    for call in calls:
-                        assert call[1]["target"] is worker_loop
+            start_processes(
+                dsn="host=localhost dbname=test",
+                num_processes=2,
+                batch_size=20,
+                poll_interval=2.0,
+                max_parallel=15,
+                retry_backoff_seconds=60,
+            )
+
+            # Check that Process was created with correct target
+            calls = mock_process_class.call_args_list
+            assert len(calls) == 2
+            # Check that worker_loop is the target
+            for call in calls:
+                assert call[1]["target"] is worker_loop
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork is only pinned on Linux")
+def test_worker_processes_use_fork_context_on_linux():
+    """Test workers are forked on Linux so they reuse the parent's imports and logging setup."""
+    from dispatchbox.supervisor import _MP_CONTEXT
+
+    assert _MP_CONTEXT.get_start_method() == "fork"
+
+
+def test_start_processes_passes_cpu_index_when_pinning(mocker):
+    """Test each worker gets its index as CPU slot only when pinning is requested."""
+    mock_process = MagicMock(spec=Process)
+    mock_process.is_alive.return_value = False
+
+    with patch("dispatchbox.supervisor._MP_CONTEXT.Process", return_value=mock_process) as mock_process_class:
+        with patch("dispatchbox.supervisor.signal.signal"):
+            start_processes(
+                dsn="host=localhost dbname=test", num_processes=2, batch_size=10, poll_interval=1.0, pin_cpus=True
+            )
+
+    assert [call[1]["args"][-1] for call in mock_process_class.call_args_list] == [0, 1]
+
+
+def test_pin_to_cpu_uses_allowed_cpus_round_robin(mocker):
+    """Test _pin_to_cpu picks from the inherited affinity mask and wraps around."""
+    from dispatchbox.supervisor import _pin_to_cpu
+
+    mocker.patch("dispatchbox.supervisor.os.sched_getaffinity", return_value={2, 5}, create=True)
+    mock_setaffinity = mocker.patch("dispatchbox.supervisor.os.sched_setaffinity", create=True)
+
+    _pin_to_cpu(3)
+
+    mock_setaffinity.assert_called_once_with(0, {5})
+
+
+def test_pin_to_cpu_ignores_unsupported_platform(mocker):
+    """Test _pin_to_cpu logs and continues when affinity cannot be set."""
+    from dispatchbox.supervisor import _pin_to_cpu
+
+    mocker.patch("dispatchbox.supervisor.os.sched_getaffinity", side_effect=OSError("denied"), create=True)
+
+    with patch("dispatchbox.supervisor.logger") as mock_logger:
+        _pin_to_cpu(0)
+
+    mock_logger.warning.assert_called_once()
+
+
+def _set_flag(flag):
+    flag.set()
+
+
+def test_stop_flag_is_shared_with_child_processes():
+    """Test StopFlag set in a child process is visible to the parent."""
+    from dispatchbox.supervisor import _MP_CONTEXT, StopFlag
+
+    flag = StopFlag()
+    assert flag.is_set() is False
+
+    child = _MP_CONTEXT.Process(target=_set_flag, args=(flag,))
+    child.start()
+    child.join(timeout=10)
+
+    assert child.exitcode == 0
+    assert flag.is_set() is True
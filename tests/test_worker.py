@@ -2,6 +2,7 @@
 
 from concurrent.futures import Future, ThreadPoolExecutor
 from multiprocessing import Event
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -17,6 +18,7 @@ def test_worker_init_with_repository(mock_repository):
         batch_size=10,
         poll_interval=1.0,
         max_parallel=5,
+        handlers={"order.created": Mock()},
         repository=mock_repository,
     )
 
@@ -61,6 +63,7 @@ def test_worker_init_with_default_handlers(mock_repository):
     )
 
     assert worker.handlers == HANDLERS
+    assert worker.is_async is True
 
 
 def test_process_event_success(mock_repository, sample_event):
@@ -105,6 +108,32 @@ def test_process_event_handler_not_found(mock_repository):
         worker.process_event(event)
 
 
+def test_worker_uses_slots(mock_repository):
+    """Test OutboxWorker has a fixed attribute layout."""
+    worker = OutboxWorker(batch_size=10, poll_interval=1.0, repository=mock_repository)
+
+    assert not hasattr(worker, "__dict__")
+    with pytest.raises(AttributeError):
+        worker.unknown_attribute = 1
+
+
+def test_process_and_tag_reports_outcome_with_event_id(mock_repository, sample_event):
+    """Test _process_and_tag returns the event ID with None on success or the raised exception."""
+    error = RuntimeError("boom")
+    ok_worker = OutboxWorker(
+        batch_size=10, poll_interval=1.0, handlers={sample_event.event_type: Mock()}, repository=mock_repository
+    )
+    failing_worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=1.0,
+        handlers={sample_event.event_type: Mock(side_effect=error)},
+        repository=mock_repository,
+    )
+
+    assert ok_worker._process_and_tag(sample_event) == (sample_event.id, None)
+    assert failing_worker._process_and_tag(sample_event) == (sample_event.id, error)
+
+
 def test_run_loop_fetches_and_processes_events(mock_repository, sample_event):
     """Test run_loop fetches events and processes them."""
     # Setup repository to return events, then empty list to stop loop
@@ -116,7 +145,7 @@ def test_run_loop_fetches_and_processes_events(mock_repository, sample_event):
 
     # Mock executor to execute immediately
     mock_future = Future()
-    mock_future.set_result(None)
+    mock_future.set_result((sample_event.id, None))
 
     stop_event = Event()
 
@@ -133,11 +162,11 @@ def test_run_loop_fetches_and_processes_events(mock_repository, sample_event):
     def stop_after_first(*args, **kwargs):
         stop_event.set()
 
-    with patch("dispatchbox.worker.time.sleep", side_effect=stop_after_first):
-        worker.run_loop()
+    mock_repository.wait_for_event.side_effect = stop_after_first
+    worker.run_loop()
 
     mock_repository.fetch_pending.assert_called()
-    mock_repository.mark_success.assert_called_once_with(sample_event.id)
+    mock_repository.mark_success_many.assert_called_once_with([sample_event.id])
 
 
 def test_run_loop_mark_success_on_success(mock_repository, sample_event):
@@ -160,17 +189,18 @@ def test_run_loop_mark_success_on_success(mock_repository, sample_event):
 
     # Mock executor to return successful future
     mock_future = Future()
-    mock_future.set_result(None)
+    mock_future.set_result((sample_event.id, None))
     worker.executor.submit = Mock(return_value=mock_future)
 
     def stop_after_first(*args, **kwargs):
         stop_event.set()
 
-    with patch("dispatchbox.worker.time.sleep", side_effect=stop_after_first):
-        worker.run_loop()
+    mock_repository.wait_for_event.side_effect = stop_after_first
+    worker.run_loop()
 
-    mock_repository.mark_success.assert_called_once_with(sample_event.id)
-    mock_repository.mark_retry.assert_not_called()
+    mock_repository.mark_success_many.assert_called_once_with([sample_event.id])
+    mock_repository.mark_retry_many.assert_not_called()
+    mock_repository.flush.assert_called_once()
 
 
 def test_run_loop_mark_retry_on_error(mock_repository, sample_event):
@@ -191,19 +221,19 @@ def test_run_loop_mark_retry_on_error(mock_repository, sample_event):
         stop_event=stop_event,
     )
 
-    # Mock executor to return failed future
+    # Mock executor to return a result tagged with the handler error
     mock_future = Future()
-    mock_future.set_exception(Exception("Handler error"))
+    mock_future.set_result((sample_event.id, Exception("Handler error")))
     worker.executor.submit = Mock(return_value=mock_future)
 
     def stop_after_first(*args, **kwargs):
         stop_event.set()
 
-    with patch("dispatchbox.worker.time.sleep", side_effect=stop_after_first):
-        worker.run_loop()
+    mock_repository.wait_for_event.side_effect = stop_after_first
+    worker.run_loop()
 
-    mock_repository.mark_retry.assert_called_once_with(sample_event.id)
-    mock_repository.mark_success.assert_not_called()
+    mock_repository.mark_retry_many.assert_called_once_with([sample_event.id])
+    mock_repository.mark_success_many.assert_not_called()
 
 
 def test_run_loop_skips_event_without_id(mock_repository):
@@ -227,13 +257,14 @@ def test_run_loop_skips_event_without_id(mock_repository):
     worker = OutboxWorker(
         batch_size=10,
         poll_interval=1.0,
+        handlers={"order.created": Mock()},
         repository=mock_repository,
         stop_event=stop_event,
     )
 
     # Mock executor to return a future that will be processed
     mock_future = Future()
-    mock_future.set_result(None)
+    mock_future.set_result((None, None))
     worker.executor.submit = Mock(return_value=mock_future)
 
     with patch("dispatchbox.worker.logger") as mock_logger:
@@ -241,8 +272,8 @@ def test_run_loop_skips_event_without_id(mock_repository):
         def stop_after_first(*args, **kwargs):
             stop_event.set()
 
-        with patch("dispatchbox.worker.time.sleep", side_effect=stop_after_first):
-            worker.run_loop()
+        mock_repository.wait_for_event.side_effect = stop_after_first
+        worker.run_loop()
 
         # Should log error about missing ID (logger.error is called in run_loop when event_id is None)
         # The error is logged at line 97 in worker.py
@@ -250,13 +281,13 @@ def test_run_loop_skips_event_without_id(mock_repository):
         error_message = mock_logger.error.call_args[0][0]
         assert "no ID" in error_message.lower() or "has no ID" in error_message or "Event has no ID" in error_message
 
-    # Should not call mark_success or mark_retry
-    mock_repository.mark_success.assert_not_called()
-    mock_repository.mark_retry.assert_not_called()
+    # Should not mark anything
+    mock_repository.mark_success_many.assert_not_called()
+    mock_repository.mark_retry_many.assert_not_called()
 
 
-def test_run_loop_sleeps_when_no_events(mock_repository):
-    """Test run_loop sleeps when no events are available."""
+def test_run_loop_waits_for_event_when_no_events(mock_repository):
+    """Test run_loop waits for a new event notification when no events are available."""
     mock_repository.fetch_pending.return_value = []
 
     stop_event = Event()
@@ -270,17 +301,35 @@ def test_run_loop_sleeps_when_no_events(mock_repository):
 
     call_count = 0
 
-    def stop_after_sleep(*args, **kwargs):
+    def stop_after_wait(*args, **kwargs):
         nonlocal call_count
         call_count += 1
         if call_count >= 1:
             stop_event.set()
 
-    with patch("dispatchbox.worker.time.sleep", side_effect=stop_after_sleep) as mock_sleep:
-        worker.run_loop()
+    mock_repository.wait_for_event.side_effect = stop_after_wait
+    worker.run_loop()
 
-    # Should sleep when no events
-    mock_sleep.assert_called_with(1.0)
+    # Should wait up to poll_interval when no events
+    mock_repository.wait_for_event.assert_called_with(1.0, None)
+
+
+def test_run_loop_passes_wakeup_fd_to_idle_wait(mock_repository):
+    """Test run_loop lets a signal wakeup pipe interrupt the idle wait."""
+    mock_repository.fetch_pending.return_value = []
+    stop_event = Event()
+    mock_repository.wait_for_event.side_effect = lambda *args: stop_event.set()
+
+    worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=5.0,
+        repository=mock_repository,
+        stop_event=stop_event,
+        wakeup_fd=9,
+    )
+    worker.run_loop()
+
+    mock_repository.wait_for_event.assert_called_once_with(5.0, 9)
 
 
 def test_run_loop_processes_multiple_events(mock_repository, sample_event):
@@ -314,9 +363,9 @@ def test_run_loop_processes_multiple_events(mock_repository, sample_event):
 
     # Mock executor to return successful futures
     mock_future1 = Future()
-    mock_future1.set_result(None)
+    mock_future1.set_result((sample_event.id, None))
     mock_future2 = Future()
-    mock_future2.set_result(None)
+    mock_future2.set_result((event2.id, None))
 
     call_count = 0
 
@@ -332,8 +381,244 @@ def test_run_loop_processes_multiple_events(mock_repository, sample_event):
     def stop_after_first(*args, **kwargs):
         stop_event.set()
 
-    with patch("dispatchbox.worker.time.sleep", side_effect=stop_after_first):
-        worker.run_loop()
+    mock_repository.wait_for_event.side_effect = stop_after_first
+    worker.run_loop()
+
+    # Should mark both events as success in one statement and commit them together
+    mock_repository.mark_success_many.assert_called_once()
+    assert sorted(mock_repository.mark_success_many.call_args[0][0]) == sorted([sample_event.id, event2.id])
+    mock_repository.flush.assert_called_once()
+
+
+def _make_event(event_id):
+    return OutboxEvent(
+        id=event_id,
+        aggregate_type="order",
+        aggregate_id=str(event_id),
+        event_type="order.created",
+        payload={"orderId": event_id},
+        status="pending",
+        attempts=0,
+        next_run_at=Mock(),
+    )
+
+
+def test_run_loop_tops_up_while_events_in_flight(mock_repository):
+    """Test run_loop fetches the next batch before the slow events of the current one finish."""
+    release = threading.Event()
+
+    def handler(payload):
+        if payload["orderId"] in (2, 4):
+            assert release.wait(timeout=5)
+
+    stop_event = Event()
+
+    def fetch(limit, exclude_ids=None):
+        if mock_repository.fetch_pending.call_count == 1:
+            return [_make_event(1), _make_event(2), _make_event(4)]
+        if mock_repository.fetch_pending.call_count == 2:
+            # Top-up while events 2 and 4 are still blocked in their handlers
+            release.set()
+            return [_make_event(3)]
+        stop_event.set()
+        return []
+
+    mock_repository.fetch_pending.side_effect = fetch
+
+    worker = OutboxWorker(
+        batch_size=3,
+        poll_interval=1.0,
+        max_parallel=2,
+        handlers={"order.created": handler},
+        repository=mock_repository,
+        stop_event=stop_event,
+    )
+    worker.run_loop()
+
+    second_call = mock_repository.fetch_pending.call_args_list[1]
+    assert sorted(second_call.kwargs["exclude_ids"]) == [2, 4]
+    marked = [event_id for c in mock_repository.mark_success_many.call_args_list for event_id in c[0][0]]
+    assert sorted(marked) == [1, 2, 3, 4]
+    mock_repository.flush.assert_called()
+
+
+def test_run_loop_drains_in_flight_events_on_stop(mock_repository):
+    """Test run_loop finishes submitted events before exiting on stop."""
+    stop_event = Event()
+
+    def handler(payload):
+        stop_event.set()
+
+    mock_repository.fetch_pending.side_effect = [[_make_event(1), _make_event(2)]]
+
+    worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=1.0,
+        max_parallel=2,
+        handlers={"order.created": handler},
+        repository=mock_repository,
+        stop_event=stop_event,
+    )
+    worker.run_loop()
+
+    mock_repository.mark_success_many.assert_called_once()
+    assert sorted(mock_repository.mark_success_many.call_args[0][0]) == [1, 2]
+    mock_repository.fetch_pending.assert_called_once()
+    mock_repository.flush.assert_called_once()
+
+
+def test_worker_detects_coroutine_handlers(mock_repository):
+    """Test is_async is set only when every handler is a coroutine function."""
+
+    async def async_handler(payload):
+        pass
+
+    def sync_handler(payload):
+        pass
+
+    async_worker = OutboxWorker(
+        batch_size=10, poll_interval=1.0, handlers={"a": async_handler}, repository=mock_repository
+    )
+    mixed_worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=1.0,
+        handlers={"a": async_handler, "b": sync_handler},
+        repository=mock_repository,
+    )
+
+    assert async_worker.is_async is True
+    assert mixed_worker.is_async is False
+    # Only workers that may run on the thread pool create one
+    assert async_worker.executor is None
+    assert isinstance(mixed_worker.executor, ThreadPoolExecutor)
+
+
+def test_coroutine_handler_in_mixed_registry_runs_on_thread_pool(mock_repository):
+    """Test a coroutine handler outside run_loop_async is awaited, and its failure becomes a retry."""
+    ran = []
+
+    async def async_handler(payload):
+        ran.append(payload["orderId"])
+        if payload["orderId"] == 2:
+            raise RuntimeError("boom")
+
+    stop_event = Event()
+    mock_repository.fetch_pending.side_effect = [[_make_event(1), _make_event(2)], []]
+    mock_repository.wait_for_event.side_effect = lambda *args, **kwargs: stop_event.set()
+
+    worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=1.0,
+        max_parallel=2,
+        handlers={"order.created": async_handler, "other": lambda payload: None},
+        repository=mock_repository,
+        stop_event=stop_event,
+    )
+    worker.run_loop()
+
+    assert sorted(ran) == [1, 2]
+    mock_repository.mark_many.assert_called_once_with([1], [2])
+
+
+def test_coroutine_handler_runs_inline(mock_repository, sample_event):
+    """Test process_event awaits a coroutine handler when called synchronously."""
+    ran = []
+
+    async def async_handler(payload):
+        ran.append(payload)
+
+    worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=1.0,
+        max_parallel=1,
+        handlers={"order.created": async_handler},
+        repository=mock_repository,
+    )
+    worker.process_event(sample_event)
+
+    assert ran == [sample_event.payload]
+
+
+def test_run_loop_async_dispatches_batch_with_bounded_concurrency(mock_repository):
+    """Test run_loop_async awaits handlers concurrently, capped at max_parallel, and records outcomes."""
+    import asyncio
+
+    active = 0
+    peak = 0
+
+    async def handler(payload):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if payload["orderId"] == 3:
+            raise RuntimeError("boom")
+
+    stop_event = Event()
+    mock_repository.fetch_pending.side_effect = [[_make_event(i) for i in range(1, 6)], []]
+
+    def stop_after_first(*args, **kwargs):
+        stop_event.set()
+
+    mock_repository.wait_for_event.side_effect = stop_after_first
+
+    worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=1.0,
+        max_parallel=2,
+        handlers={"order.created": handler},
+        repository=mock_repository,
+        stop_event=stop_event,
+    )
+    asyncio.run(worker.run_loop_async())
+
+    assert peak == 2
+    success_ids, retry_ids = mock_repository.mark_many.call_args[0]
+    assert sorted(success_ids) == [1, 2, 4, 5]
+    assert retry_ids == [3]
+    mock_repository.flush.assert_called_once()
+
+
+def test_failure_logs_short_error_and_traceback_at_debug(mock_repository):
+    """Test a failed event logs type and message at ERROR and leaves the traceback to DEBUG."""
+    error = ValueError("bad payload")
+
+    with patch("dispatchbox.worker.logger") as mock_logger:
+        OutboxWorker._log_failure(42, error)
+
+    mock_logger.error.assert_called_once_with("Error processing event {}: {}: {}", 42, "ValueError", error)
+    mock_logger.opt.assert_called_once_with(exception=error)
+    mock_logger.opt.return_value.debug.assert_called_once()
+
+
+def test_worker_runs_inline_without_executor_when_max_parallel_is_one(mock_repository):
+    """Test max_parallel=1 processes events in order on the calling thread."""
+    calling_thread = threading.get_ident()
+    seen = []
+
+    def handler(payload):
+        seen.append((payload["orderId"], threading.get_ident()))
+        if payload["orderId"] == 2:
+            raise RuntimeError("boom")
+
+    stop_event = Event()
+    mock_repository.fetch_pending.side_effect = [[_make_event(1), _make_event(2), _make_event(3)], []]
+    mock_repository.wait_for_event.side_effect = lambda *args: stop_event.set()
+
+    worker = OutboxWorker(
+        batch_size=10,
+        poll_interval=1.0,
+        max_parallel=1,
+        handlers={"order.created": handler},
+        repository=mock_repository,
+        stop_event=stop_event,
+    )
+    assert worker.executor is None
+
+    worker.run_loop()
 
-    # Should mark both events as success
-    assert mock_repository.mark_success.call_count == 2
+    assert seen == [(1, calling_thread), (2, calling_thread), (3, calling_thread)]
+    # Both outcomes go out in a single round trip
+    mock_repository.mark_many.assert_called_once_with([1, 3], [2])
+    mock_repository.flush.assert_called_once()